@@ -5,6 +5,8 @@ Make sure to mark all imports as ``as`` imports,
 so mypy's ``implicit_reexport`` rule will be happy.
 """
 
+from classes._bundle import TypeClassBundle as TypeClassBundle
+from classes._catalog import catalog as catalog
 from classes._typeclass import AssociatedType as AssociatedType
 from classes._typeclass import Supports as Supports
 from classes._typeclass import typeclass as typeclass
@@ -0,0 +1,92 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from typing_extensions import final
+
+from classes._registry import TypeRegistry
+
+#: Registry items in the order we check them.
+ScanOrder = Tuple[Tuple[type, Callable], ...]
+
+
+@final
+class AdaptiveOrder(object):
+    """
+    Orders delegates and protocols by how often they are matched.
+
+    Every ``interval`` hits we reorder both scan orders:
+    the most frequent matches go first.
+    Then all counts are halved, so the order can follow workload changes.
+
+    Registries are never changed, we only keep our own ordered copies.
+    They are rebuilt when a typeclass changes its version,
+    collected hits are kept.
+
+    We don't use any locks here: lost increments only make
+    our heuristic a bit less precise, and new orders are always
+    assigned as a whole.
+    """
+
+    __slots__ = (
+        'interval',
+        'delegates',
+        'protocols',
+        'version',
+        '_hits',
+        '_until_reorder',
+    )
+
+    def __init__(self, interval: int) -> None:
+        """Creates an order that is changed every ``interval`` hits."""
+        if interval < 1:
+            raise ValueError('Reorder interval must be a positive number')
+        self.interval = interval
+        self.delegates: ScanOrder = ()
+        self.protocols: ScanOrder = ()
+        self.version: Optional[int] = None
+        self._hits: Dict[type, int] = {}
+        self._until_reorder = interval
+
+    def refresh(
+        self,
+        delegates: TypeRegistry,
+        protocols: TypeRegistry,
+        version: int,
+    ) -> None:
+        """Rebuilds scan orders when registries are changed."""
+        if self.version != version:
+            self.delegates = self._ordered(delegates.items())
+            self.protocols = self._ordered(protocols.items())
+            self.version = version
+
+    def match(self, scan_order: ScanOrder, instance) -> Optional[Callable]:
+        """Finds the first matching type and records a hit for it."""
+        for matched, callback in scan_order:
+            if isinstance(instance, matched):
+                self._record(matched)
+                return callback
+        return None
+
+    def _record(self, matched: type) -> None:
+        self._hits[matched] = self._hits.get(matched, 0) + 1
+        self._until_reorder -= 1
+        if self._until_reorder > 0:
+            return
+
+        self._until_reorder = self.interval
+        self.delegates = self._ordered(self.delegates)
+        self.protocols = self._ordered(self.protocols)
+        self._hits = {
+            hit_type: hits // 2
+            for hit_type, hits in self._hits.items()
+        }
+
+    def _ordered(
+        self,
+        scan_order: Iterable[Tuple[type, Callable]],
+    ) -> ScanOrder:
+        # `sorted` is stable, so types without hits keep registration order:
+        hits = self._hits
+        return tuple(sorted(
+            scan_order,
+            key=lambda registry_item: -hits.get(registry_item[0], 0),
+        ))
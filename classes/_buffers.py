@@ -0,0 +1,33 @@
+from types import MappingProxyType
+from typing import Mapping
+
+from typing_extensions import Final
+
+#: Python types of buffer items for ``struct`` format codes.
+_FORMAT_TYPES: Final[Mapping[str, type]] = MappingProxyType({
+    **dict.fromkeys('bBhHiIlLqQnN', int),
+    **dict.fromkeys('efd', float),
+    '?': bool,
+    'c': bytes,
+    'u': str,  # `array.array('u')`
+    'w': str,  # `array.array('w')`, python3.13+
+})
+
+#: Byte order and size prefixes do not change item types.
+_FORMAT_PREFIXES: Final = '@=<>!'
+
+
+def item_type(buffer_format: str) -> type:
+    """
+    Returns python type of items in a homogeneous buffer.
+
+    It works with ``memoryview.format`` strings.
+    Raises ``TypeError`` for structured and unknown formats.
+    """
+    item_format = buffer_format.lstrip(_FORMAT_PREFIXES)
+    try:
+        return _FORMAT_TYPES[item_format]
+    except KeyError:
+        raise TypeError(
+            'Buffer format is not supported: {0!r}'.format(buffer_format),
+        ) from None
@@ -0,0 +1,114 @@
+from collections import namedtuple
+from typing import TYPE_CHECKING, Callable, Iterable, Tuple
+
+from typing_extensions import final
+
+from classes._cache import TypeCache
+
+if TYPE_CHECKING:
+    from classes._typeclass import _TypeClass  # noqa: WPS450
+
+#: Versions of all bundle typeclasses when a record was built.
+_Versions = Tuple[int, ...]
+
+
+class BundleRecord(Tuple[Callable, ...]):
+    """
+    Resolved implementations of all bundle typeclasses, in the same order.
+
+    Records are named tuples, implementations are also
+    available as attributes named after typeclasses.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, typeclass_name: str) -> Callable:
+        """Field names are only known in runtime."""
+        raise AttributeError(typeclass_name)
+
+
+@final
+class TypeClassBundle(object):
+    """
+    Resolves several typeclasses for a type at once.
+
+    Code that calls a lot of typeclasses on the same object
+    pays for a single dispatch instead of one dispatch per typeclass.
+    Records are named tuples with typeclass names as fields,
+    leading underscores are stripped from these names:
+
+    .. code:: python
+
+      >>> from classes import TypeClassBundle, typeclass
+
+      >>> @typeclass
+      ... def to_json(instance) -> str:
+      ...     '''Example typeclass.'''
+
+      >>> @to_json.instance(int)
+      ... def _to_json_int(instance: int) -> str:
+      ...     return str(instance)
+
+      >>> @typeclass
+      ... def validate(instance) -> bool:
+      ...     '''Example typeclass.'''
+
+      >>> @validate.instance(int)
+      ... def _validate_int(instance: int) -> bool:
+      ...     return instance > 0
+
+      >>> bundle = TypeClassBundle([to_json, validate])
+      >>> record = bundle.for_type(int)
+      >>> assert record.to_json(1) == '1'
+      >>> assert record.validate(1) is True
+
+    Records are cached per type and rebuilt
+    when any of the typeclasses registers new instances.
+    Typeclasses with delegates or active overrides,
+    and types that can only be matched with real instances,
+    can't be resolved ahead of time.
+    In these cases records store typeclasses themselves,
+    so calls still dispatch as usual.
+    """
+
+    __slots__ = ('_typeclasses', '_record_type', '_records')
+
+    def __init__(self, typeclasses: Iterable['_TypeClass']) -> None:
+        """Record fields are named after typeclasses."""
+        self._typeclasses = tuple(typeclasses)
+        names = [
+            typeclass._signature.__name__.lstrip('_')  # noqa: WPS437
+            for typeclass in self._typeclasses
+        ]
+        fields = namedtuple('TypeClassFields', names)  # type: ignore
+        bases = (fields, BundleRecord)
+        self._record_type = type('TypeClassRecord', bases, {'__slots__': ()})
+        self._records: TypeCache[Tuple[_Versions, BundleRecord]] = (
+            TypeCache()
+        )
+
+    def for_type(self, instance_type: type) -> BundleRecord:
+        """Returns implementations of all typeclasses for this type."""
+        for typeclass in self._typeclasses:
+            if typeclass._overrides_active:  # noqa: WPS437
+                # Overrides are context-local, we can't cache them:
+                return self._build(instance_type)
+
+        # `.restore()` brings older versions back,
+        # so we compare versions of all typeclasses, not their sum:
+        versions = tuple(
+            bundled._version  # noqa: WPS437
+            for bundled in self._typeclasses
+        )
+        cached = self._records.get(instance_type)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        record = self._build(instance_type)
+        self._records[instance_type] = (versions, record)
+        return record
+
+    def _build(self, instance_type: type) -> BundleRecord:
+        return self._record_type(*(
+            typeclass._resolve_type(instance_type)  # noqa: WPS437
+            for typeclass in self._typeclasses
+        ))
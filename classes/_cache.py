@@ -0,0 +1,110 @@
+from contextlib import suppress
+from typing import Callable, Dict, Generic, Iterator, Optional, Tuple, TypeVar
+from weakref import ref
+
+from typing_extensions import final
+
+_CachedValue = TypeVar('_CachedValue')
+
+
+@final
+class TypeCache(Generic[_CachedValue]):  # noqa: WPS214
+    """
+    Dispatch cache that does not keep types alive.
+
+    We used ``WeakKeyDictionary`` before,
+    but it creates a new weak reference on every lookup.
+    Instead, we store implementations in a regular dict keyed by type ids.
+    Each type gets a single weak reference when it is inserted,
+    its callback removes the type from the cache.
+
+    Callbacks are called when a type is deallocated,
+    before its id can be reused by any other object.
+
+    Hot paths use ``implementations`` directly, with ``id(instance_type)`` keys.
+    This dict is never replaced, it is only changed in place.
+    Other methods work with types, like a regular mapping.
+
+    We mostly store implementations here, but any values can be cached.
+    """
+
+    __slots__ = ('implementations', '_refs')
+
+    def __init__(self) -> None:
+        """Creates an empty cache."""
+        self.implementations: Dict[int, _CachedValue] = {}
+        self._refs: Dict[int, 'ref[type]'] = {}
+
+    def __contains__(self, instance_type: object) -> bool:
+        """Tells whether this type is cached."""
+        return id(instance_type) in self.implementations
+
+    def __getitem__(self, instance_type: type) -> _CachedValue:
+        """Returns cached implementation or raises ``KeyError``."""
+        try:
+            return self.implementations[id(instance_type)]
+        except KeyError:
+            raise KeyError(instance_type) from None
+
+    def __setitem__(
+        self,
+        instance_type: type,
+        implementation: _CachedValue,
+    ) -> None:
+        """Caches an implementation for a type."""
+        type_id = id(instance_type)
+        type_ref = None
+        if type_id not in self._refs:
+            # Objects without weak references support fail here,
+            # before anything is inserted:
+            type_ref = ref(
+                instance_type,
+                _remover(self.implementations, self._refs, type_id),
+            )
+
+        # We set an implementation first, and `clear` removes it last:
+        # when they run concurrently, we can only end up
+        # with an extra weak reference, which is harmless.
+        self.implementations[type_id] = implementation
+        if type_ref is not None:
+            self._refs[type_id] = type_ref
+
+    def __len__(self) -> int:
+        """Returns the number of cached types."""
+        return len(self.implementations)
+
+    def get(
+        self,
+        instance_type: type,
+        default: Optional[_CachedValue] = None,
+    ) -> Optional[_CachedValue]:
+        """Returns cached implementation or ``default``."""
+        return self.implementations.get(id(instance_type), default)
+
+    def items(  # noqa: WPS110
+        self,
+    ) -> Iterator[Tuple[type, _CachedValue]]:
+        """Iterates over alive cached types and their implementations."""
+        for type_id, implementation in list(self.implementations.items()):
+            type_ref = self._refs.get(type_id)
+            instance_type = None if type_ref is None else type_ref()
+            if instance_type is not None:
+                yield instance_type, implementation
+
+    def clear(self) -> None:
+        """Removes all types, their weak references are dropped as well."""
+        self._refs.clear()
+        self.implementations.clear()
+
+
+def _remover(
+    implementations: Dict[int, _CachedValue],
+    refs: Dict[int, 'ref[type]'],
+    type_id: int,
+) -> Callable[['ref[type]'], None]:
+    # We don't reference the cache itself, only its dicts:
+    def factory(type_ref: 'ref[type]') -> None:
+        refs.pop(type_id, None)
+        with suppress(KeyError):  # the cache can be cleared concurrently
+            del implementations[type_id]  # noqa: WPS420
+    return factory
@@ -0,0 +1,265 @@
+import json
+from os import PathLike
+from typing import (  # noqa: WPS235
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from typing_extensions import final
+
+from classes._lazy import import_types, type_import_path
+from classes._manifest import Manifest, find_problems, read_manifest
+from classes._mro import linearizations
+
+if TYPE_CHECKING:
+    from classes._snapshots import TypeClassSnapshot
+    from classes._typeclass import _TypeClass  # noqa: WPS450
+
+
+@final
+class TypeClassStats(NamedTuple):
+    """Sizes of typeclass registries and its dispatch cache."""
+
+    delegates: int
+    exact_types: int
+    protocols: int
+    cached_types: int
+
+
+@final
+class TypeClassRegistries(NamedTuple):
+    """All types that are registered in a typeclass."""
+
+    delegates: Tuple[type, ...]
+    exact_types: Tuple[type, ...]
+    protocols: Tuple[type, ...]
+
+
+def typeclass_fullname(typeclass: '_TypeClass') -> str:
+    """Returns full name of a typeclass, like ``app.module.to_json``."""
+    signature = typeclass._signature  # noqa: WPS437
+    return '{0}.{1}'.format(signature.__module__, signature.__qualname__)
+
+
+@final
+class Catalog(object):  # noqa: WPS214
+    """
+    Process-wide catalog of all typeclasses.
+
+    It does not keep typeclasses alive, we only store weak references.
+    Use it to manage all typeclasses at once,
+    for example, to warm up dispatch caches before forking workers:
+
+    .. code:: python
+
+      >>> from classes import catalog, typeclass
+
+      >>> @typeclass
+      ... def example(instance) -> str:
+      ...     '''Example typeclass.'''
+
+      >>> @example.instance(int)
+      ... def _example_int(instance: int) -> str:
+      ...     return 'int'
+
+      >>> assert example in catalog.typeclasses()
+      >>> catalog.warm([int, str])
+      >>> assert catalog.stats()[
+      ...     '{0}.example'.format(__name__)
+      ... ].cached_types == 2
+
+    """
+
+    __slots__ = ('_typeclasses', '_associated_types')
+
+    def __init__(self) -> None:
+        """We start with an empty catalog."""
+        self._typeclasses: 'WeakSet[_TypeClass]' = WeakSet()
+        # Typeclasses reference their associated types,
+        # so we can only store weak references to typeclasses as values:
+        self._associated_types: (
+            'WeakKeyDictionary[type, ref[_TypeClass]]'
+        ) = WeakKeyDictionary()
+
+    def add(self, typeclass: '_TypeClass') -> None:
+        """Adds new typeclass, it is called on every typeclass creation."""
+        self._typeclasses.add(typeclass)
+        associated_type = typeclass._associated_type  # noqa: WPS437
+        if associated_type is not None:
+            self._associated_types[associated_type] = ref(typeclass)
+
+    def find_by_associated_type(
+        self,
+        associated_type: type,
+    ) -> Optional['_TypeClass']:
+        """Returns a typeclass defined with this associated type."""
+        typeclass_ref = self._associated_types.get(associated_type)
+        return None if typeclass_ref is None else typeclass_ref()
+
+    def typeclasses(self) -> List['_TypeClass']:
+        """Returns all typeclasses that are alive."""
+        return list(self._typeclasses)
+
+    def warm(self, types: Iterable[type]) -> None:
+        """Resolves and caches given types in all typeclasses."""
+        warmed_types = tuple(types)
+        for typeclass in self.typeclasses():
+            typeclass.warm(warmed_types)
+
+    def save_types(self, path: Union[str, 'PathLike[str]']) -> None:
+        """
+        Writes types from dispatch caches of all typeclasses to a file.
+
+        Dispatch caches already have all types that were seen,
+        so recording them does not slow down any calls.
+        Save them from a warm process, like a worker on shutdown,
+        and use ``.warm_from_file()`` on the next start.
+        Local types are skipped, because they can't be imported.
+        """
+        recorded: Dict[str, Set[str]] = {}
+        for typeclass in self.typeclasses():
+            recorded.setdefault(typeclass_fullname(typeclass), set()).update(
+                filter(None, map(type_import_path, typeclass.dispatch_table())),
+            )
+
+        with open(path, 'w', encoding='utf8') as recorded_file:
+            json.dump(
+                {
+                    fullname: sorted(type_paths)
+                    for fullname, type_paths in recorded.items()
+                    if type_paths
+                },
+                recorded_file,
+                sort_keys=True,
+            )
+
+    def warm_from_file(
+        self,
+        path: Union[str, 'PathLike[str]'],
+    ) -> List[str]:
+        """
+        Warms all typeclasses with types saved by ``.save_types()``.
+
+        Types that can't be imported anymore are skipped,
+        so are typeclasses that do not exist.
+        Returns import paths of skipped types.
+        """
+        with open(path, encoding='utf8') as recorded_file:
+            recorded: Dict[str, List[str]] = json.load(recorded_file)
+
+        imported: Dict[str, Optional[type]] = {}
+        for typeclass in self.typeclasses():
+            typeclass.warm(import_types(
+                recorded.get(typeclass_fullname(typeclass), []),
+                imported,
+            ))
+        return sorted(
+            type_path
+            for type_path in imported
+            if imported[type_path] is None
+        )
+
+    def warm_from_manifest(
+        self,
+        path: Union[str, 'PathLike[str]'],
+    ) -> List[str]:
+        """
+        Checks registries against a manifest of our ``mypy`` plugin.
+
+        The manifest has all instance types that ``mypy`` has checked.
+        When some of them are not registered in runtime,
+        for example, because their module was never imported,
+        calls with these types would fail.
+        Returns descriptions of all these problems.
+
+        Exact types from the manifest are warmed right away.
+        """
+        return list(self._check_manifest(read_manifest(path)))
+
+    def snapshot(self) -> 'WeakKeyDictionary[_TypeClass, TypeClassSnapshot]':
+        """
+        Saves instances and caches of all typeclasses.
+
+        Snapshots do not keep typeclasses alive.
+        """
+        return WeakKeyDictionary(
+            (typeclass, typeclass.snapshot())
+            for typeclass in self.typeclasses()
+        )
+
+    def restore(
+        self,
+        snapshots: 'WeakKeyDictionary[_TypeClass, TypeClassSnapshot]',
+    ) -> None:
+        """
+        Restores all typeclasses saved with ``.snapshot()``.
+
+        Typeclasses that were created after the snapshot are not changed.
+        """
+        for typeclass, snapshot in list(snapshots.items()):
+            typeclass.restore(snapshot)
+
+    def clear_caches(self) -> None:
+        """Clears dispatch caches of all typeclasses and composed ``mro``."""
+        for typeclass in self.typeclasses():
+            # Snapshots can use old caches, so we don't clear them in place:
+            typeclass._reset_caches()  # noqa: WPS437
+        linearizations.clear()
+
+    def stats(self) -> Dict[str, TypeClassStats]:
+        """Returns registry and cache sizes of all typeclasses."""
+        stats: Dict[str, TypeClassStats] = {}
+        for typeclass in self.typeclasses():
+            registries = _registered_types(typeclass)
+            stats[typeclass_fullname(typeclass)] = TypeClassStats(
+                delegates=len(registries.delegates),
+                exact_types=len(registries.exact_types),
+                protocols=len(registries.protocols),
+                cached_types=len(typeclass.dispatch_table()),
+            )
+        return stats
+
+    def registries(self) -> Dict[str, TypeClassRegistries]:
+        """Returns all registered types of all typeclasses."""
+        return {
+            typeclass_fullname(typeclass): _registered_types(typeclass)
+            for typeclass in self.typeclasses()
+        }
+
+    def _check_manifest(self, manifest: Manifest) -> Iterator[str]:
+        typeclasses = {
+            typeclass_fullname(typeclass): typeclass
+            for typeclass in self.typeclasses()
+        }
+        imported: Dict[str, Optional[type]] = {}
+        for fullname, kinds in sorted(manifest.items()):
+            typeclass = typeclasses.get(fullname)
+            if typeclass is None:
+                yield '{0}: typeclass is not loaded'.format(fullname)
+                continue
+
+            yield from find_problems(typeclass, fullname, kinds, imported)
+            typeclass.warm(
+                import_types(kinds.get('exact_types', []), imported),
+            )
+
+
+def _registered_types(typeclass: '_TypeClass') -> TypeClassRegistries:
+    return TypeClassRegistries(
+        delegates=tuple(typeclass._delegates),  # noqa: WPS437
+        exact_types=tuple(typeclass._exact_types),  # noqa: WPS437
+        protocols=tuple(typeclass._protocols),  # noqa: WPS437
+    )
+
+
+#: Global catalog of all typeclasses.
+catalog = Catalog()
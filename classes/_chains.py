@@ -0,0 +1,32 @@
+from typing import Callable, List, Tuple
+
+from classes._mro import linearizations
+from classes._registry import TypeRegistry, default_implementation
+
+
+def next_implementations(
+    instance,
+    instance_type: type,
+    exact_types: TypeRegistry,
+    protocols: TypeRegistry,
+) -> TypeRegistry:
+    """
+    Maps each matched type to the implementation that goes after it.
+
+    The chain has exact types from the ``mro`` of ``instance_type`` first,
+    then matched protocols, and then ``default_implementation``.
+    This way we can go up the chain with a single lookup.
+    """
+    chain: List[Tuple[type, Callable]] = [
+        (typ, exact_types[typ])
+        for typ in linearizations.compose(instance_type, exact_types)
+        if typ in exact_types
+    ]
+    chain.extend(
+        (typ, callback)
+        for typ, callback in protocols.items()
+        if isinstance(instance, typ)
+    )
+    next_callbacks = [callback for _, callback in chain[1:]]
+    next_callbacks.append(default_implementation)
+    return dict(zip((typ for typ, _ in chain), next_callbacks))
@@ -0,0 +1,167 @@
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    cast,
+    get_type_hints,
+)
+
+from typing_extensions import final
+
+from classes._plans import field_names
+
+if TYPE_CHECKING:
+    from classes._typeclass import _TypeClass  # noqa: WPS450
+
+#: Merges results of all fields of a derived instance.
+Combine = Callable[[Dict[str, object]], object]
+
+#: Declared field type and its implementation, both are missing when unknown.
+_ResolvedType = Tuple[Optional[type], Optional[Callable]]
+
+_WALKER_TEMPLATE = """
+def wrapper(instance, *args, **kwargs):
+    if plan.version != typeclass._version or typeclass._overrides_active:
+        plan.refresh()
+    resolved = plan.resolved
+{fields}
+    return {result}
+"""
+
+_FIELD_TEMPLATE = """
+    value_{index} = instance.{name}
+    result_{index} = (
+        resolved[{impl_index}]
+        if type(value_{index}) is resolved[{type_index}]
+        else resolve(value_{index})
+    )(value_{index}, *args, **kwargs)
+"""
+
+
+@final
+class DerivedPlan(object):
+    """
+    Implementations of field types for a derived instance.
+
+    We resolve declared field types ahead of time.
+    Values of exactly these types use the resolved implementations,
+    all other values are dispatched as usual.
+
+    ``resolved`` is a flat tuple of field types and implementations.
+    It is always replaced as a whole, so it is safe to use in threads.
+    """
+
+    __slots__ = ('field_types', 'version', 'resolved', '_typeclass')
+
+    def __init__(
+        self,
+        typeclass: '_TypeClass',
+        field_types: Tuple[Optional[type], ...],
+    ) -> None:
+        """Creates a plan that is resolved on the first call."""
+        self.field_types = field_types
+        self.version: Optional[int] = None
+        self.resolved: Tuple[object, ...] = (None, None) * len(field_types)
+        self._typeclass = typeclass
+
+    def refresh(self) -> None:
+        """Resolves all field types again."""
+        typeclass = self._typeclass
+        delegated = typeclass._has_delegates  # noqa: WPS437
+        # Delegates depend on values and overrides on contexts,
+        # we can't resolve them ahead of time:
+        if delegated or typeclass._overrides_active:  # noqa: WPS437
+            self.resolved = (None, None) * len(self.field_types)
+            self.version = None
+            return
+
+        version = typeclass._version  # noqa: WPS437
+        self.resolved = tuple(chain.from_iterable(
+            _resolve_types(typeclass, self.field_types),
+        ))
+        self.version = version
+
+
+def build_walker(
+    typeclass: '_TypeClass',
+    derived_type: type,
+    combine: Optional[Combine],
+) -> Callable:
+    """Generates an instance that walks all fields of a class."""
+    names = field_names(derived_type)
+    declared_types = _declared_types(derived_type)
+    namespace: Dict[str, object] = {
+        'plan': DerivedPlan(
+            typeclass,
+            tuple(declared_types.get(name) for name in names),
+        ),
+        'typeclass': typeclass,
+        'resolve': typeclass._resolve,  # noqa: WPS437
+        'combine': combine,
+    }
+    exec(  # noqa: S102, WPS421
+        _walker_source(names, has_combine=combine is not None),
+        namespace,
+    )
+
+    walker = cast(Callable, namespace['wrapper'])
+    walker.__name__ = 'derived_{0}'.format(derived_type.__name__)
+    walker.__qualname__ = '<derived {0} for {1}>'.format(
+        typeclass._signature.__qualname__,  # noqa: WPS437
+        derived_type.__qualname__,
+    )
+    walker.__module__ = derived_type.__module__
+    return walker
+
+
+def _walker_source(names: Tuple[str, ...], *, has_combine: bool) -> str:
+    fields_source = ''.join(
+        _FIELD_TEMPLATE.format(
+            index=index,
+            name=name,
+            type_index=index * 2,
+            impl_index=index * 2 + 1,
+        )
+        for index, name in enumerate(names)
+    )
+    fields_dict = '{{{0}}}'.format(', '.join(
+        '{0!r}: result_{1}'.format(name, index)
+        for index, name in enumerate(names)
+    ))
+    return _WALKER_TEMPLATE.format(
+        fields=fields_source,
+        result='combine({0})'.format(fields_dict) if has_combine else (
+            fields_dict
+        ),
+    )
+
+
+def _resolve_types(
+    typeclass: '_TypeClass',
+    field_types: Tuple[Optional[type], ...],
+) -> Iterator[_ResolvedType]:
+    for field_type in field_types:
+        implementation = None
+        if field_type is not None:
+            try:
+                implementation = typeclass._dispatch_type(  # noqa: WPS437
+                    field_type,
+                )
+            except TypeError:  # protocols with non-method members
+                implementation = None
+        yield (None if implementation is None else field_type, implementation)
+
+
+def _declared_types(derived_type: type) -> Dict[str, Optional[type]]:
+    try:
+        type_hints = get_type_hints(derived_type)
+    except Exception:  # forward references can be unresolvable
+        return {}
+    return {
+        name: type_hint if isinstance(type_hint, type) else None
+        for name, type_hint in type_hints.items()
+    }
@@ -0,0 +1,40 @@
+import sys
+from types import FunctionType
+from typing import Callable
+
+#: Timing hooks receive typeclass, implementation, dispatch and call time.
+TimingHook = Callable[[Callable, Callable, int, int], None]
+
+
+def rename_dispatcher(
+    dispatcher: Callable,
+    signature: Callable,
+) -> Callable:
+    """
+    Creates a copy of a dispatcher named after a typeclass.
+
+    All typeclasses share the same dispatching code.
+    Without new names all calls are shown as the same function
+    in ``cProfile``, ``py-spy``, ``yappi``, and other profilers.
+    Now they are shown as ``<typeclass to_json>``.
+    """
+    name = '<typeclass {0}>'.format(signature.__name__)
+    qualname = '<typeclass {0}>'.format(signature.__qualname__)
+
+    code = dispatcher.__code__
+    if sys.version_info >= (3, 8):  # pragma: no cover
+        # `python3.7` does not have `.replace()`, we only rename functions:
+        code = code.replace(co_name=name)
+    if sys.version_info >= (3, 11):  # pragma: no cover
+        code = code.replace(co_qualname=qualname)  # type: ignore
+
+    renamed = FunctionType(
+        code,
+        dispatcher.__globals__,
+        name,
+        dispatcher.__defaults__,
+        dispatcher.__closure__,
+    )
+    renamed.__qualname__ = qualname
+    renamed.__module__ = signature.__module__
+    return renamed
@@ -0,0 +1,58 @@
+from typing import Dict, Optional, Tuple
+
+from typing_extensions import final
+
+
+@final
+class EntryPointIndex(object):
+    """
+    Instances that are declared in entry points of installed packages.
+
+    Entry point names are full type names, like ``app.models.User``,
+    values are import paths of implementations.
+    We only read the metadata of installed packages on the first miss,
+    nothing is imported here.
+    """
+
+    __slots__ = ('group', '_import_paths')
+
+    def __init__(self, group: str) -> None:
+        """Index is built lazily."""
+        self.group = group
+        self._import_paths: Optional[Dict[str, str]] = None
+
+    def find(self, instance_type: type) -> Optional[Tuple[type, str]]:
+        """Finds the closest ``mro`` type that has an implementation."""
+        import_paths = self._import_paths
+        if import_paths is None:
+            import_paths = _read_entry_points(self.group)
+            self._import_paths = import_paths
+
+        for mro_type in instance_type.__mro__:
+            import_path = import_paths.get(
+                '{0}.{1}'.format(mro_type.__module__, mro_type.__qualname__),
+            )
+            if import_path is not None:
+                return mro_type, import_path
+        return None
+
+
+def _read_entry_points(group: str) -> Dict[str, str]:
+    # `importlib.metadata` is only available since python3.8,
+    # use `importlib_metadata` backport with older versions:
+    try:
+        from importlib.metadata import entry_points  # noqa: WPS433
+    except ImportError:  # pragma: no cover
+        from importlib_metadata import entry_points  # type: ignore  # noqa
+
+    # `.select()` is new in python3.10, older versions return a `dict`:
+    discovered = entry_points()
+    select = getattr(discovered, 'select', None)
+    if select is not None:
+        group_entry_points = select(group=group)
+    else:  # pragma: no cover
+        group_entry_points = discovered.get(group, ())
+    return {
+        entry_point.name: entry_point.value
+        for entry_point in group_entry_points
+    }
@@ -0,0 +1,194 @@
+from time import perf_counter_ns
+from typing import Callable, Container, List, NamedTuple, Optional, Tuple
+
+from typing_extensions import final
+
+from classes._mro import find_match, linearizations
+from classes._registry import GenericRegistry, TypeRegistry, generic_alias_of
+
+
+@final
+class DispatchStep(NamedTuple):
+    """
+    Single step of a dispatch.
+
+    ``kind`` is one of:
+    ``generic``, ``delegate``, ``cache``, ``exact_type``, ``protocol``, ``mro``.
+    """
+
+    kind: str
+    candidates: Tuple[type, ...]
+    matched: Optional[type]
+    elapsed_ns: int
+
+
+@final
+class DispatchExplanation(NamedTuple):
+    """
+    Explains how some type is dispatched.
+
+    ``implementation`` is ``None`` when nothing is matched,
+    ``cached`` tells whether regular calls take it from the cache.
+    ``error`` is a message of an error that regular calls raise instead,
+    like ambiguous dispatch between unrelated virtual bases.
+    """
+
+    instance_type: type
+    implementation: Optional[Callable]
+    cached: bool
+    steps: Tuple[DispatchStep, ...]
+    error: Optional[str] = None
+
+
+@final
+class DispatchExplainer(object):  # noqa: WPS214
+    """
+    Repeats all dispatch steps and records them.
+
+    It does not change any caches.
+    When no real instance is passed, we only work with its type:
+    delegates are skipped and protocols are checked with ``issubclass``.
+    """
+
+    __slots__ = (
+        '_instance',
+        '_instance_type',
+        '_has_instance',
+        '_steps',
+        '_error',
+    )
+
+    def __init__(self, instance_or_type) -> None:
+        """Types are explained the same way as their instances."""
+        self._instance = instance_or_type
+        self._has_instance = not isinstance(instance_or_type, type)
+        self._instance_type = (
+            type(instance_or_type) if self._has_instance else instance_or_type
+        )
+        self._steps: List[DispatchStep] = []
+        self._error: Optional[str] = None
+
+    def explain(  # noqa: WPS211
+        self,
+        delegates: TypeRegistry,
+        exact_types: TypeRegistry,
+        protocols: TypeRegistry,
+        dispatch_cache: Container[type],
+        generics: GenericRegistry,
+    ) -> DispatchExplanation:
+        """
+        Runs all dispatch steps in the same order as regular calls.
+
+        We don't stop on cache hits:
+        next steps show why this implementation was cached.
+        """
+        implementation = None
+        if self._has_instance:
+            implementation = (
+                self._match_generic(generics) or
+                self._match_delegates(delegates)
+            )
+        cached = False
+        if implementation is None:
+            started = perf_counter_ns()
+            cached = self._instance_type in dispatch_cache
+            self._record('cache', self._instance_type, cached, started)
+
+            implementation = (
+                self._match_exact_type(exact_types) or
+                self._match_protocols(protocols) or
+                self._match_mro(exact_types)
+            )
+        return DispatchExplanation(
+            instance_type=self._instance_type,
+            implementation=implementation,
+            cached=cached,
+            steps=tuple(self._steps),
+            error=self._error,
+        )
+
+    def _match_generic(self, generics: GenericRegistry) -> Optional[Callable]:
+        alias = generic_alias_of(self._instance)
+        if not generics or alias is None:
+            return None
+        started = perf_counter_ns()
+        callback = generics.get(alias)
+        self._record('generic', alias, callback is not None, started)
+        return callback
+
+    def _match_delegates(self, delegates: TypeRegistry) -> Optional[Callable]:
+        for delegate, callback in delegates.items():
+            started = perf_counter_ns()
+            is_matched = isinstance(self._instance, delegate)
+            self._record('delegate', delegate, is_matched, started)
+            if is_matched:
+                return callback
+        return None
+
+    def _match_exact_type(
+        self,
+        exact_types: TypeRegistry,
+    ) -> Optional[Callable]:
+        started = perf_counter_ns()
+        callback = exact_types.get(self._instance_type, None)
+        self._record(
+            'exact_type',
+            self._instance_type,
+            callback is not None,
+            started,
+        )
+        return callback
+
+    def _match_protocols(self, protocols: TypeRegistry) -> Optional[Callable]:
+        for protocol, callback in protocols.items():
+            started = perf_counter_ns()
+            is_matched = self._is_protocol_matched(protocol)
+            self._record('protocol', protocol, is_matched, started)
+            if is_matched:
+                return callback
+        return None
+
+    def _match_mro(self, exact_types: TypeRegistry) -> Optional[Callable]:
+        started = perf_counter_ns()
+        candidates = tuple(
+            mro_type
+            for mro_type in linearizations.compose(
+                self._instance_type,
+                exact_types,
+            )
+            if mro_type in exact_types
+        )
+        try:
+            match = find_match(self._instance_type, exact_types)
+        except RuntimeError as exc:  # the same error as in regular calls
+            match = None
+            self._error = str(exc)
+        self._steps.append(DispatchStep(
+            kind='mro',
+            candidates=candidates,
+            matched=match,
+            elapsed_ns=perf_counter_ns() - started,
+        ))
+        return None if match is None else exact_types[match]
+
+    def _is_protocol_matched(self, protocol: type) -> bool:
+        if self._has_instance:
+            return isinstance(self._instance, protocol)
+        try:
+            return issubclass(self._instance_type, protocol)
+        except TypeError:  # protocols with non-method members
+            return False
+
+    def _record(
+        self,
+        kind: str,
+        candidate: type,
+        is_matched: bool,
+        started: int,
+    ) -> None:
+        self._steps.append(DispatchStep(
+            kind=kind,
+            candidates=(candidate,),
+            matched=candidate if is_matched else None,
+            elapsed_ns=perf_counter_ns() - started,
+        ))
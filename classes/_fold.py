@@ -0,0 +1,32 @@
+from typing import Callable, Generator, Optional, Tuple
+
+#: Result of a call and an exception raised by it.
+Outcome = Tuple[object, Optional[Exception]]
+
+
+def resume(generator: Generator, outcome: Outcome) -> Tuple[bool, Outcome]:
+    """
+    Sends a child result into a parent generator or throws a child error.
+
+    Returns whether the generator has finished together with its outcome.
+    Unfinished generators give us their next child as a result.
+    """
+    child_result, child_error = outcome
+    try:
+        if child_error is None:
+            child = generator.send(child_result)
+        else:
+            child = generator.throw(child_error)
+    except StopIteration as finished:
+        return True, (finished.value, None)
+    except Exception as exc:
+        return True, (None, exc)
+    return False, (child, None)
+
+
+def call_child(resolve: Callable, child, args, kwargs) -> Outcome:
+    """Calls an instance for a child, errors are passed to its parent."""
+    try:
+        return resolve(child)(child, *args, **kwargs), None
+    except Exception as exc:
+        return None, exc
@@ -0,0 +1,113 @@
+from importlib import import_module
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from typing_extensions import final
+
+
+def split_import_path(import_path: str) -> Tuple[str, str]:
+    """
+    Splits ``module:name`` or ``module.name`` path into two parts.
+
+    Nested names like ``module:Class.method`` are also supported.
+    """
+    module_name, separator, qualname = import_path.partition(':')
+    if not separator:
+        module_name, _, qualname = import_path.rpartition('.')
+    if not module_name or not qualname:
+        raise ValueError(
+            'Invalid implementation import path: {0}'.format(import_path),
+        )
+    return module_name, qualname
+
+
+def import_string(import_path: str) -> Callable:
+    """Imports an object by its path."""
+    module_name, qualname = split_import_path(import_path)
+    imported: object = import_module(module_name)
+    for attribute in qualname.split('.'):
+        imported = getattr(imported, attribute)
+    if not callable(imported):
+        raise TypeError('{0} is not callable'.format(import_path))
+    return imported
+
+
+def type_import_path(instance_type: type) -> Optional[str]:
+    """Returns ``module:qualname`` path, ``None`` for local types."""
+    if '<locals>' in instance_type.__qualname__:
+        return None
+    return '{0}:{1}'.format(
+        instance_type.__module__,
+        instance_type.__qualname__,
+    )
+
+
+def import_type(
+    type_path: str,
+    imported: Dict[str, Optional[type]],
+) -> Optional[type]:
+    """
+    Imports a type by its path, ``None`` when it can't be imported.
+
+    Results are stored in ``imported``, so each path is imported once.
+    """
+    if type_path not in imported:
+        try:
+            instance_type = import_string(type_path)
+        except Exception:  # modules can raise anything on import
+            instance_type = None
+        # Aliases like `typing.Sized` are stored by their origins:
+        instance_type = getattr(instance_type, '__origin__', instance_type)
+        imported[type_path] = (
+            instance_type if isinstance(instance_type, type) else None
+        )
+    return imported[type_path]
+
+
+def import_types(
+    type_paths: Iterable[str],
+    imported: Dict[str, Optional[type]],
+) -> Iterator[type]:
+    """Imports types by their paths, skips the ones that can't be imported."""
+    for type_path in type_paths:
+        instance_type = import_type(type_path, imported)
+        if instance_type is not None:
+            yield instance_type
+
+
+@final
+class LazyImplementation(object):
+    """
+    Implementation that is imported on its first call.
+
+    After the import, ``on_load`` callback is called,
+    so the typeclass can replace this object with the real implementation
+    in its registries and dispatch cache.
+    """
+
+    __slots__ = ('import_path', '_on_load', '_implementation')
+
+    def __init__(
+        self,
+        import_path: str,
+        on_load: Callable[['LazyImplementation', Callable], None],
+    ) -> None:
+        """We only validate the import path here, nothing is imported."""
+        split_import_path(import_path)
+        self.import_path = import_path
+        self._on_load = on_load
+        self._implementation: Optional[Callable] = None
+
+    def __call__(self, instance, *args, **kwargs):
+        """Imports and calls the real implementation."""
+        return self.load()(instance, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        """Lazy implementations are shown with their import paths."""
+        return '<lazy implementation "{0}">'.format(self.import_path)
+
+    def load(self) -> Callable:
+        """Imports the real implementation, only once."""
+        if self._implementation is None:
+            self._implementation = import_string(self.import_path)
+            self._on_load(self, self._implementation)
+        return self._implementation
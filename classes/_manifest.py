@@ -0,0 +1,58 @@
+import json
+from os import PathLike
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Union
+
+from classes._lazy import import_type
+
+if TYPE_CHECKING:
+    from classes._typeclass import _TypeClass  # noqa: WPS450
+
+#: Instance types of typeclasses by their full names and registry kinds.
+Manifest = Dict[str, Dict[str, List[str]]]
+
+
+def read_manifest(path: Union[str, 'PathLike[str]']) -> Manifest:
+    """Reads a manifest written by our ``mypy`` plugin."""
+    manifest: Manifest = {}
+    with open(path, encoding='utf8') as manifest_file:
+        for fullname, kind, type_path in map(json.loads, manifest_file):
+            manifest.setdefault(fullname, {}).setdefault(
+                kind, [],
+            ).append(type_path)
+    return manifest
+
+
+def find_problems(
+    typeclass: '_TypeClass',
+    fullname: str,
+    kinds: Dict[str, List[str]],
+    imported: Dict[str, Optional[type]],
+) -> Iterator[str]:
+    """Yields manifest types that are not registered in a typeclass."""
+    for kind, type_paths in sorted(kinds.items()):
+        registered = _registered(typeclass, kind)
+        for type_path in sorted(type_paths):
+            instance_type = import_type(type_path, imported)
+            if instance_type is None:
+                yield '{0}: {1} can not be imported'.format(
+                    fullname, type_path,
+                )
+            elif instance_type not in registered:
+                yield '{0}: {1} is not registered in {2}'.format(
+                    fullname, type_path, kind,
+                )
+
+
+def _registered(typeclass: '_TypeClass', kind: str) -> Set[object]:
+    registries = {
+        'exact_types': typeclass._exact_types,  # noqa: WPS437
+        'protocols': typeclass._protocols,  # noqa: WPS437
+        'delegates': [
+            *typeclass._delegates,  # noqa: WPS437
+            *typeclass._generics,  # noqa: WPS437
+        ],
+    }
+    return {
+        getattr(typ, '__origin__', typ)
+        for typ in registries.get(kind, ())
+    }
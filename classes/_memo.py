@@ -0,0 +1,189 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Tuple, Union
+from weakref import ref
+
+from typing_extensions import Final, Literal, final
+
+#: Default size of LRU caches, the same as in `functools.lru_cache`.
+DEFAULT_MAXSIZE: Final = 128
+
+#: Values of `memoize` argument in `.instance()` method.
+MemoizeOption = Union[bool, int, Literal['weak'], None]
+
+#: Marks missing values, because `None` can be a result.
+_missing: Final = object()
+
+#: Weak reference to an instance and its results for different arguments.
+_WeakEntry = Tuple['ref[object]', Dict[Hashable, object]]
+
+
+@final
+class MemoStats(NamedTuple):
+    """Statistics of a memoized instance."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+@final
+class MemoizedImplementation(object):  # noqa: WPS214
+    """
+    Caches results of a pure instance.
+
+    There are two modes:
+
+    - bounded LRU cache keyed by instance and all other arguments,
+      only hashable instances are cached
+    - weak cache keyed by instance identity and all other arguments,
+      only instances that support weak references are cached,
+      their results are removed when they die
+
+    Other instances are always passed to the implementation directly.
+    Caches are cleared when typeclass registries are changed.
+    """
+
+    __slots__ = (
+        'implementation',
+        'maxsize',
+        '_lru',
+        '_weak',
+        '_lock',
+        '_hits',
+        '_misses',
+        '_evictions',
+        '__weakref__',
+    )
+
+    def __init__(self, implementation: Callable, memoize: MemoizeOption):
+        """Creates an empty cache for the given ``memoize`` option."""
+        self.implementation = implementation
+        self.maxsize = _maxsize(memoize)
+        self._lru: 'OrderedDict[Hashable, object]' = OrderedDict()
+        self._weak: Dict[int, _WeakEntry] = {}
+        # Weak reference callbacks can be called by `gc`
+        # in the same thread, while we hold the lock:
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, instance, *args, **kwargs):
+        """Returns cached result or calls the implementation."""
+        arguments_key = (args, tuple(sorted(kwargs.items())))
+        try:
+            cached = self._lookup(instance, arguments_key)
+        except TypeError:  # unhashable or not weak referenceable values
+            return self.implementation(instance, *args, **kwargs)
+        if cached is not _missing:
+            return cached
+
+        # Pure functions can be called concurrently,
+        # so we don't hold the lock here:
+        call_result = self.implementation(instance, *args, **kwargs)
+        with self._lock:
+            if self.maxsize is None:
+                self._store_weak(instance, arguments_key, call_result)
+            else:
+                self._store_lru(instance, arguments_key, call_result)
+        return call_result
+
+    def __repr__(self) -> str:
+        """Shows what implementation is memoized."""
+        return '<memoized {0!r}>'.format(self.implementation)
+
+    def stats(self) -> MemoStats:
+        """Returns cache statistics."""
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._lru) + sum(
+                    len(instance_results)
+                    for _, instance_results in self._weak.values()
+                ),
+            )
+
+    def clear(self) -> None:
+        """Removes all cached results, statistics are kept."""
+        with self._lock:
+            self._lru.clear()
+            self._weak.clear()
+
+    def _lookup(self, instance, arguments_key: Hashable):
+        with self._lock:
+            if self.maxsize is None:
+                ref(instance)  # raises `TypeError` when not supported
+                hash(arguments_key)  # noqa: WPS428
+                weak_entry = self._weak.get(id(instance))
+                cached = _missing if weak_entry is None else weak_entry[1].get(
+                    arguments_key, _missing,
+                )
+            else:
+                lru_key = (type(instance), instance, arguments_key)
+                cached = self._lru.get(lru_key, _missing)
+                if cached is not _missing:
+                    self._lru.move_to_end(lru_key)
+
+            if cached is _missing:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return cached
+
+    def _store_lru(self, instance, arguments_key: Hashable, call_result):
+        self._lru[(type(instance), instance, arguments_key)] = call_result
+        if len(self._lru) > self.maxsize:  # type: ignore
+            self._lru.popitem(last=False)
+            self._evictions += 1
+
+    def _store_weak(self, instance, arguments_key: Hashable, call_result):
+        weak_entry = self._weak.get(id(instance))
+        if weak_entry is None:
+            # The callback is called before this id can be reused:
+            weak_entry = (ref(instance, _remover(self, id(instance))), {})
+            self._weak[id(instance)] = weak_entry
+        weak_entry[1][arguments_key] = call_result
+
+    def _remove(self, instance_id: int) -> None:
+        with self._lock:
+            weak_entry = self._weak.pop(instance_id, None)
+            if weak_entry is not None:  # it can be cleared already
+                self._evictions += len(weak_entry[1])
+
+
+def memoize_implementation(
+    implementation: Callable,
+    memoize: MemoizeOption,
+) -> Callable:
+    """Wraps an implementation when ``memoize`` option is enabled."""
+    if memoize is None or memoize is False:
+        return implementation
+    return MemoizedImplementation(implementation, memoize)
+
+
+def _maxsize(memoize: MemoizeOption) -> Optional[int]:
+    if memoize == 'weak':
+        return None
+    elif memoize is True:
+        return DEFAULT_MAXSIZE
+    elif isinstance(memoize, int) and memoize > 0:
+        return memoize
+    raise ValueError('Invalid memoize option: {0!r}'.format(memoize))
+
+
+def _remover(
+    memoized: MemoizedImplementation,
+    instance_id: int,
+) -> Callable[['ref[object]'], None]:
+    # We don't want to keep memoized implementations alive:
+    memoized_ref = ref(memoized)
+
+    def factory(instance_ref: 'ref[object]') -> None:
+        memoized_alive = memoized_ref()
+        if memoized_alive is not None:
+            memoized_alive._remove(instance_id)  # noqa: WPS437
+    return factory
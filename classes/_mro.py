@@ -0,0 +1,153 @@
+import types
+from abc import get_cache_token
+from functools import _compose_mro  # type: ignore  # noqa: WPS450
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from typing_extensions import final
+
+from classes._cache import TypeCache
+from classes._registry import TypeRegistry
+
+#: Aliases like ``list[int]`` are not classes, they exist since ``python3.9``.
+_GenericAlias = getattr(types, 'GenericAlias', ())
+
+#: Subclass counts of virtual bases and ``mro`` without the type itself.
+_Linearization = Tuple[Tuple[int, ...], Tuple[type, ...]]
+
+#: Linearizations of a type by its virtual bases.
+_Compositions = Dict[Tuple[type, ...], _Linearization]
+
+
+@final
+class Linearizations(object):
+    """
+    Composed ``mro`` of types, shared by all typeclasses.
+
+    ``functools`` composes ``mro`` with virtual ``abc`` bases
+    for every registry separately, so the same type is composed again
+    in every typeclass where it is not found.
+    Only virtual bases that are registered change the result,
+    so we cache it per type and per these bases.
+
+    ``abc`` registrations change virtual bases of any type,
+    so the whole cache is dropped when ``abc`` cache token changes.
+    New subclasses of virtual bases are used to order them,
+    so we also store their counts and compose ``mro`` again when they change.
+    """
+
+    __slots__ = ('_token', '_cache')
+
+    def __init__(self) -> None:
+        """Creates an empty cache."""
+        self._token = get_cache_token()
+        self._cache: TypeCache[_Compositions] = TypeCache()
+
+    def __len__(self) -> int:
+        """Returns the number of cached types."""
+        return len(self._cache)
+
+    def compose(
+        self,
+        instance_type: type,
+        candidates: Iterable[type],
+    ) -> Tuple[type, ...]:
+        """Works like ``functools._compose_mro``, but uses the cache."""
+        token = get_cache_token()
+        if token != self._token:
+            self.clear()
+            self._token = token
+
+        virtual_bases = _virtual_bases(instance_type, candidates)
+        subclasses = tuple(len(typ.__subclasses__()) for typ in virtual_bases)
+
+        composed = self._cache.get(instance_type)
+        if composed is None:
+            composed = {}
+            self._cache[instance_type] = composed
+        linearization = composed.get(virtual_bases)
+        if linearization is None or linearization[0] != subclasses:
+            # We don't store the type itself, so it is not kept alive:
+            linearization = (
+                subclasses,
+                tuple(_compose_mro(instance_type, virtual_bases)[1:]),
+            )
+            composed[virtual_bases] = linearization
+        return (instance_type, *linearization[1])
+
+    def clear(self) -> None:
+        """Drops all composed ``mro``."""
+        self._cache = TypeCache()
+
+
+def _virtual_bases(
+    instance_type: type,
+    candidates: Iterable[type],
+) -> Tuple[type, ...]:
+    mro = instance_type.__mro__
+    return tuple(
+        typ
+        for typ in candidates
+        if typ not in mro and
+        _is_class(typ) and
+        issubclass(instance_type, typ)
+    )
+
+
+def _is_class(typ: type) -> bool:
+    # `typing` aliases, like `Iterable`, can be registered as exact types,
+    # `functools` does not use them in `mro` as well:
+    return (
+        getattr(typ, '__mro__', None) is not None and
+        not isinstance(typ, _GenericAlias)
+    )
+
+
+#: Process-wide cache that all typeclasses use.
+linearizations = Linearizations()
+
+
+def find_implementation(
+    instance_type: type,
+    registry: TypeRegistry,
+) -> Optional[Callable]:
+    """
+    Works like ``functools._find_impl``, but uses shared linearizations.
+
+    Raises ``RuntimeError`` when the type is matched
+    by unrelated virtual bases, just like ``functools``.
+    """
+    match = find_match(instance_type, registry)
+    return None if match is None else registry[match]
+
+
+def find_match(instance_type: type, registry: TypeRegistry) -> Optional[type]:
+    """Returns the registered type that ``find_implementation`` uses."""
+    mro = linearizations.compose(instance_type, registry)
+    for index, match in enumerate(mro):
+        if match in registry:
+            _check_ambiguity(instance_type, registry, match, mro[index + 1:])
+            return match
+    return None
+
+
+def _check_ambiguity(
+    instance_type: type,
+    registry: TypeRegistry,
+    match: type,
+    next_types: Tuple[type, ...],
+) -> None:
+    # When the next registered type is an unrelated virtual base,
+    # the order between them is not defined.
+    # Only the next type is checked, just like in `functools`:
+    if not next_types or next_types[0] not in registry:
+        return
+    mro_type = next_types[0]
+    is_virtual = (
+        mro_type not in instance_type.__mro__ and
+        match not in instance_type.__mro__
+    )
+    if is_virtual and not issubclass(match, mro_type):
+        raise RuntimeError('Ambiguous dispatch: {0} or {1}'.format(
+            match,
+            mro_type,
+        ))
@@ -0,0 +1,41 @@
+from typing import Callable, Dict, Optional
+
+from typing_extensions import final
+
+from classes._registry import TypeRegistry
+
+
+@final
+class OverrideLayer(object):
+    """
+    Context-local layer of instances on top of the typeclass registry.
+
+    It has its own dispatch cache,
+    so overrides never touch the global one.
+    We store the registry version that was used to build the cache,
+    when the typeclass changes, we rebuild the merged registry lazily.
+    """
+
+    __slots__ = ('overrides', 'exact_types', 'dispatch_cache', 'version')
+
+    def __init__(
+        self,
+        overrides: TypeRegistry,
+        parent: Optional['OverrideLayer'] = None,
+    ) -> None:
+        """Nested layers inherit all overrides from their parents."""
+        self.overrides: TypeRegistry = (
+            {**parent.overrides, **overrides}
+            if parent is not None
+            else overrides
+        )
+        self.exact_types: TypeRegistry = {}
+        self.dispatch_cache: Dict[type, Callable] = {}
+        self.version: Optional[int] = None
+
+    def refresh(self, exact_types: TypeRegistry, version: int) -> None:
+        """Merges base registry with overrides, if the base one has changed."""
+        if self.version != version:
+            self.exact_types = {**exact_types, **self.overrides}
+            self.dispatch_cache.clear()
+            self.version = version
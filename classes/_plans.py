@@ -0,0 +1,46 @@
+import dataclasses
+from typing import Callable, List, Optional, Tuple
+
+from typing_extensions import final
+
+#: Last seen value type of a field and its implementation.
+ResolvedField = Optional[Tuple[type, Callable]]
+
+
+def field_names(instance_type: type) -> Tuple[str, ...]:
+    """Returns field names of dataclasses and named tuples."""
+    if dataclasses.is_dataclass(instance_type):
+        return tuple(field.name for field in dataclasses.fields(instance_type))
+
+    named_fields = getattr(instance_type, '_fields', None)
+    if isinstance(named_fields, tuple) and issubclass(instance_type, tuple):
+        return named_fields
+    raise TypeError(
+        '{0} is not a dataclass or a named tuple'.format(
+            instance_type.__qualname__,
+        ),
+    )
+
+
+@final
+class FieldsPlan(object):
+    """
+    Cached plan to process all fields of some composite type.
+
+    We store field names and the last seen value type of each field
+    together with its implementation.
+    Fields usually have values of the same type,
+    so we don't need to dispatch them on every call.
+
+    Plans are built for a specific registry ``version``.
+    """
+
+    __slots__ = ('names', 'version', 'resolved')
+
+    def __init__(self, names: Tuple[str, ...], version: int) -> None:
+        """Creates a plan without any resolved fields."""
+        self.names = names
+        self.version = version
+        # We store types and implementations as pairs,
+        # so concurrent calls never see mixed up values:
+        self.resolved: List[ResolvedField] = [None for _ in names]
@@ -1,9 +1,13 @@
-from typing import Callable, Dict, NoReturn, Optional, Tuple
+from typing import _GenericAlias  # type: ignore  # noqa: WPS450
+from typing import Callable, Dict, Generic, NoReturn, Optional, Tuple
 
 from typing_extensions import Final
 
 TypeRegistry = Dict[type, Callable]
 
+#: Parametrized user generics like `Box[int]` are not types.
+GenericRegistry = Dict[object, Callable]
+
 #: We use this to exclude `None` as a default value for `exact_type`.
 DefaultValue: Final = type('DefaultValueType', (object,), {})
 
@@ -23,6 +27,7 @@ def choose_registry(  # noqa: WPS211
     delegates: TypeRegistry,
     exact_types: TypeRegistry,
     protocols: TypeRegistry,
+    generics: GenericRegistry,
 ) -> Tuple[TypeRegistry, type]:
     """
     Returns the appropriate registry to store the passed type.
@@ -39,12 +44,42 @@ def choose_registry(  # noqa: WPS211
         raise ValueError(INVALID_ARGUMENTS_MSG)
 
     if _is_not_default_argument_value(delegate):
+        if is_generic_alias(delegate):
+            return generics, delegate  # type: ignore
         return delegates, delegate
     elif _is_not_default_argument_value(protocol):
         return protocols, protocol
     return exact_types, exact_type if exact_type is not None else type(None)
 
 
+def is_generic_alias(typ: object) -> bool:
+    """
+    Tells whether some type is a parametrized user generic, like ``Box[int]``.
+
+    Instances created as ``Box[int]()`` store it in ``__orig_class__``.
+    Builtin generics like ``List[int]`` are not included,
+    their instances can't store any attributes.
+    """
+    if not isinstance(typ, _GenericAlias):
+        return False
+    return Generic in getattr(typ.__origin__, '__mro__', ())
+
+
+def generic_alias_of(instance: object) -> Optional[type]:
+    """
+    Returns a generic alias that created this instance, like ``Box[int]``.
+
+    Proxies and mocks can return anything from ``__orig_class__``,
+    so we only trust aliases of the instance type.
+    """
+    alias = getattr(instance, '__orig_class__', None)
+    if not is_generic_alias(alias):
+        return None
+    if getattr(alias, '__origin__', None) not in type(instance).__mro__:
+        return None
+    return alias
+
+
 def default_implementation(instance, *args, **kwargs) -> NoReturn:
     """By default raises an exception."""
     raise NotImplementedError(
@@ -0,0 +1,87 @@
+from typing import Callable, Dict, NamedTuple, Optional, Set
+from weakref import WeakSet
+
+from typing_extensions import final
+
+from classes._cache import TypeCache
+from classes._memo import MemoizedImplementation
+from classes._registry import GenericRegistry, TypeRegistry
+
+
+@final
+class Registries(NamedTuple):
+    """All registries of a typeclass."""
+
+    delegates: TypeRegistry
+    generics: GenericRegistry
+    exact_types: TypeRegistry
+    protocols: TypeRegistry
+    vectorized: TypeRegistry
+    #: Memoized implementations from all other registries.
+    memos: Set[MemoizedImplementation]
+
+
+@final
+class Caches(NamedTuple):
+    """All caches that belong to a registry version."""
+
+    dispatch: TypeCache[Callable]
+    buffers: Dict[str, Callable]
+    generic_aliases: TypeCache[Optional[Callable]]
+    next_chains: TypeCache[TypeRegistry]
+
+
+@final
+class TypeClassSnapshot(object):
+    """
+    Saved state of a typeclass: its registries and caches.
+
+    Taking a snapshot does not copy anything.
+    Registries are shared with the typeclass until it changes them,
+    then the snapshot gets its own copies.
+    Caches are never cleared when registries are changed,
+    the typeclass creates new ones instead,
+    so we keep the warm caches that belong to our registries.
+
+    All snapshots that share the same registries also share ``owners``:
+    the typeclass uses it as its own set of snapshots after a restore,
+    so all of them get a copy when registries are changed again.
+    """
+
+    __slots__ = ('registries', 'caches', 'version', 'owners', '__weakref__')
+
+    def __init__(
+        self,
+        registries: Registries,
+        caches: Caches,
+        version: int,
+        owners: 'WeakSet[TypeClassSnapshot]',
+    ) -> None:
+        """We store the registry version together with its caches."""
+        self.registries = registries
+        self.caches = caches
+        self.version = version
+        self.owners = owners
+        owners.add(self)
+
+
+def copy_registries(registries: Registries) -> Registries:
+    """Copies all registries, implementations are not copied."""
+    return Registries(
+        delegates=dict(registries.delegates),
+        generics=dict(registries.generics),
+        exact_types=dict(registries.exact_types),
+        protocols=dict(registries.protocols),
+        vectorized=dict(registries.vectorized),
+        memos=set(registries.memos),
+    )
+
+
+def new_caches() -> Caches:
+    """Creates empty caches for a new registry version."""
+    return Caches(
+        dispatch=TypeCache(),
+        buffers={},
+        generic_aliases=TypeCache(),
+        next_chains=TypeCache(),
+    )
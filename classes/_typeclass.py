@@ -116,27 +116,70 @@ Now, let's build a class that match this protocol and test it:
 
 See our `official docs <https://classes.readthedocs.io>`_ to learn more!
 """
-from functools import _find_impl  # type: ignore  # noqa: WPS450
-from typing import (  # noqa: WPS235
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import count
+from threading import Lock
+from time import perf_counter_ns
+from types import GeneratorType
+from typing import (  # type: ignore  # noqa: WPS235, WPS450
     TYPE_CHECKING,
     Callable,
+    Container,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
+    Mapping,
     Optional,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    _GenericAlias,
+    _type_check,
     overload,
 )
-from weakref import WeakKeyDictionary
-
-from typing_extensions import TypeGuard, final
-
+from weakref import WeakSet
+
+from typing_extensions import Final, TypeGuard, final
+
+from classes._adaptive import AdaptiveOrder
+from classes._buffers import item_type
+from classes._cache import TypeCache
+from classes._catalog import catalog, typeclass_fullname
+from classes._chains import next_implementations
+from classes._derive import Combine, build_walker
+from classes._dispatcher import TimingHook, rename_dispatcher
+from classes._entry_points import EntryPointIndex
+from classes._explain import DispatchExplainer, DispatchExplanation
+from classes._fold import Outcome, call_child, resume
+from classes._lazy import LazyImplementation
+from classes._memo import (
+    MemoizedImplementation,
+    MemoizeOption,
+    MemoStats,
+    memoize_implementation,
+)
+from classes._mro import find_implementation
+from classes._overrides import OverrideLayer
+from classes._plans import FieldsPlan, field_names
 from classes._registry import (
     DefaultValue,
+    GenericRegistry,
     TypeRegistry,
     choose_registry,
     default_implementation,
+    generic_alias_of,
+)
+from classes._snapshots import (
+    Caches,
+    Registries,
+    TypeClassSnapshot,
+    copy_registries,
+    new_caches,
 )
 
 _InstanceType = TypeVar('_InstanceType')
@@ -145,10 +188,24 @@ _AssociatedType = TypeVar('_AssociatedType')
 _Fullname = TypeVar('_Fullname', bound=str)  # Literal value
 
 _NewInstanceType = TypeVar('_NewInstanceType', bound=Type)
+_DerivedType = TypeVar('_DerivedType', bound=type)
 
 _AssociatedTypeDef = TypeVar('_AssociatedTypeDef', contravariant=True)
 _TypeClassType = TypeVar('_TypeClassType', bound='_TypeClass')
 _ReturnType = TypeVar('_ReturnType')
+_DefaultType = TypeVar('_DefaultType')
+
+#: Types and their implementations for bulk registration.
+_ImplementationsMap = Mapping[Optional[type], Union[Callable, str]]
+
+#: Every registry change gets a new unique version.
+_registry_versions: Final = count()
+
+#: Protects the counter of active overrides.
+_overrides_lock: Final = Lock()
+
+#: Variadic subscriptions are usually repeated with the same types.
+_VARIADIC_ALIASES_CACHE_SIZE: Final = 256
 
 
 @overload
@@ -228,21 +285,75 @@ class AssociatedType(Generic[_InstanceType]):
             Not-so-ugly hack to add variadic generic support in runtime.
 
             What it does?
-            It forces class-level type ``__parameters__`` count
-            and the passed one during runtime subscruption
-            to match during validation.
-
-            Then, we revert everything back.
+            It creates generic aliases directly,
+            without checking the count of type parameters.
             """
-            if not isinstance(type_params, tuple):
-                type_params = (type_params,)  # noqa: WPS434
+            return _variadic_alias(_GenericAlias, cls, type_params)
 
-            old_parameters = cls.__parameters__
-            cls.__parameters__ = type_params
-            try:  # noqa: WPS501
-                return super().__class_getitem__(type_params)
-            finally:
-                cls.__parameters__ = old_parameters
+
+class _SupportsAlias(_GenericAlias, _root=True):  # type: ignore
+    """
+    Runtime representation of ``Supports[...]`` types.
+
+    We use it for ``isinstance`` checks, answers are taken
+    from ``.supports()`` method of each associated typeclass,
+    so cached dispatch results are reused.
+    """
+
+    def __instancecheck__(self, instance) -> bool:
+        """Checks that all associated typeclasses support this instance."""
+        for associated_type in self.__args__:
+            associated = catalog.find_by_associated_type(associated_type)
+            if associated is None:
+                raise TypeError(
+                    '{0} is not associated with any typeclass'.format(
+                        associated_type,
+                    ),
+                )
+            if not associated.supports(instance):
+                return False
+        return True
+
+
+def _variadic_alias(alias_type: type, origin: type, type_params) -> type:
+    # Aliases are cached like the ones from `typing`,
+    # we don't touch any shared state, so it is thread-safe.
+    # Unhashable type params, like `Literal[[]]`, just skip the cache.
+    if not isinstance(type_params, tuple):
+        type_params = (type_params,)  # noqa: WPS434
+    try:
+        return _cached_variadic_alias(alias_type, origin, type_params)
+    except TypeError:
+        return _build_variadic_alias(alias_type, origin, type_params)
+
+
+@lru_cache(maxsize=_VARIADIC_ALIASES_CACHE_SIZE, typed=True)
+def _cached_variadic_alias(
+    alias_type: type,
+    origin: type,
+    type_params: tuple,
+) -> type:
+    return _build_variadic_alias(alias_type, origin, type_params)
+
+
+def _build_variadic_alias(
+    alias_type: type,
+    origin: type,
+    type_params: tuple,
+) -> type:
+    return alias_type(origin, tuple(
+        _type_check(type_param, 'Parameters to generic types must be types.')
+        for type_param in type_params
+    ))
+
+
+def _has_instance_attributes(instance_type: type) -> bool:
+    # Instances with `__dict__` or `__getattr__` can have protocol members
+    # that their type does not have, so `isinstance` can still match them:
+    return bool(
+        getattr(instance_type, '__dictoffset__', 1) or
+        getattr(instance_type, '__getattr__', None),
+    )
 
 
 @final
@@ -290,6 +401,18 @@ class Supports(Generic[_AssociatedTypeDef]):
       # Incompatible types in assignment
       # (expression has type "str", variable has type "Supports[ToJson]")
 
+    ``Supports`` types can also be used in ``isinstance`` checks,
+    for example, in runtime validators:
+
+    .. code:: python
+
+      >>> assert isinstance(1, Supports[ToJson])
+      >>> assert not isinstance(None, Supports[ToJson])
+
+    When multiple associated types are passed,
+    all their typeclasses must support the value.
+    Results are cached per type, just like regular calls.
+
     .. warning::
       ``Supports`` only works with typeclasses defined with associated types.
 
@@ -297,6 +420,11 @@ class Supports(Generic[_AssociatedTypeDef]):
 
     __slots__ = ()
 
+    if not TYPE_CHECKING:  # noqa: WPS604  # pragma: no cover
+        def __class_getitem__(cls, type_params) -> type:
+            """Creates a variadic alias that supports ``isinstance``."""
+            return _variadic_alias(_SupportsAlias, cls, type_params)
+
 
 @final  # noqa: WPS214
 class _TypeClass(  # noqa: WPS214
@@ -316,14 +444,38 @@ class _TypeClass(  # noqa: WPS214
 
         # Registry:
         '_delegates',
+        '_generics',
         '_exact_types',
         '_protocols',
+        '_vectorized',
+        '_memos',
+        '_entry_points',
 
         # Cache:
         '_dispatch_cache',
+        '_version',
+        '_plans',
+        '_buffer_cache',
+        '_generic_cache',
+        '_next_chains',
+
+        # Overrides:
+        '_overrides',
+        '_overrides_active',
+
+        # Snapshots that share our registries:
+        '_snapshots',
+
+        # Calls:
+        '_dispatcher',
+        '_has_delegates',
+        '_adaptive',
+
+        # We store typeclasses in a weak catalog:
+        '__weakref__',
     )
 
-    _dispatch_cache: Dict[type, Callable]
+    _overrides: 'ContextVar[Optional[OverrideLayer]]'
     _cache_token: Optional[object]
 
     def __init__(
@@ -365,11 +517,34 @@ class _TypeClass(  # noqa: WPS214
 
         # Registries:
         self._delegates: TypeRegistry = {}
+        self._generics: GenericRegistry = {}
         self._exact_types: TypeRegistry = {}
         self._protocols: TypeRegistry = {}
+        self._vectorized: TypeRegistry = {}
+        self._memos: Set[MemoizedImplementation] = set()
+        self._entry_points: Optional[EntryPointIndex] = None
 
         # Cache parts:
-        self._dispatch_cache = WeakKeyDictionary()  # type: ignore
+        self._dispatch_cache: TypeCache[Callable] = TypeCache()
+        self._version = next(_registry_versions)
+        self._plans: TypeCache[FieldsPlan] = TypeCache()
+        self._buffer_cache: Dict[str, Callable] = {}
+        self._generic_cache: TypeCache[Optional[Callable]] = TypeCache()
+        self._next_chains: TypeCache[TypeRegistry] = TypeCache()
+
+        # Overrides are context-local, we only count how many are active,
+        # so regular calls do not even touch the context variable:
+        self._overrides = ContextVar(
+            '{0}_overrides'.format(signature.__name__),
+            default=None,
+        )
+        self._overrides_active = 0
+
+        self._snapshots: 'WeakSet[TypeClassSnapshot]' = WeakSet()
+        self._dispatcher = self._build_dispatcher()
+        self._has_delegates = False
+        self._adaptive: Optional[AdaptiveOrder] = None
+        catalog.add(self)
 
     def __call__(
         self,
@@ -385,7 +560,8 @@ class _TypeClass(  # noqa: WPS214
 
         The resolution order is the following:
 
-        1. Delegates passed with ``delegate=``
+        1. Delegates passed with ``delegate=``,
+           parametrized user generics are matched first
         2. Exact types that are passed as ``.instance`` arguments
         3. Protocols that are passed with ``protocol=``
 
@@ -421,28 +597,15 @@ class _TypeClass(  # noqa: WPS214
         Take a note, that we use structural subtyping here.
         And all typeclasses that match ``Callable[[int, int], int]`` signature
         will typecheck.
-        """
-        # At first, we try all our delegate types,
-        # we don't cache it, because it is impossible.
-        # We only have runtime type info: `type([1]) == type(['a'])`.
-        # It might be slow!
-        # Don't add any delegate types unless
-        # you are absolutely know what you are doing.
-        impl = self._dispatch_delegate(instance)
-        if impl is not None:
-            return impl(instance, *args, **kwargs)
 
-        instance_type = type(instance)
+        .. rubric:: Profiling
 
-        try:
-            impl = self._dispatch_cache[instance_type]
-        except KeyError:
-            impl = self._dispatch(
-                instance,
-                instance_type,
-            ) or default_implementation
-            self._dispatch_cache[instance_type] = impl
-        return impl(instance, *args, **kwargs)
+        Each typeclass has its own dispatcher function,
+        which is named after it: ``<typeclass used>``.
+        So, profilers show each typeclass separately.
+        See :meth:`~_TypeClass.set_timing_hook` for more details.
+        """
+        return self._dispatcher(instance, *args, **kwargs)
 
     def __str__(self) -> str:
         """Converts typeclass to a string."""
@@ -508,29 +671,472 @@ class _TypeClass(  # noqa: WPS214
         # Because if some type is already in the cache,
         # it means that it is not a delegate.
         # So, this is simply faster.
+        if self._overrides_active:
+            layer = self._overrides.get()
+            if layer is not None:
+                return self._dispatch_override(
+                    layer,
+                    instance,
+                ) is not default_implementation
+
         instance_type = type(instance)
-        if instance_type in self._dispatch_cache:
+        impl = self._dispatch_cache.get(instance_type)
+        if impl is not None and impl is not default_implementation:
             return True
 
         # We never cache delegate types.
         if self._dispatch_delegate(instance) is not None:
             return True
 
+        # Cached misses are stored as `default_implementation`,
+        # they are only valid after we have checked all delegates:
+        if impl is not None:
+            return False
+
         # This only happens when we don't have a cache in place
         # and this is not a delegate type:
         impl = self._dispatch(instance, instance_type)
-        if impl is None:
-            return False
+        self._dispatch_cache[instance_type] = impl or default_implementation
+        return impl is not None
 
-        self._dispatch_cache[instance_type] = impl
-        return True
+    @overload
+    def try_call(
+        self,
+        instance,
+        *args,
+        default: _DefaultType,
+        **kwargs,
+    ) -> Union[_ReturnType, _DefaultType]:
+        """Calls a typeclass or returns the passed ``default``."""
+
+    @overload
+    def try_call(
+        self,
+        instance,
+        *args,
+        **kwargs,
+    ) -> Optional[_ReturnType]:
+        """Calls a typeclass or returns ``None``."""
+
+    def try_call(self, instance, *args, default=None, **kwargs):
+        """
+        Calls a typeclass or returns ``default`` if it is not supported.
+
+        It is the same as calling ``.supports()`` and then the typeclass,
+        but it only dispatches once.
+        And unlike catching ``NotImplementedError`` from a regular call,
+        a miss does not create any exceptions.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance, prefix: str) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(int)
+          ... def _example_int(instance: int, prefix: str) -> str:
+          ...     return prefix + str(instance)
+
+          >>> assert example.try_call(1, '#') == '#1'
+          >>> assert example.try_call('a', '#') is None
+          >>> assert example.try_call('a', '#', default='') == ''
+
+        Misses are cached the same way as regular calls,
+        so the second miss for the same type is just a cache lookup.
+        """
+        impl = self._resolve(instance)
+        if impl is default_implementation:
+            return default
+        return impl(instance, *args, **kwargs)
+
+    def call_next(
+        self,
+        after: type,
+        instance,
+        *args,
+        **kwargs,
+    ) -> _ReturnType:
+        """
+        Calls the implementation that goes after ``after`` type.
+
+        Use it to extend more general instances, like ``super()`` does.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> class MyList(list):
+          ...     ...
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(list)
+          ... def _example_list(instance: list) -> str:
+          ...     return 'list'
+
+          >>> @example.instance(MyList)
+          ... def _example_my_list(instance: MyList) -> str:
+          ...     return 'my ' + example.call_next(MyList, instance)
+
+          >>> assert example(MyList()) == 'my list'
+
+        The chain of each type has its exact types in ``mro`` order,
+        then matched protocols, and then the default implementation,
+        which raises ``NotImplementedError``.
+        Chains are cached per type, so each step is a single lookup.
+        Delegates and overrides are not included.
+        Raises ``ValueError`` when ``after`` type is not in the chain.
+        """
+        instance_type = type(instance)
+        chain = self._next_chains.get(instance_type)
+        if chain is None:
+            chain = next_implementations(
+                instance,
+                instance_type,
+                self._exact_types,
+                self._protocols,
+            )
+            self._next_chains[instance_type] = chain
+
+        try:
+            impl = chain[after]
+        except KeyError:
+            raise ValueError(
+                '{0} is not in the dispatch chain of {1}'.format(
+                    # `typing` aliases do not have `__qualname__` before 3.10:
+                    getattr(after, '__qualname__', after),
+                    instance_type.__qualname__,
+                ),
+            ) from None
+        return impl(instance, *args, **kwargs)
+
+    def warm(self, types: Iterable[type]) -> None:
+        """
+        Resolves and caches given types ahead of time.
+
+        Use it to avoid dispatch cache misses on the first calls,
+        for example, in the master process before forking workers.
+
+        .. code:: python
 
-    def instance(
+          >>> from typing import Sized
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(protocol=Sized)
+          ... def _example_sized(instance: Sized) -> str:
+          ...     return 'sized'
+
+          >>> example.warm([list, int])
+          >>> assert example.supports([]) is True
+          >>> assert example.supports(1) is False
+
+        Delegates are never cached, so they are skipped.
+        Types that can only be matched with real instances
+        are skipped as well: for example, protocols with non-method members,
+        or types which instances can match protocols by their attributes.
+        Types with ambiguous ``abc`` bases are skipped too,
+        calls with them raise ``RuntimeError`` as usual.
+        """
+        for instance_type in types:
+            if instance_type in self._dispatch_cache:
+                continue
+            try:
+                impl = self._dispatch_type(instance_type)
+            except (TypeError, RuntimeError):
+                continue
+            self._dispatch_cache[instance_type] = impl or default_implementation
+
+    def map_items(self, elements: Iterable, *args, **kwargs) -> list:
+        """
+        Calls a typeclass for each item of a container.
+
+        Use it in instances of recursive typeclasses,
+        it is much faster than calling a typeclass in a loop:
+        items are only dispatched when their type changes.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def to_json(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @to_json.instance(int)
+          ... def _to_json_int(instance: int) -> str:
+          ...     return str(instance)
+
+          >>> @to_json.instance(list)
+          ... def _to_json_list(instance: list) -> str:
+          ...     return '[{0}]'.format(', '.join(to_json.map_items(instance)))
+
+          >>> assert to_json([1, [2, 3]]) == '[1, [2, 3]]'
+
+        Delegates can match each item differently,
+        so with delegates every item is dispatched.
+        """
+        if self._has_delegates:
+            return [
+                self._resolve(element)(element, *args, **kwargs)
+                for element in elements
+            ]
+
+        mapped: list = []
+        last_type = None
+        impl = default_implementation
+        for element in elements:
+            element_type = type(element)
+            if element_type is not last_type:
+                last_type = element_type
+                impl = self._resolve(element)
+            mapped.append(impl(element, *args, **kwargs))
+        return mapped
+
+    def map_fields(self, instance, *args, **kwargs) -> Dict[str, object]:
+        """
+        Calls a typeclass for each field of a dataclass or a named tuple.
+
+        Field names are collected once per type.
+        We also remember the last value type of each field
+        together with its implementation,
+        so fields with the same value types are not dispatched again.
+
+        .. code:: python
+
+          >>> from dataclasses import dataclass
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def to_json(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @to_json.instance(int)
+          ... def _to_json_int(instance: int) -> str:
+          ...     return str(instance)
+
+          >>> @to_json.instance(str)
+          ... def _to_json_str(instance: str) -> str:
+          ...     return '"{0}"'.format(instance)
+
+          >>> @dataclass
+          ... class User(object):
+          ...     name: str
+          ...     age: int
+
+          >>> assert to_json.map_fields(User('a', 1)) == {
+          ...     'name': '"a"',
+          ...     'age': '1',
+          ... }
+
+        Plans are rebuilt when new instances are registered.
+        Raises ``TypeError`` for other types.
+        """
+        plan = self._fields_plan(type(instance))
+        mapped = {}
+        for index, field_name in enumerate(plan.names):
+            field_value = getattr(instance, field_name)
+            mapped[field_name] = self._resolve_field(
+                plan, index, field_value,
+            )(field_value, *args, **kwargs)
+        return mapped
+
+    def fold(self, instance, *args, **kwargs) -> object:
+        """
+        Calls a recursive typeclass without recursion.
+
+        Instances for containers are generators:
+        they ``yield`` children and get their results back.
+        Their ``return`` value is the result for the container itself.
+        Instances for other types are regular functions.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def depth(instance) -> int:
+          ...     '''Example typeclass.'''
+
+          >>> @depth.instance(object)
+          ... def _depth_object(instance: object) -> int:
+          ...     return 0
+
+          >>> @depth.instance(list)
+          ... def _depth_list(instance: list):
+          ...     child_depths = [0]
+          ...     for item in instance:
+          ...         child_depths.append((yield item))
+          ...     return max(child_depths) + 1
+
+          >>> nested = []
+          >>> for _ in range(10000):
+          ...     nested = [nested]
+
+          >>> assert depth.fold(nested) == 10001
+
+        We drive an explicit stack of generators,
+        so deep structures never hit the recursion limit.
+        Exceptions are raised inside parent generators,
+        just like with regular recursive calls.
+
+        Generator instances must only be called with ``.fold()``,
+        regular calls just return generator objects.
+        """
+        stack = [self._resolve(instance)(instance, *args, **kwargs)]
+        if not isinstance(stack[0], GeneratorType):
+            return stack[0]
+
+        outcome: Outcome = (None, None)
+        while stack:
+            finished, outcome = resume(stack[-1], outcome)
+            if finished:
+                stack.pop()
+                continue
+            outcome = call_child(self._resolve, outcome[0], args, kwargs)
+            if isinstance(outcome[0], GeneratorType):
+                stack.append(outcome[0])
+                outcome = (None, None)
+
+        error = outcome[1]
+        if error is not None:
+            raise error
+        return outcome[0]
+
+    @overload
+    def derive(
+        self,
+        derived_type: None = None,
+        *,
+        combine: Optional[Combine] = None,
+    ) -> Callable[[_DerivedType], _DerivedType]:
+        """Returns a class decorator."""
+
+    @overload
+    def derive(
+        self,
+        derived_type: _DerivedType,
+        *,
+        combine: Optional[Combine] = None,
+    ) -> _DerivedType:
+        """Registers an instance for a class."""
+
+    def derive(self, derived_type=None, *, combine=None):
+        """
+        Registers a generated instance for a dataclass or a named tuple.
+
+        Generated instance calls this typeclass for each field.
+        Results are returned as a dict, unless ``combine`` is passed.
+        It can be used as a function or as a class decorator.
+
+        .. code:: python
+
+          >>> from dataclasses import dataclass
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def to_json(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @to_json.instance(int)
+          ... def _to_json_int(instance: int) -> str:
+          ...     return str(instance)
+
+          >>> @to_json.instance(str)
+          ... def _to_json_str(instance: str) -> str:
+          ...     return '"{0}"'.format(instance)
+
+          >>> def to_object(fields) -> str:
+          ...     return '{{{0}}}'.format(', '.join(
+          ...         '"{0}": {1}'.format(*pair) for pair in fields.items()
+          ...     ))
+
+          >>> @to_json.derive(combine=to_object)
+          ... @dataclass
+          ... class User(object):
+          ...     name: str
+          ...     age: int
+
+          >>> assert to_json(User('a', 1)) == '{"name": "a", "age": 1}'
+
+        We generate code for each class: fields are accessed directly
+        and implementations of declared field types are resolved
+        ahead of time.
+        Values of other types are dispatched as usual.
+        Implementations are resolved again when new instances are registered.
+
+        .. note::
+
+          Our ``mypy`` plugin does not know about derived instances,
+          so ``Supports`` types do not include them.
+
+        """
+        def decorator(derived: _DerivedType) -> _DerivedType:
+            self.instance(derived, impl=build_walker(self, derived, combine))
+            return derived
+
+        if derived_type is None:
+            return decorator
+        return decorator(derived_type)
+
+    def apply_buffer(self, buffer, *args, **kwargs) -> object:
+        """
+        Calls a vectorized instance with a whole homogeneous buffer.
+
+        Buffers are ``array.array``, ``memoryview``, ``bytes``,
+        or any other objects that support the buffer protocol,
+        including ``numpy`` arrays of numbers.
+        We only dispatch once, on the type of buffer items,
+        and pass a ``memoryview`` of the buffer, nothing is copied.
+
+        .. code:: python
+
+          >>> from array import array
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def total(instance) -> float:
+          ...     '''Example typeclass.'''
+
+          >>> @total.instance(float, vectorized=sum)
+          ... def _total_float(instance: float) -> float:
+          ...     return instance
+
+          >>> assert total(1.5) == 1.5
+          >>> assert total.apply_buffer(array('d', [1.5, 2.5])) == 4.0
+
+        Vectorized instances are registered
+        with ``vectorized`` argument of ``.instance()``.
+        Item types are matched like regular exact types,
+        including base classes: ``int`` instance handles ``bool`` buffers.
+        Raises ``NotImplementedError`` when no vectorized instances match
+        and ``TypeError`` for buffers of structured items.
+        Overrides and delegates are not used here.
+        """
+        view = memoryview(buffer)
+        try:
+            implementation = self._buffer_cache[view.format]
+        except KeyError:
+            implementation = self._dispatch_buffer(view.format)
+            self._buffer_cache[view.format] = implementation
+        return implementation(view, *args, **kwargs)
+
+    def instance(  # noqa: WPS211
         self,
         exact_type: Optional[_NewInstanceType] = DefaultValue,  # type: ignore
         *,
         protocol: type = DefaultValue,
         delegate: type = DefaultValue,
+        impl: Union[Callable, str, None] = None,
+        memoize: MemoizeOption = None,
+        vectorized: Optional[Callable] = None,
     ) -> '_TypeClassInstanceDef[_NewInstanceType, _TypeClassType]':
         """
         We use this method to store implementation for each specific type.
@@ -539,9 +1145,25 @@ class _TypeClass(  # noqa: WPS214
             protocol: required when passing protocols.
             delegate: required when using delegate types, for example,
             when working with concrete generics like ``List[str]``.
+            Parametrized user generics like ``Box[int]`` are matched
+            by ``__orig_class__`` of instances created as ``Box[int]()``.
+            impl: implementation to register right away,
+            without using the decorator.
+            It can be an import path like ``'app.serializers:user_to_json'``,
+            then the module is only imported on the first dispatch
+            that resolves to this instance.
+            memoize: caches results of pure instances.
+            Pass ``True`` or a max size for a LRU cache
+            keyed by hashable instances and other arguments,
+            or ``'weak'`` for a cache keyed by instance identity,
+            its results are removed when instances die.
+            vectorized: implementation for homogeneous buffers
+            of ``exact_type`` items, see ``.apply_buffer()``.
+            It is registered right away.
 
         Returns:
             Decorator for instance handler.
+            When ``impl`` is passed, the registered implementation instead.
 
         .. note::
 
@@ -568,21 +1190,515 @@ class _TypeClass(  # noqa: WPS214
             exact_types=self._exact_types,
             protocols=self._protocols,
             delegates=self._delegates,
+            generics=self._generics,
         )
 
         # That's how we check for generics,
         # generics that look like `List[int]` or `set[T]` will fail this check,
         # because they are `_GenericAlias` instance,
-        # which raises an exception for `__isinstancecheck__`
-        isinstance(object(), typ)
+        # which raises an exception for `__isinstancecheck__`.
+        # User generics like `Box[int]` are matched by their aliases instead:
+        if registry is not self._generics:
+            isinstance(object(), typ)
+
+        if vectorized is not None:
+            self._register_vectorized(registry, typ, vectorized)
 
         def decorator(implementation):
-            registry[typ] = implementation
-            self._dispatch_cache.clear()
+            self._before_change()
+            self._register(
+                registry,
+                typ,
+                memoize_implementation(implementation, memoize),
+            )
+            self._invalidate()
             return implementation
+
+        # `decorator` is untyped, our plugin infers `.instance()` types:
+        if isinstance(impl, str):
+            return decorator(  # type: ignore
+                LazyImplementation(impl, self._load_lazy),
+            )
+        elif impl is not None:
+            return decorator(impl)  # type: ignore
         return decorator
 
-    def _dispatch(self, instance, instance_type: type) -> Optional[Callable]:
+    def register_many(
+        self,
+        exact_types: Optional[_ImplementationsMap] = None,
+        *,
+        protocols: Optional[_ImplementationsMap] = None,
+        delegates: Optional[_ImplementationsMap] = None,
+    ) -> None:
+        """
+        Registers a lot of instances at once.
+
+        It works like multiple ``.instance()`` calls with ``impl`` argument,
+        but the dispatch cache is cleared only once.
+        Use it for generated code that registers hundreds of instances.
+
+        .. code:: python
+
+          >>> from typing import Sized
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> example.register_many(
+          ...     {int: lambda instance: 'int', None: lambda instance: 'none'},
+          ...     protocols={Sized: lambda instance: 'sized'},
+          ... )
+          >>> assert example(1) == 'int'
+          >>> assert example(None) == 'none'
+          >>> assert example([]) == 'sized'
+
+        Implementations can be import paths, just like ``impl``.
+        The whole batch is validated first:
+        when some type is invalid, nothing is registered.
+
+        .. note::
+
+          Our ``mypy`` plugin does not know about instances
+          registered this way, so ``Supports`` types do not include them.
+
+        """
+        batches = (
+            (
+                self._exact_types,
+                self._prepare_batch(exact_types, is_exact=True),
+            ),
+            (
+                self._protocols,
+                self._prepare_batch(protocols, is_exact=False),
+            ),
+            (
+                self._delegates,
+                self._prepare_batch(delegates, is_exact=False),
+            ),
+        )
+        self._before_change()
+        for registry, batch in batches:
+            for typ, callback in batch.items():
+                self._register(registry, typ, callback)
+        self._invalidate()
+
+    def discover_instances(self, group: Optional[str] = None) -> None:
+        """
+        Finds missing instances in entry points of installed packages.
+
+        Packages declare their instances in an entry point group,
+        which is the full name of a typeclass by default.
+        Entry point names are full names of types,
+        values are import paths of implementations:
+
+        .. code:: toml
+
+          # pyproject.toml of a plugin package
+          [project.entry-points."app.serializers.to_json"]
+          "plugin.models.Order" = "plugin.serializers:order_to_json"
+
+        Nothing happens until some type is not found in our registries.
+        Then we read entry points of all installed packages once
+        and register the one that matches the closest type in ``mro``.
+        Just like with ``impl``, its module is imported on the first call.
+
+        .. note::
+
+          On ``python3.7`` it requires ``importlib_metadata`` package.
+
+        """
+        self._entry_points = EntryPointIndex(
+            group or typeclass_fullname(self),
+        )
+        self._invalidate()  # cached misses can have instances now
+
+    def snapshot(self) -> TypeClassSnapshot:
+        """
+        Saves all registered instances and caches of this typeclass.
+
+        Use it together with ``.restore()`` to undo registrations,
+        for example, in tests:
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> snapshot = example.snapshot()
+          >>> _ = example.instance(int, impl=str)
+          >>> assert example(1) == '1'
+
+          >>> example.restore(snapshot)
+          >>> assert not example.supports(1)
+
+        Nothing is copied here: registries are copied
+        only when they are changed after the snapshot is taken.
+        """
+        return TypeClassSnapshot(
+            Registries(
+                delegates=self._delegates,
+                generics=self._generics,
+                exact_types=self._exact_types,
+                protocols=self._protocols,
+                vectorized=self._vectorized,
+                memos=self._memos,
+            ),
+            Caches(
+                dispatch=self._dispatch_cache,
+                buffers=self._buffer_cache,
+                generic_aliases=self._generic_cache,
+                next_chains=self._next_chains,
+            ),
+            self._version,
+            self._snapshots,
+        )
+
+    def restore(self, snapshot: TypeClassSnapshot) -> None:
+        """
+        Brings back instances and caches saved with ``.snapshot()``.
+
+        Caches are restored together with registries,
+        so types that were cached before are not dispatched again.
+        It does not copy anything, a snapshot can be restored many times.
+        """
+        is_changed = (
+            snapshot.owners is not self._snapshots or
+            snapshot.caches.dispatch is not self._dispatch_cache
+        )
+        if not is_changed:
+            return
+
+        # Old registries are not used by us anymore,
+        # so snapshots that share them are safe.
+        # Snapshots that share restored registries are ours now:
+        self._snapshots = snapshot.owners
+        self._use_registries(snapshot.registries)
+        self._use_caches(snapshot.caches)
+        self._version = snapshot.version
+        self._has_delegates = bool(self._delegates or self._generics)
+        for memoized in self._memos:
+            memoized.clear()
+
+    @contextmanager
+    def override(
+        self,
+        exact_type: type,
+        implementation: Callable,
+    ) -> Iterator[None]:
+        """
+        Temporary replaces an instance in the current context only.
+
+        It works as if ``.instance(exact_type)`` was called,
+        but it does not change the registry or the global dispatch cache.
+        Other threads and ``asyncio`` tasks still see the original instances.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(int)
+          ... def _example_int(instance: int) -> str:
+          ...     return 'int'
+
+          >>> with example.override(int, lambda instance: 'override'):
+          ...     assert example(1) == 'override'
+          >>> assert example(1) == 'int'
+
+        Overrides can be nested, inner ones take priority.
+        Delegates are still checked first, like in regular calls.
+        """
+        isinstance(object(), exact_type)  # Same check as in `.instance`
+
+        token = self._overrides.set(OverrideLayer(
+            {exact_type: implementation},
+            parent=self._overrides.get(),
+        ))
+        with _overrides_lock:
+            self._overrides_active += 1
+        try:
+            yield
+        finally:
+            with _overrides_lock:
+                self._overrides_active -= 1
+            self._overrides.reset(token)
+
+    def explain(self, instance_or_type) -> DispatchExplanation:
+        """
+        Explains which instance is used for a given value and why.
+
+        It repeats all dispatch steps and records them with their timings:
+        delegates, cache lookup, exact type, protocols, and ``mro`` candidates.
+        Caches are not changed.
+
+        .. code:: python
+
+          >>> from typing import Sized
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(int)
+          ... def _example_int(instance: int) -> str:
+          ...     return 'int'
+
+          >>> @example.instance(protocol=Sized)
+          ... def _example_sized(instance: Sized) -> str:
+          ...     return 'sized'
+
+          >>> explanation = example.explain(True)
+          >>> assert explanation.implementation is _example_int
+          >>> assert explanation.cached is False
+          >>> assert [step.kind for step in explanation.steps] == [
+          ...     'cache', 'exact_type', 'protocol', 'mro',
+          ... ]
+          >>> assert explanation.steps[-1].candidates == (int,)
+
+        When a type is passed, we explain how its instances are dispatched.
+        In this case delegates are skipped,
+        because they need real instances.
+        """
+        exact_types = self._exact_types
+        dispatch_cache: Container[type] = self._dispatch_cache
+        layer = self._overrides.get()
+        if layer is not None:
+            layer.refresh(self._exact_types, self._version)
+            exact_types = layer.exact_types
+            dispatch_cache = layer.dispatch_cache
+
+        delegates = self._delegates
+        protocols = self._protocols
+        if self._adaptive is not None:
+            self._adaptive.refresh(delegates, protocols, self._version)
+            delegates = dict(self._adaptive.delegates)
+            protocols = dict(self._adaptive.protocols)
+
+        return DispatchExplainer(instance_or_type).explain(
+            delegates=delegates,
+            exact_types=exact_types,
+            protocols=protocols,
+            dispatch_cache=dispatch_cache,
+            generics=self._generics,
+        )
+
+    def dispatch_table(self) -> Dict[type, Optional[Callable]]:
+        """
+        Exports current dispatch cache.
+
+        Cached misses are exported as ``None``.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(int)
+          ... def _example_int(instance: int) -> str:
+          ...     return 'int'
+
+          >>> example.warm([int, str])
+          >>> assert example.dispatch_table() == {
+          ...     int: _example_int,
+          ...     str: None,
+          ... }
+
+        """
+        return {
+            instance_type: (
+                None if impl is default_implementation else impl
+            )
+            for instance_type, impl in list(self._dispatch_cache.items())
+        }
+
+    def memo_stats(self) -> Dict[type, MemoStats]:
+        """
+        Returns cache statistics of memoized instances.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def schema(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @schema.instance(type, memoize=True)
+          ... def _schema_type(instance: type) -> str:
+          ...     return instance.__name__
+
+          >>> assert schema(int) == 'int'
+          >>> assert schema(int) == 'int'
+          >>> assert schema.memo_stats()[type] == (1, 1, 0, 1)
+
+        Statistics are ``hits``, ``misses``, ``evictions``, and ``size``.
+        Caches are cleared when new instances are registered,
+        statistics are kept.
+        """
+        return {
+            typ: memoized.stats()
+            for typ, memoized in self._memoized()
+        }
+
+    def set_timing_hook(self, hook: Optional[TimingHook]) -> None:
+        """
+        Reports dispatch time separately from implementation time.
+
+        The hook is called after each call of this typeclass with
+        the typeclass itself, the called implementation,
+        time spent on dispatching and time spent in the implementation.
+        Both times are in nanoseconds.
+
+        .. code:: python
+
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(int)
+          ... def _example_int(instance: int) -> str:
+          ...     return 'int'
+
+          >>> timings = []
+          >>> example.set_timing_hook(
+          ...     lambda typeclass, impl, dispatch_ns, call_ns: timings.append(
+          ...         (impl.__name__, dispatch_ns >= 0, call_ns >= 0),
+          ...     ),
+          ... )
+          >>> assert example(1) == 'int'
+          >>> assert timings == [('_example_int', True, True)]
+
+        Pass ``None`` to remove the hook.
+        Typeclasses without hooks do not pay anything for this feature.
+        """
+        self._dispatcher = (
+            self._build_dispatcher()
+            if hook is None
+            else self._build_timed_dispatcher(hook)
+        )
+
+    def set_adaptive_order(self, interval: Optional[int] = 1000) -> None:
+        """
+        Checks frequently matched delegates and protocols first.
+
+        Delegates are checked on every call and protocols on every cache miss,
+        one by one, in registration order.
+        When some of them are matched much more often than others,
+        it is faster to check them first.
+        With this option enabled, we count how often each delegate
+        and protocol is matched and reorder them every ``interval`` matches.
+
+        .. code:: python
+
+          >>> from typing import Sized
+          >>> from classes import typeclass
+
+          >>> @typeclass
+          ... def example(instance) -> str:
+          ...     '''Example typeclass.'''
+
+          >>> @example.instance(protocol=Sized)
+          ... def _example_sized(instance: Sized) -> str:
+          ...     return 'sized'
+
+          >>> example.set_adaptive_order(interval=100)
+          >>> assert example([]) == 'sized'
+
+        Pass ``None`` to disable it, registration order is restored.
+        Typeclasses without this option do not count anything.
+
+        .. warning::
+
+          Use it only when types are not matched by multiple
+          delegates or protocols:
+          the first matching one changes with the order.
+
+        """
+        self._adaptive = None if interval is None else AdaptiveOrder(interval)
+        self._reset_caches()
+
+    def _resolve(self, instance) -> Callable:
+        """Finds an implementation, ``default_implementation`` for misses."""
+        if self._overrides_active or self._has_delegates:
+            impl = self._dispatch_uncached(instance)
+            if impl is not None:
+                return impl
+
+        instance_type = type(instance)
+        try:
+            return self._dispatch_cache.implementations[id(instance_type)]
+        except KeyError:
+            impl = self._dispatch(
+                instance,
+                instance_type,
+            ) or default_implementation
+            self._dispatch_cache[instance_type] = impl
+            return impl
+
+    def _build_dispatcher(self) -> Callable:
+        # This is the same as `_resolve`, but it is inlined,
+        # because it is the hottest path of all typeclasses.
+        def wrapper(instance, *args, **kwargs):
+            # At first, we try overrides and all our delegate types,
+            # we don't cache it, because it is impossible.
+            # We only have runtime type info: `type([1]) == type(['a'])`.
+            # It might be slow!
+            # Don't add any delegate types unless
+            # you are absolutely know what you are doing.
+            if self._overrides_active or self._has_delegates:
+                impl = self._dispatch_uncached(instance)
+                if impl is not None:
+                    return impl(instance, *args, **kwargs)
+
+            instance_type = type(instance)
+
+            try:
+                impl = self._dispatch_cache.implementations[id(instance_type)]
+            except KeyError:
+                impl = self._dispatch(
+                    instance,
+                    instance_type,
+                ) or default_implementation
+                self._dispatch_cache[instance_type] = impl
+            return impl(instance, *args, **kwargs)
+        return rename_dispatcher(wrapper, self._signature)
+
+    def _build_timed_dispatcher(self, hook: TimingHook) -> Callable:
+        def wrapper(instance, *args, **kwargs):
+            started = perf_counter_ns()
+            impl = self._resolve(instance)
+            resolved = perf_counter_ns()
+            try:  # noqa: WPS501
+                return impl(instance, *args, **kwargs)
+            finally:
+                hook(
+                    self,
+                    impl,
+                    resolved - started,
+                    perf_counter_ns() - resolved,
+                )
+        return rename_dispatcher(wrapper, self._signature)
+
+    def _dispatch(
+        self,
+        instance,
+        instance_type: type,
+        exact_types: Optional[TypeRegistry] = None,
+    ) -> Optional[Callable]:
         """
         Dispatches a function by its type.
 
@@ -590,23 +1706,300 @@ class _TypeClass(  # noqa: WPS214
         1. By direct ``instance`` types
         2. By matching protocols
         3. By its ``mro``
+
+        Overrides pass their own ``exact_types`` here.
         """
-        implementation = self._exact_types.get(instance_type, None)
+        if exact_types is None:
+            exact_types = self._exact_types
+
+        implementation = exact_types.get(instance_type, None)
+        if implementation is not None:
+            return implementation
+
+        implementation = self._dispatch_protocol(instance)
         if implementation is not None:
             return implementation
 
+        implementation = find_implementation(instance_type, exact_types)
+        if implementation is None:
+            return self._discover(instance_type)
+        return implementation
+
+    def _dispatch_protocol(self, instance) -> Optional[Callable]:
+        adaptive = self._adaptive
+        if adaptive is not None:
+            adaptive.refresh(self._delegates, self._protocols, self._version)
+            return adaptive.match(adaptive.protocols, instance)
+
         for protocol, callback in self._protocols.items():
             if isinstance(instance, protocol):
                 return callback
+        return None
+
+    def _dispatch_type(self, instance_type: type) -> Optional[Callable]:
+        """
+        Dispatches a function by its type only, without any instances.
+
+        It works the same way as ``_dispatch``,
+        but uses ``issubclass`` for protocols.
+        Raises ``TypeError`` for protocols that do not support it,
+        and when instances can still match a protocol by their attributes.
+        """
+        implementation = self._exact_types.get(instance_type, None)
+        if implementation is not None:
+            return implementation
+
+        for protocol, callback in self._protocols.items():
+            if issubclass(instance_type, protocol):
+                return callback
+            if _has_instance_attributes(instance_type):
+                raise TypeError(
+                    '{0} can only be matched with instances'.format(
+                        instance_type.__qualname__,
+                    ),
+                )
+
+        implementation = find_implementation(instance_type, self._exact_types)
+        if implementation is None:
+            return self._discover(instance_type)
+        return implementation
+
+    def _resolve_type(self, instance_type: type) -> Callable:
+        """
+        Finds an implementation by type only, using the dispatch cache.
 
-        return _find_impl(instance_type, self._exact_types)
+        Returns the typeclass itself when it can't be done ahead of time,
+        so the implementation is resolved on each call.
+        """
+        if self._has_delegates or self._overrides_active:
+            return self
+        impl = self._dispatch_cache.get(instance_type)
+        if impl is None:
+            try:
+                impl = self._dispatch_type(instance_type)
+            except TypeError:
+                return self
+            impl = impl or default_implementation
+            self._dispatch_cache[instance_type] = impl
+        return impl
+
+    def _dispatch_uncached(self, instance) -> Optional[Callable]:
+        """Dispatches overrides of the current context and delegates."""
+        if self._overrides_active:
+            layer = self._overrides.get()
+            if layer is not None:
+                return self._dispatch_override(layer, instance)
+        return self._dispatch_delegate(instance)
+
+    def _dispatch_override(self, layer: OverrideLayer, instance) -> Callable:
+        layer.refresh(self._exact_types, self._version)
+
+        impl = self._dispatch_delegate(instance)
+        if impl is not None:
+            return impl
+
+        instance_type = type(instance)
+        try:
+            return layer.dispatch_cache[instance_type]
+        except KeyError:
+            impl = self._dispatch(
+                instance,
+                instance_type,
+                layer.exact_types,
+            ) or default_implementation
+            layer.dispatch_cache[instance_type] = impl
+            return impl
+
+    def _prepare_batch(
+        self,
+        instances: Optional[_ImplementationsMap],
+        *,
+        is_exact: bool,
+    ) -> TypeRegistry:
+        batch: TypeRegistry = {}
+        for typ, impl in (instances or {}).items():
+            instance_type = type(None) if is_exact and typ is None else typ
+            # The same generics check as in `.instance`,
+            # `None` protocols and delegates fail it as well:
+            isinstance(object(), instance_type)  # type: ignore
+            if isinstance(impl, str):
+                impl = LazyImplementation(impl, self._load_lazy)
+            batch[instance_type] = impl  # type: ignore
+        return batch
+
+    def _invalidate(self) -> None:
+        # Registries are changed, so all dispatch results might be stale:
+        self._reset_caches()
+        self._version = next(_registry_versions)
+        self._has_delegates = bool(self._delegates or self._generics)
+        for memoized in self._memos:
+            memoized.clear()
+
+    def _reset_caches(self) -> None:
+        # We don't clear caches in place, because snapshots can use them:
+        self._use_caches(new_caches())
+
+    def _use_registries(self, registries: Registries) -> None:
+        self._delegates = registries.delegates
+        self._generics = registries.generics
+        self._exact_types = registries.exact_types
+        self._protocols = registries.protocols
+        self._vectorized = registries.vectorized
+        self._memos = registries.memos
+
+    def _use_caches(self, caches: Caches) -> None:
+        self._dispatch_cache = caches.dispatch
+        self._buffer_cache = caches.buffers
+        self._generic_cache = caches.generic_aliases
+        self._next_chains = caches.next_chains
+
+    def _register(
+        self,
+        registry: TypeRegistry,
+        typ: type,
+        callback: Callable,
+    ) -> None:
+        # We keep memoized implementations separately,
+        # so registrations do not scan all registries to clear them:
+        previous = registry.get(typ)
+        if isinstance(previous, MemoizedImplementation):
+            self._memos.discard(previous)
+        if isinstance(callback, MemoizedImplementation):
+            self._memos.add(callback)
+        registry[typ] = callback
+
+    def _memoized(self) -> Iterator[Tuple[type, MemoizedImplementation]]:
+        for registry in self._registries():
+            for typ, callback in list(registry.items()):
+                if isinstance(callback, MemoizedImplementation):
+                    yield typ, callback
+
+    def _dispatch_buffer(self, buffer_format: str) -> Callable:
+        buffer_item_type = item_type(buffer_format)
+        implementation = find_implementation(buffer_item_type, self._vectorized)
+        if implementation is None:
+            raise NotImplementedError(
+                'Missing vectorized typeclass instance for type: {0}'.format(
+                    buffer_item_type.__qualname__,
+                ),
+            )
+        return implementation
+
+    def _fields_plan(self, instance_type: type) -> FieldsPlan:
+        plan = self._plans.get(instance_type)
+        if plan is None or plan.version != self._version:
+            plan = FieldsPlan(field_names(instance_type), self._version)
+            self._plans[instance_type] = plan
+        return plan
+
+    def _register_vectorized(
+        self,
+        registry: TypeRegistry,
+        typ: type,
+        vectorized: Callable,
+    ) -> None:
+        if registry is not self._exact_types:
+            raise ValueError('Vectorized instances only support exact types')
+        self._before_change()
+        self._vectorized[typ] = vectorized
+        self._invalidate()
+
+    def _resolve_field(
+        self,
+        plan: FieldsPlan,
+        index: int,
+        field_value,
+    ) -> Callable:
+        # Delegates and overrides can't be stored in plans:
+        # the first ones depend on values, the second ones on contexts.
+        if self._has_delegates or self._overrides_active:
+            return self._resolve(field_value)
+
+        value_type = type(field_value)
+        resolved_field = plan.resolved[index]
+        if resolved_field is not None and resolved_field[0] is value_type:
+            return resolved_field[1]
+
+        impl = self._resolve(field_value)
+        plan.resolved[index] = (value_type, impl)
+        return impl
+
+    def _load_lazy(
+        self,
+        lazy: LazyImplementation,
+        implementation: Callable,
+    ) -> None:
+        # Imported implementations replace lazy ones in place.
+        # Dispatch results are still the same, so we keep our cache warm.
+        for registry in self._registries():
+            for typ, callback in list(registry.items()):
+                if callback is lazy:
+                    registry[typ] = implementation
+        for instance_type, cached in list(self._dispatch_cache.items()):
+            if cached is lazy:
+                self._dispatch_cache[instance_type] = implementation
+
+    def _discover(self, instance_type: type) -> Optional[Callable]:
+        if self._entry_points is None:
+            return None
+        discovered = self._entry_points.find(instance_type)
+        if discovered is None:
+            return None
+        exact_type, import_path = discovered
+        self.register_many({exact_type: import_path})
+        return self._exact_types[exact_type]
+
+    def _dispatch_generic(self, alias) -> Optional[Callable]:
+        # Hashing generic aliases is slow, so we cache them by identity:
+        try:
+            return self._generic_cache.implementations[id(alias)]
+        except KeyError:
+            impl = self._generics.get(alias)
+            self._generic_cache[alias] = impl
+            return impl
+
+    def _registries(self) -> Tuple[TypeRegistry, ...]:
+        return (
+            self._delegates,
+            self._generics,  # type: ignore
+            self._exact_types,
+            self._protocols,
+            self._vectorized,
+        )
+
+    def _before_change(self) -> None:
+        # Snapshots share our registries until we change them,
+        # then all of them share the same copy:
+        if self._snapshots:
+            registries = copy_registries(next(iter(self._snapshots)).registries)
+            for snapshot in self._snapshots:
+                snapshot.registries = registries
+            self._snapshots = WeakSet()
 
     def _dispatch_delegate(self, instance) -> Optional[Callable]:
+        if self._generics:
+            impl = self._dispatch_generic_instance(instance)
+            if impl is not None:
+                return impl
+
+        adaptive = self._adaptive
+        if adaptive is not None:
+            adaptive.refresh(self._delegates, self._protocols, self._version)
+            return adaptive.match(adaptive.delegates, instance)
+
         for delegate, callback in self._delegates.items():
             if isinstance(instance, delegate):
                 return callback
         return None
 
+    def _dispatch_generic_instance(self, instance) -> Optional[Callable]:
+        # Instances created as `Box[int]()` remember their generic alias,
+        # so we find them without `isinstance` checks:
+        alias = generic_alias_of(instance)
+        if alias is None:
+            return None
+        return self._dispatch_generic(alias)
+
 
 if TYPE_CHECKING:
     from typing_extensions import Protocol
@@ -19,6 +19,7 @@ https://github.com/TypedDjango/pytest-mypy-plugins
 
 from typing import Callable, Optional, Type
 
+from mypy.options import Options
 from mypy.plugin import (
     AnalyzeTypeContext,
     FunctionContext,
@@ -31,6 +32,7 @@ from mypy.types import Type as MypyType
 from typing_extensions import Final, final
 
 from classes.contrib.mypy.features import associated_type, supports, typeclass
+from classes.contrib.mypy.features.manifest import Manifest
 
 _ASSOCIATED_TYPE_FULLNAME: Final = 'classes._typeclass.AssociatedType'
 _TYPECLASS_FULLNAME: Final = 'classes._typeclass._TypeClass'
@@ -39,6 +41,12 @@ _TYPECLASS_INSTANCE_DEF_FULLNAME: Final = (
     'classes._typeclass._TypeClassInstanceDef'
 )
 
+#: Methods that return what the typeclass returns for a bound instance.
+_BOUND_RETURN_METHODS: Final = frozenset((
+    '{0}.try_call'.format(_TYPECLASS_FULLNAME),
+    '{0}.call_next'.format(_TYPECLASS_FULLNAME),
+))
+
 
 @final
 class _TypeClassPlugin(Plugin):
@@ -54,6 +62,11 @@ class _TypeClassPlugin(Plugin):
     Hooks are in the logical order.
     """
 
+    def __init__(self, options: Options) -> None:
+        """We also write a manifest of instances, when it is configured."""
+        super().__init__(options)
+        self._manifest = Manifest.from_options(options)
+
     def get_type_analyze_hook(
         self,
         fullname: str,
@@ -89,9 +102,13 @@ class _TypeClassPlugin(Plugin):
         if fullname == '{0}.__call__'.format(_TYPECLASS_DEF_FULLNAME):
             return typeclass.TypeClassDefReturnType(_ASSOCIATED_TYPE_FULLNAME)
         if fullname == '{0}.__call__'.format(_TYPECLASS_INSTANCE_DEF_FULLNAME):
-            return typeclass.InstanceDefReturnType()
+            return typeclass.InstanceDefReturnType(self._manifest)
         if fullname == '{0}.instance'.format(_TYPECLASS_FULLNAME):
-            return typeclass.instance_return_type
+            return typeclass.InstanceReturnType(
+                typeclass.InstanceDefReturnType(self._manifest),
+            )
+        if fullname in _BOUND_RETURN_METHODS:
+            return typeclass.bound_return_type
         return None
 
     def get_method_signature_hook(
@@ -0,0 +1,128 @@
+import json
+from configparser import ConfigParser
+from configparser import Error as ConfigError
+from typing import Iterator, List, Optional, Set, Tuple
+
+from mypy.options import Options
+from mypy.types import Instance
+from mypy.types import Type as MypyType
+from mypy.types import get_proper_type
+from typing_extensions import Final, final
+
+from classes.contrib.mypy.typeops.instance_context import InstanceContext
+
+#: Config section with our plugin options.
+_CONFIG_SECTION: Final = 'classes-mypy'
+
+#: Typeclass name, registry kind, and type import path.
+_ManifestLine = Tuple[str, str, str]
+
+
+@final
+class Manifest(object):
+    """
+    Writes all checked instance types to a JSON file.
+
+    It is enabled in ``setup.cfg`` or ``mypy.ini``:
+
+    .. code:: ini
+
+      [classes-mypy]
+      manifest = typeclasses.json
+
+    Then ``catalog.warm_from_manifest()`` uses this file in runtime
+    to find missing registrations and to warm dispatch caches.
+
+    ``mypy`` does not have a hook that runs after all files are checked,
+    so we append new types to the file as soon as they are checked.
+    Each line is a JSON list of a typeclass name, a registry kind,
+    and a type import path.
+
+    Incremental runs only check changed modules,
+    so their types are added to the existing file.
+    Types of removed instances are kept there,
+    use ``--no-incremental`` to write the file from scratch.
+    """
+
+    __slots__ = ('_path', '_incremental', '_lines')
+
+    def __init__(self, path: str, *, incremental: bool = True) -> None:
+        """We only touch the file when there are some instances."""
+        self._path = path
+        self._incremental = incremental
+        self._lines: Optional[Set[_ManifestLine]] = None
+
+    @classmethod
+    def from_options(cls, options: Options) -> Optional['Manifest']:
+        """Reads the manifest path from ``mypy`` config file."""
+        if not options.config_file:
+            return None
+        config = ConfigParser()
+        try:
+            config.read(options.config_file)
+        except ConfigError:  # `pyproject.toml` is not supported
+            return None
+        path = config.get(_CONFIG_SECTION, 'manifest', fallback=None)
+        if not path:
+            return None
+        return cls(path, incremental=options.incremental)
+
+    def add(self, instance_context: InstanceContext) -> None:
+        """Adds types of a checked instance."""
+        if self._lines is None:
+            self._lines = self._load()
+
+        new_lines: List[_ManifestLine] = []
+        for manifest_line in _instance_lines(instance_context):
+            if manifest_line not in self._lines:
+                self._lines.add(manifest_line)
+                new_lines.append(manifest_line)
+
+        if new_lines:
+            with open(self._path, 'a', encoding='utf8') as manifest_file:
+                manifest_file.writelines(
+                    '{0}\n'.format(json.dumps(new_line))
+                    for new_line in new_lines
+                )
+
+    def _load(self) -> Set[_ManifestLine]:
+        if not self._incremental:
+            with open(self._path, 'w', encoding='utf8'):
+                return set()  # we start from scratch
+
+        try:
+            with open(self._path, encoding='utf8') as manifest_file:
+                return {
+                    tuple(json.loads(manifest_line))  # type: ignore
+                    for manifest_line in manifest_file
+                }
+        except FileNotFoundError:
+            return set()
+
+
+def _instance_lines(
+    instance_context: InstanceContext,
+) -> Iterator[_ManifestLine]:
+    inferred_args = instance_context.inferred_args
+    kinds = (
+        ('exact_types', inferred_args.exact_type),
+        ('protocols', inferred_args.protocol),
+        ('delegates', inferred_args.delegate),
+    )
+    for kind, type_arg in kinds:
+        type_path = _type_import_path(type_arg)
+        if type_path is not None:
+            yield (instance_context.fullname, kind, type_path)
+
+
+def _type_import_path(type_arg: Optional[MypyType]) -> Optional[str]:
+    # Runtime uses `module:qualname` paths, just like lazy implementations.
+    # Other types, like `None` or `TypedDict`, can't be imported.
+    proper_type = get_proper_type(type_arg)
+    if not isinstance(proper_type, Instance):
+        return None
+    type_info = proper_type.type
+    return '{0}:{1}'.format(
+        type_info.module_name,
+        type_info.fullname[len(type_info.module_name) + 1:],
+    )
@@ -1,7 +1,8 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from mypy.nodes import Decorator
 from mypy.plugin import FunctionContext, MethodContext, MethodSigContext
+from mypy.typeops import make_simplified_union
 from mypy.types import (
     AnyType,
     CallableType,
@@ -11,9 +12,10 @@ from mypy.types import (
     TupleType,
 )
 from mypy.types import Type as MypyType
-from mypy.types import TypeOfAny, UninhabitedType
+from mypy.types import TypeOfAny, UninhabitedType, get_proper_type
 from typing_extensions import final
 
+from classes.contrib.mypy.features.manifest import Manifest
 from classes.contrib.mypy.typeops import (
     call_signatures,
     fallback,
@@ -147,28 +149,84 @@ class TypeClassDefReturnType(object):
         return ctx.default_return_type
 
 
-def instance_return_type(ctx: MethodContext) -> MypyType:
-    """Adjusts the typing signature on ``.instance(type)`` call."""
-    assert isinstance(ctx.default_return_type, Instance)
+def bound_return_type(ctx: MethodContext) -> MypyType:
+    """
+    Adds the return type of a typeclass to ``.try_call()`` results.
+
+    ``_ReturnType`` is not bound by the method itself,
+    so we take it from the typeclass signature.
+    It works for ``.call_next()`` as well.
+    """
     assert isinstance(ctx.type, Instance)
 
-    # We need to unify how we represent passed arguments to our internals.
-    # We use this convention: passed args are added as-is,
-    # missing ones are passed as `NoReturn` (because we cannot pass `None`).
-    passed_types = []
-    for arg_pos in ctx.arg_types:
-        if arg_pos:
-            passed_types.extend(arg_pos)
-        else:
-            passed_types.append(UninhabitedType())
-
-    instance_type_args.mutate_typeclass_instance_def(
+    signature = get_proper_type(ctx.type.args[1])
+    if not isinstance(signature, CallableType):
+        return ctx.default_return_type
+    return make_simplified_union([
+        signature.ret_type,
         ctx.default_return_type,
-        ctx=ctx,
-        typeclass=ctx.type,
-        passed_types=passed_types,
-    )
-    return ctx.default_return_type
+    ])
+
+
+@final
+class InstanceReturnType(object):
+    """
+    Adjusts the typing signature on ``.instance(type)`` call.
+
+    When ``impl`` is passed, it is registered and returned right away,
+    so we check it here, just like the decorator does.
+    """
+
+    __slots__ = ('_instance_def',)
+
+    def __init__(self, instance_def: 'InstanceDefReturnType') -> None:
+        """We use the same checks as the decorator."""
+        self._instance_def = instance_def
+
+    @fallback.error_to_any({
+        KeyError: 'Typeclass cannot be loaded, it must be a global declaration',
+    })
+    def __call__(self, ctx: MethodContext) -> MypyType:
+        """Main entry point."""
+        assert isinstance(ctx.default_return_type, Instance)
+        assert isinstance(ctx.type, Instance)
+
+        # We need to unify how we represent passed arguments to our internals.
+        # We use this convention: passed args are added as-is,
+        # missing ones are passed as `NoReturn`,
+        # because we cannot pass `None`.
+        # We only need type arguments here:
+        # `exact_type`, `protocol`, `delegate`.
+        passed_types = []
+        for arg_pos in ctx.arg_types[:3]:
+            if arg_pos:
+                passed_types.extend(arg_pos)
+            else:
+                passed_types.append(UninhabitedType())
+
+        instance_type_args.mutate_typeclass_instance_def(
+            ctx.default_return_type,
+            ctx=ctx,
+            typeclass=ctx.type,
+            passed_types=passed_types,
+        )
+        if len(ctx.arg_types) < 4 or not ctx.arg_types[3]:
+            return ctx.default_return_type
+
+        impl_type = get_proper_type(ctx.arg_types[3][0])
+        # Typeclasses without a known name, like `self` in our own methods,
+        # can't be loaded, so their instances are not checked:
+        is_named = isinstance(ctx.type.args[3], LiteralType)
+        if isinstance(impl_type, CallableType) and is_named:
+            is_valid = self._instance_def.add_instance(
+                ctx.default_return_type,
+                impl_type,
+                ctx,
+            )
+            return impl_type if is_valid else AnyType(TypeOfAny.from_error)
+        elif isinstance(impl_type, FunctionLike):
+            return impl_type  # overloads are not checked, like in decorators
+        return AnyType(TypeOfAny.implementation_artifact)  # lazy imports
 
 
 @final
@@ -183,36 +241,54 @@ class InstanceDefReturnType(object):
     1. Typecheck usage correctness
     2. Adding new instance types to typeclass definition
     3. Adding ``Supports[]`` metadata
+    4. Adding instance types to the manifest, when it is configured
 
     """
 
+    __slots__ = ('_manifest',)
+
+    def __init__(self, manifest: Optional[Manifest] = None) -> None:
+        """Manifest is shared by all calls."""
+        self._manifest = manifest
+
     @fallback.error_to_any({
         # TODO: later we can use a custom exception type for this:
         KeyError: 'Typeclass cannot be loaded, it must be a global declaration',
     })
     def __call__(self, ctx: MethodContext) -> MypyType:
-        """Main entry point."""
+        """Checks an instance definition and records its types."""
         assert isinstance(ctx.type, Instance)
-        assert isinstance(ctx.type.args[0], TupleType)
-        assert isinstance(ctx.type.args[1], Instance)
-
-        typeclass, fullname = self._load_typeclass(ctx.type.args[1], ctx)
-        assert isinstance(typeclass.args[1], CallableType)
 
         instance_signature = ctx.arg_types[0][0]
         if not isinstance(instance_signature, CallableType):
             return ctx.default_return_type
+        if not self.add_instance(ctx.type, instance_signature, ctx):
+            return AnyType(TypeOfAny.from_error)
+        return ctx.default_return_type
+
+    def add_instance(
+        self,
+        instance_def: Instance,
+        instance_signature: CallableType,
+        ctx: MethodContext,
+    ) -> bool:
+        """Checks an instance and adds its type to the typeclass."""
+        assert isinstance(instance_def.args[0], TupleType)
+        assert isinstance(instance_def.args[1], Instance)
+
+        typeclass, fullname = self._load_typeclass(instance_def.args[1], ctx)
+        assert isinstance(typeclass.args[1], CallableType)
 
         instance_context = InstanceContext.build(
             typeclass_signature=typeclass.args[1],
             instance_signature=instance_signature,
-            passed_args=ctx.type.args[0],
+            passed_args=instance_def.args[0],
             associated_type=typeclass.args[2],
             fullname=fullname,
             ctx=ctx,
         )
         if not self._run_validation(instance_context):
-            return AnyType(TypeOfAny.from_error)
+            return False
 
         # If typeclass is checked, than it is safe to add new instance types:
         self._add_new_instance_type(
@@ -220,7 +296,9 @@ class InstanceDefReturnType(object):
             new_type=instance_context.instance_type,
             ctx=ctx,
         )
-        return ctx.default_return_type
+        if self._manifest is not None:
+            self._manifest.add(instance_context)
+        return True
 
     def _load_typeclass(
         self,
@@ -1,10 +1,24 @@
+import sys
 from contextlib import contextmanager
-from typing import Callable, ContextManager, Iterator
+from functools import _compose_mro  # type: ignore  # noqa: WPS450
+from typing import Callable, ContextManager, Iterator, List
 
 import pytest
 
 from classes._typeclass import _TypeClass  # noqa: WPS450
 
+_LAZY_MODULE = """
+def lazy_int(instance, other):
+    return instance + other
+
+not_callable = 1
+
+class Lazy(object):
+    @staticmethod
+    def sized(instance, other):
+        return len(instance) + other
+"""
+
 
 @pytest.fixture(scope='session')
 def clear_cache() -> Callable[[_TypeClass], ContextManager]:
@@ -15,3 +29,44 @@ def clear_cache() -> Callable[[_TypeClass], ContextManager]:
         yield
         typeclass._dispatch_cache.clear()  # noqa: WPS437
     return factory
+
+
+@pytest.fixture()
+def lazy_module(tmp_path, monkeypatch) -> str:
+    """Creates a module with lazy implementations that is not imported yet."""
+    module_name = 'classes_lazy_instances'
+    (tmp_path / '{0}.py'.format(module_name)).write_text(_LAZY_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return module_name
+
+
+@pytest.fixture()
+def install_plugin(tmp_path, monkeypatch) -> Callable[[str, str, str], None]:
+    """Fixture to install a package with entry points and a single module."""
+    def factory(module_name: str, entry_points: str, source: str) -> None:
+        dist_info = tmp_path / '{0}-1.0.dist-info'.format(module_name)
+        dist_info.mkdir()
+        (dist_info / 'METADATA').write_text(
+            'Metadata-Version: 2.1\nName: {0}\nVersion: 1.0\n'.format(
+                module_name,
+            ),
+        )
+        (dist_info / 'entry_points.txt').write_text(entry_points)
+        (tmp_path / '{0}.py'.format(module_name)).write_text(source)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return factory
+
+
+@pytest.fixture()
+def compositions(monkeypatch) -> List[type]:
+    """Records all types which ``mro`` is composed."""
+    composed: List[type] = []
+
+    def factory(instance_type, types):
+        composed.append(instance_type)
+        return _compose_mro(instance_type, types)
+
+    monkeypatch.setattr('classes._mro._compose_mro', factory)
+    return composed
@@ -0,0 +1,91 @@
+import gc
+from typing import Sized
+
+import pytest
+
+from classes import AssociatedType, Supports, catalog, typeclass
+from classes._typeclass import _TypeClass  # noqa: WPS450
+
+
+class ToJson(AssociatedType):
+    """Example associated type."""
+
+
+class Measurable(AssociatedType):
+    """Example associated type."""
+
+
+@typeclass(ToJson)
+def to_json(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass(Measurable)
+def measure(instance) -> int:
+    """Example typeclass."""
+
+
+@to_json.instance(int)
+def _to_json_int(instance: int) -> str:
+    return str(instance)
+
+
+@to_json.instance(str)
+def _to_json_str(instance: str) -> str:
+    return instance
+
+
+@measure.instance(protocol=Sized)
+def _measure_sized(instance: Sized) -> int:
+    return len(instance)
+
+
+_NoneType = type(None)
+_ToJsonAndMeasurable: type = Supports[ToJson, Measurable]  # type: ignore
+
+
+def _temporary_signature(instance) -> None:
+    """Signature of a typeclass that is not kept alive."""
+
+
+def test_isinstance_supports(clear_cache) -> None:
+    """Ensures that ``Supports`` works with ``isinstance``."""
+    with clear_cache(to_json):
+        assert isinstance(1, Supports[ToJson])  # type: ignore
+        assert not isinstance(None, Supports[ToJson])  # type: ignore
+        assert int in to_json._dispatch_cache  # noqa: WPS437
+        assert _NoneType in to_json._dispatch_cache  # noqa: WPS437
+
+
+def test_isinstance_variadic(clear_cache) -> None:
+    """Ensures that all associated typeclasses must support values."""
+    with clear_cache(to_json):
+        with clear_cache(measure):
+            assert isinstance('a', _ToJsonAndMeasurable)
+            assert not isinstance(1, _ToJsonAndMeasurable)
+            assert not isinstance([], _ToJsonAndMeasurable)
+
+
+def test_not_associated() -> None:
+    """Ensures that types without typeclasses raise."""
+    class Missing(AssociatedType):
+        """Has no typeclass."""
+
+    with pytest.raises(TypeError, match='not associated'):
+        isinstance(1, Supports[Missing])  # type: ignore
+
+
+def test_dead_typeclass() -> None:
+    """Ensures that catalog does not keep typeclasses alive."""
+    class Temporary(AssociatedType):
+        """Its typeclass is collected."""
+
+    temporary: object = _TypeClass(
+        _temporary_signature,
+        associated_type=Temporary,
+    )
+    del temporary  # noqa: WPS420
+    gc.collect()
+
+    assert catalog.find_by_associated_type(Temporary) is None
+    assert catalog.find_by_associated_type(ToJson) is to_json
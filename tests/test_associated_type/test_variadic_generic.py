@@ -1,9 +1,11 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypeVar
 
 import pytest
+from typing_extensions import Literal
 
-from classes import AssociatedType
+from classes import AssociatedType, Supports
 
 _FirstType = TypeVar('_FirstType')
 
@@ -34,3 +36,42 @@ def test_subtype_is_variadic():
     assert Example[int]
     assert Example[int, int]  # type: ignore
     assert Example[int, int, str]  # type: ignore
+
+
+def test_subscription_is_cached():
+    """Ensures that the same aliases are reused."""
+    class Example(AssociatedType[_FirstType]):
+        """Correct type."""
+
+    assert Example[int, str] is Example[int, str]  # type: ignore
+    assert Supports[Example] is Supports[Example]
+    assert Example[int] is not Example[str]  # type: ignore
+
+
+def test_unhashable_type_params():
+    """Ensures that unhashable type params skip the cache."""
+    class Example(AssociatedType[_FirstType]):
+        """Correct type."""
+
+    alias = Example[Literal[[1]]]  # type: ignore
+    assert alias.__args__[0].__args__ == ([1],)  # type: ignore  # noqa: WPS609
+
+
+def test_concurrent_subscription():
+    """Ensures that class-level params are never changed."""
+    class Example(AssociatedType[_FirstType]):
+        """Correct type."""
+
+    def factory(params_count: int):
+        return Example[(int,) * params_count]  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        aliases = list(executor.map(factory, range(1, 200)))
+
+    type_params = Example.__parameters__  # type: ignore  # noqa: WPS609
+    args_counts = [
+        len(alias.__args__)  # noqa: WPS609
+        for alias in aliases
+    ]
+    assert type_params == (_FirstType,)
+    assert args_counts == list(range(1, 200))
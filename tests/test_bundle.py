@@ -0,0 +1,143 @@
+from typing import List
+
+import pytest
+from typing_extensions import Protocol, runtime_checkable
+
+from classes import TypeClassBundle, typeclass
+
+
+@runtime_checkable
+class _WithField(Protocol):
+    field: str
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+@typeclass
+def to_json(instance) -> str:
+    """Example typeclass."""
+
+
+@to_json.instance(int)
+def _to_json_int(instance: int) -> str:
+    return str(instance)
+
+
+@typeclass
+def validate(instance) -> bool:
+    """Example typeclass."""
+
+
+@validate.instance(int)
+def _validate_int(instance: int) -> bool:
+    return instance > 0
+
+
+@validate.instance(protocol=_WithField)
+def _validate_with_field(instance: _WithField) -> bool:
+    return bool(instance.field)
+
+
+@typeclass
+def render(instance) -> str:
+    """Example typeclass."""
+
+
+@render.instance(delegate=_ListOfStr)
+def _render_list_of_str(instance: _ListOfStr) -> str:
+    return ', '.join(instance)
+
+
+@typeclass
+def growing(instance) -> str:
+    """Gets new instances in tests."""
+
+
+@typeclass
+def first(instance) -> str:
+    """Gets snapshots restored in tests."""
+
+
+@typeclass
+def second(instance) -> str:
+    """Gets new instances in tests."""
+
+
+@typeclass
+def _private(instance) -> str:
+    """Has a private name."""
+
+
+def test_for_type() -> None:
+    """Ensures that records are resolved and cached."""
+    bundle = TypeClassBundle([to_json, validate])
+    record = bundle.for_type(int)
+
+    assert list(record) == [_to_json_int, _validate_int]
+    assert bundle.for_type(int) is record
+    assert record.to_json(1) == '1'
+    with pytest.raises(AttributeError, match='missing'):
+        record.missing  # noqa: WPS428
+
+    str_record = bundle.for_type(str)
+    with pytest.raises(NotImplementedError, match='type: str'):
+        str_record[0]('a')
+    assert str_record[1] is validate
+
+
+def test_for_type_invalidation() -> None:
+    """Ensures that records are rebuilt after new registrations."""
+    bundle = TypeClassBundle([to_json, growing])
+    assert bundle.for_type(int)[1] is not repr
+
+    growing.register_many({int: repr})
+    assert list(bundle.for_type(int)) == [_to_json_int, repr]
+
+
+def test_for_type_restore() -> None:
+    """Ensures that records are rebuilt after older versions are restored."""
+    bundle = TypeClassBundle([first, second])
+    snapshot = first.snapshot()
+    first.register_many({int: repr})
+    assert bundle.for_type(int)[0] is repr
+
+    first.restore(snapshot)
+    second.register_many({int: ascii})
+    record = bundle.for_type(int)
+    assert record[0] is not repr
+    assert record[1] is ascii
+
+
+def test_for_type_dynamic() -> None:
+    """Ensures that delegates and overrides are dispatched on calls."""
+    bundle = TypeClassBundle([to_json, render])
+    assert bundle.for_type(list)[1] is render
+
+    with to_json.override(int, repr):
+        record = bundle.for_type(int)
+    assert list(record) == [to_json, render]
+    assert record[0](1) == '1'
+
+
+def test_private_names() -> None:
+    """Ensures that leading underscores are stripped from field names."""
+    _private.register_many({int: repr})
+    record = TypeClassBundle([_private, to_json]).for_type(int)
+    assert record.private is repr
+    assert record.to_json is _to_json_int
+
+
+def test_duplicate_names() -> None:
+    """Ensures that record fields are unique."""
+    with pytest.raises(ValueError, match='duplicate field name'):
+        TypeClassBundle([to_json, to_json])
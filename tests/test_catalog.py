@@ -0,0 +1,274 @@
+import gc
+import json
+from abc import ABCMeta, abstractmethod
+from typing import List, Sized
+
+import pytest
+from typing_extensions import Protocol, runtime_checkable
+
+from classes import TypeClassBundle, catalog, typeclass
+from classes._catalog import TypeClassRegistries, TypeClassStats
+from classes._mro import linearizations
+
+
+@runtime_checkable
+class _WithField(Protocol):
+    field: str
+
+
+@runtime_checkable
+class _Renderable(Protocol):
+    def render(self) -> str:
+        """Example protocol member."""
+
+
+class _Widget(object):
+    """Matches ``_Renderable`` only by its instance attribute."""
+
+    def __init__(self) -> None:
+        self.render = lambda: 'widget'
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _First(object, metaclass=ABCMeta):
+    @abstractmethod
+    def first(self) -> None:
+        """Example abstract method."""
+
+
+class _Second(object, metaclass=ABCMeta):
+    @abstractmethod
+    def second(self) -> None:
+        """Example abstract method."""
+
+
+class _Both(object):
+    """Example type with two unrelated virtual bases."""
+
+
+_First.register(_Both)
+_Second.register(_Both)
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(int)
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+@example.instance(protocol=Sized)
+def _example_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+@example.instance(delegate=_ListOfStr)
+def _example_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@typeclass
+def rendered(instance) -> str:
+    """Example typeclass."""
+
+
+@rendered.instance(protocol=_Renderable)
+def _rendered_renderable(instance: _Renderable) -> str:
+    return instance.render()
+
+
+@typeclass
+def with_field(instance) -> str:
+    """Typeclass for data protocols."""
+
+
+@typeclass
+def ambiguous(instance) -> str:
+    """Typeclass for unrelated virtual bases."""
+
+
+@ambiguous.instance(int)
+def _ambiguous_int(instance: int) -> str:
+    return 'int'
+
+
+@ambiguous.instance(_First)
+def _ambiguous_first(instance: _First) -> str:
+    return 'first'
+
+
+@ambiguous.instance(_Second)
+def _ambiguous_second(instance: _Second) -> str:
+    return 'second'
+
+
+def _weak_signature(instance) -> str:
+    """Signature of a typeclass that is not kept alive."""
+
+
+_FULLNAME = '{0}.example'.format(__name__)
+
+
+def test_catalog_contains(clear_cache) -> None:
+    """Ensures that all typeclasses are in the catalog."""
+    assert example in catalog.typeclasses()
+
+
+def test_catalog_is_weak() -> None:
+    """Ensures that catalog does not keep typeclasses alive."""
+    weak: object = typeclass(_weak_signature)
+    fullname = '{0}._weak_signature'.format(__name__)
+    assert fullname in catalog.stats()
+
+    del weak  # noqa: WPS420
+    gc.collect()
+    assert fullname not in catalog.stats()
+
+
+def test_warm(clear_cache) -> None:
+    """Ensures that warming up caches works."""
+    with clear_cache(example):
+        catalog.warm(iter([int, bool, list, _ListOfStr, float]))
+        assert catalog.stats()[_FULLNAME] == TypeClassStats(
+            delegates=1,
+            exact_types=1,
+            protocols=1,
+            cached_types=5,
+        )
+        assert example._dispatch_cache[bool] is _example_int  # noqa: WPS437
+        assert example._dispatch_cache[list] is _example_sized  # noqa: WPS437
+        assert example.supports(1.5) is False
+        assert example(['a']) == 'list of str'
+
+
+def test_warm_and_clear(clear_cache) -> None:
+    """Ensures that warmed caches are cleared."""
+    with clear_cache(example):
+        catalog.warm([int, bool])
+        example.warm([int])
+        assert len(example._dispatch_cache) == 2  # noqa: WPS437
+
+        catalog.clear_caches()
+        assert not example._dispatch_cache  # noqa: WPS437
+        assert not linearizations
+
+
+def test_warm_skips_data_protocols() -> None:
+    """Ensures that protocols with non-method members are skipped."""
+    with_field.register_many(protocols={_WithField: _example_sized})
+    with_field.warm([int])
+    assert not with_field._dispatch_cache  # noqa: WPS437
+
+
+def test_warm_skips_instance_attributes() -> None:
+    """Ensures that types with protocol members in instances are skipped."""
+    rendered.warm([_Widget, int])
+    assert rendered.dispatch_table().get(int, rendered) is None
+    assert TypeClassBundle([rendered]).for_type(_Widget)[0] is rendered
+    assert rendered(_Widget()) == 'widget'
+
+
+def test_warm_skips_ambiguous_types() -> None:
+    """Ensures that ambiguous types do not stop warming other types."""
+    ambiguous.warm([_Both, int])
+    assert _Both not in ambiguous._dispatch_cache  # noqa: WPS437
+    assert ambiguous._dispatch_cache[int] is _ambiguous_int  # noqa: WPS437
+    with pytest.raises(RuntimeError, match='Ambiguous dispatch'):
+        ambiguous(_Both())  # type: ignore
+
+
+def test_registries() -> None:
+    """Ensures that registries are listed."""
+    assert catalog.registries()[_FULLNAME] == TypeClassRegistries(
+        delegates=(_ListOfStr,),
+        exact_types=(int,),
+        protocols=(Sized,),
+    )
+
+
+def test_save_types(clear_cache, tmp_path) -> None:
+    """Ensures that cached types can be saved."""
+    class _Local(object):
+        """Local types can't be imported."""
+
+    path = tmp_path / 'types.json'
+    with clear_cache(example):
+        assert example.try_call(_Local()) is None
+        assert example(True) == 'int'
+        assert example([]) == 'sized'
+        catalog.save_types(path)
+
+    assert json.loads(path.read_text())[_FULLNAME] == [
+        'builtins:bool',
+        'builtins:list',
+    ]
+
+
+def test_warm_from_file(clear_cache, tmp_path) -> None:
+    """Ensures that saved types are warmed and broken ones are skipped."""
+    path = tmp_path / 'types.json'
+    path.write_text(json.dumps({_FULLNAME: [
+        'builtins:bool',
+        'builtins:len',
+        'missing:Type',
+        'builtins:list',
+        'missing:Type',
+    ]}))
+
+    with clear_cache(example):
+        assert catalog.warm_from_file(path) == ['builtins:len', 'missing:Type']
+        assert example.dispatch_table() == {
+            bool: _example_int,
+            list: _example_sized,
+        }
+
+
+def test_warm_from_file_broken_modules(tmp_path, monkeypatch) -> None:
+    """Ensures that types from modules that fail on import are skipped."""
+    (tmp_path / 'classes_broken_module.py').write_text('raise RuntimeError\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / 'types.json'
+    path.write_text(json.dumps({_FULLNAME: ['classes_broken_module:Type']}))
+
+    assert catalog.warm_from_file(path) == ['classes_broken_module:Type']
+
+
+def test_warm_from_manifest(clear_cache, tmp_path) -> None:
+    """Ensures that registries are checked against the manifest."""
+    path = tmp_path / 'manifest.json'
+    path.write_text(''.join(
+        '{0}\n'.format(json.dumps(manifest_line))
+        for manifest_line in (
+            [_FULLNAME, 'delegates', '{0}:_ListOfStr'.format(__name__)],
+            [_FULLNAME, 'exact_types', 'builtins:int'],
+            [_FULLNAME, 'exact_types', 'missing:Type'],
+            [_FULLNAME, 'exact_types', 'builtins:float'],
+            [_FULLNAME, 'protocols', 'typing:Sized'],
+            ['missing.example', 'exact_types', 'builtins:int'],
+        )
+    ))
+
+    with clear_cache(example):
+        assert catalog.warm_from_manifest(path) == [
+            'missing.example: typeclass is not loaded',
+            '{0}: builtins:float is not registered in exact_types'.format(
+                _FULLNAME,
+            ),
+            '{0}: missing:Type can not be imported'.format(_FULLNAME),
+        ]
+        assert example.dispatch_table() == {int: _example_int, float: None}
@@ -0,0 +1,123 @@
+import abc
+from typing import Iterable, List
+
+import pytest
+
+from classes import typeclass
+from classes._mro import linearizations
+
+
+class _Virtual(abc.ABC):
+    """Example virtual base."""
+
+    @abc.abstractmethod
+    def virtual(self) -> None:
+        """Virtual subclasses do not need it."""
+
+
+class _Other(abc.ABC):
+    """Another virtual base."""
+
+    @abc.abstractmethod
+    def other(self) -> None:
+        """Virtual subclasses do not need it."""
+
+
+@typeclass
+def first(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass
+def second(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass
+def with_other(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass
+def ambiguous(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass
+def aliased(instance) -> str:
+    """Example typeclass."""
+
+
+first.register_many({_Virtual: repr})
+second.register_many({_Virtual: str, object: repr})
+with_other.register_many({_Virtual: repr, _Other: str})
+ambiguous.register_many({_Virtual: repr, _Other: str})
+aliased.register_many({Iterable: str, object: repr})
+
+
+def test_shared_linearizations(compositions: List[type]) -> None:
+    """Ensures that all typeclasses use the same composed ``mro``."""
+    class Model(object):
+        """Example type."""
+
+    _Virtual.register(Model)
+
+    assert first.supports(Model())
+    assert second.supports(Model())
+    assert with_other.supports(Model())
+    assert compositions == [Model]  # `_Other` is not a virtual base
+    assert linearizations
+
+
+def test_new_virtual_bases(compositions: List[type]) -> None:
+    """Ensures that ``mro`` is composed again for new virtual bases."""
+    class Model(object):
+        """Example type."""
+
+    _Virtual.register(Model)
+    assert with_other.supports(Model())
+
+    _Other.register(Model)  # `abc` cache token is changed
+    assert _Other in linearizations.compose(Model, [_Virtual, _Other])
+    assert compositions == [Model, Model]
+
+
+def test_new_subclasses(compositions: List[type]) -> None:
+    """Ensures that new subclasses of virtual bases are used."""
+    class Virtual(abc.ABC):
+        """Its subclasses are not seen by other tests."""
+
+        @abc.abstractmethod
+        def virtual(self) -> None:
+            """Virtual subclasses do not need it."""
+
+    class Model(object):
+        """Example type."""
+
+    Virtual.register(Model)
+    linearizations.compose(Model, [Virtual])
+
+    class Subclass(Virtual):
+        """New subclass."""
+
+    assert linearizations.compose(Model, [Virtual]) == (
+        Model, Virtual, abc.ABC, object,
+    )
+    assert compositions == [Model, Model]
+
+
+def test_ambiguous_dispatch() -> None:
+    """Ensures that unrelated virtual bases are not guessed."""
+    class Model(object):
+        """Example type."""
+
+    _Virtual.register(Model)
+    _Other.register(Model)
+
+    with pytest.raises(RuntimeError, match='Ambiguous dispatch'):
+        ambiguous(Model())  # type: ignore
+
+
+def test_typing_aliases() -> None:
+    """Ensures that ``typing`` aliases are not used in ``mro``."""
+    assert aliased([1]) == '[1]'  # type: ignore
@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Sized
+
+import pytest
+
+from classes import typeclass
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _ListOfIntMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, int) for list_item in other)
+        )
+
+
+class _ListOfInt(List[int], metaclass=_ListOfIntMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _Measured(object):
+    def __len__(self) -> int:
+        return 0
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(delegate=_ListOfInt)
+def _example_list_int(instance: List[int]) -> str:
+    return 'list of int'
+
+
+@example.instance(delegate=_ListOfStr)
+def _example_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@example.instance(protocol=Sized)
+def _example_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+@typeclass
+def growing(instance) -> str:
+    """Gets new instances with adaptive order enabled."""
+
+
+@growing.instance(protocol=Sized)
+def _growing_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+def _growing_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@contextmanager
+def _adaptive_order(adaptive_typeclass, interval: int) -> Iterator[None]:
+    adaptive_typeclass.set_adaptive_order(interval=interval)
+    yield
+    adaptive_typeclass.set_adaptive_order(None)
+
+
+def _delegate_order(adaptive_typeclass) -> List[type]:
+    adaptive = adaptive_typeclass._adaptive  # noqa: WPS437
+    return [delegate for delegate, _ in adaptive.delegates]
+
+
+def _protocol_order(adaptive_typeclass) -> List[type]:
+    adaptive = adaptive_typeclass._adaptive  # noqa: WPS437
+    return [protocol for protocol, _ in adaptive.protocols]
+
+
+def test_adaptive_delegates() -> None:
+    """Ensures that frequently matched delegates are checked first."""
+    with _adaptive_order(example, interval=4):
+        assert example([1]) == 'list of int'
+        assert _delegate_order(example) == [_ListOfInt, _ListOfStr]
+
+        for _ in range(3):
+            example(['a'])
+        assert _delegate_order(example) == [_ListOfStr, _ListOfInt]
+
+        for _ in range(4):
+            example([1])
+        assert _delegate_order(example) == [_ListOfInt, _ListOfStr]
+
+
+def test_adaptive_explain() -> None:
+    """Ensures that explanations follow the adaptive order."""
+    with _adaptive_order(example, interval=4):
+        assert example([]) == 'sized'
+        explanation = example.explain(['a'])
+    assert explanation.steps[0].candidates == (_ListOfInt,)
+
+
+def test_adaptive_disabled() -> None:
+    """Ensures that registration order is restored."""
+    with _adaptive_order(example, interval=1):
+        assert example(['a']) == 'list of str'
+    assert example._adaptive is None  # noqa: WPS437
+    assert example(['a']) == 'list of str'
+
+
+def test_adaptive_registration() -> None:
+    """Ensures that new instances are picked up and hits are kept."""
+    growing.set_adaptive_order(interval=2)
+    for _ in range(2):
+        assert growing(_Measured()) == 'sized'
+    assert growing.try_call(1) is None
+
+    growing.instance(delegate=_ListOfStr)(_growing_list_str)
+    assert growing(['a']) == 'list of str'
+    assert _protocol_order(growing) == [Sized]
+
+
+def test_invalid_interval() -> None:
+    """Ensures that intervals are validated."""
+    with pytest.raises(ValueError, match='positive'):
+        example.set_adaptive_order(interval=0)
@@ -0,0 +1,108 @@
+import ctypes
+from array import array
+from typing import Sized
+
+import pytest
+
+from classes import typeclass
+
+
+class _Point(ctypes.Structure):
+    _fields_ = [  # noqa: WPS120
+        ('left', ctypes.c_double),
+        ('right', ctypes.c_double),
+    ]
+
+
+def _total_buffer(instance: memoryview, start: float = 0) -> float:
+    return sum(instance, start)
+
+
+def _double_buffer(instance: memoryview, start: float = 0) -> float:
+    for index, number in enumerate(instance):
+        instance[index] = number * 2
+    return -1
+
+
+@typeclass
+def total(instance, start: float = 0) -> float:
+    """Example typeclass."""
+
+
+@total.instance(float, vectorized=_total_buffer)
+def _total_float(instance: float, start: float = 0) -> float:
+    return instance + start
+
+
+@total.instance(int, vectorized=_total_buffer)
+def _total_int(instance: int, start: float = 0) -> float:
+    return instance + start
+
+
+@typeclass
+def double(instance) -> float:
+    """Doubles buffers in place."""
+
+
+@typeclass
+def growing(instance) -> float:
+    """Gets new vectorized instances in tests."""
+
+
+def test_apply_buffer() -> None:
+    """Ensures that buffers are dispatched by their item types."""
+    assert total(1.5) == pytest.approx(1.5)
+    assert total.apply_buffer(array('d', [1.5, 2.5])) == 4
+    assert total.apply_buffer(array('f', [1.5]), start=1) == pytest.approx(
+        2.5,
+    )
+    assert total.apply_buffer(array('q', [1, 2]), 1) == 4
+
+
+def test_apply_buffer_formats() -> None:
+    """Ensures that bytes and other formats are supported and cached."""
+    assert total.apply_buffer(b'\x01\x02') == 3
+    assert total.apply_buffer(memoryview(b'\x01\x00').cast('?')) == 1
+    for buffer_format in ('d', 'f', 'q'):
+        total.apply_buffer(array(buffer_format, [1]))
+    assert total._buffer_cache == {  # noqa: WPS437
+        'd': _total_buffer,
+        'f': _total_buffer,
+        'q': _total_buffer,
+        'B': _total_buffer,
+        '?': _total_buffer,
+    }
+
+
+def test_apply_buffer_is_zero_copy() -> None:
+    """Ensures that implementations get views of the same memory."""
+    numbers = array('d', [1.5, 2])
+    double.instance(float, vectorized=_double_buffer)
+    assert double.apply_buffer(numbers) == -1
+    assert numbers == array('d', [3, 4])
+
+
+def test_apply_buffer_invalidation() -> None:
+    """Ensures that new vectorized instances are picked up."""
+    growing.instance(object, vectorized=len)
+    assert growing.apply_buffer(array('d', [1.5, 2.5])) == 2
+    assert growing.apply_buffer((ctypes.c_double * 3)()) == 3
+
+    growing.instance(float, vectorized=_total_buffer)
+    assert growing.apply_buffer(array('d', [1.5, 2.5])) == 4
+
+
+def test_unsupported_buffers() -> None:
+    """Ensures that unsupported buffers raise."""
+    with pytest.raises(NotImplementedError, match='type: str'):
+        total.apply_buffer(array('u', 'ab'))
+    with pytest.raises(TypeError, match='Buffer format is not supported'):
+        total.apply_buffer((_Point * 2)())
+    with pytest.raises(TypeError):
+        total.apply_buffer([1.5])
+
+
+def test_vectorized_exact_types_only() -> None:
+    """Ensures that vectorized instances are only used with exact types."""
+    with pytest.raises(ValueError, match='only support exact types'):
+        total.instance(protocol=Sized, vectorized=_total_buffer)
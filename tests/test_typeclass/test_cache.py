@@ -1,6 +1,12 @@
+import gc
+import weakref
 from abc import ABCMeta, abstractmethod
+from typing import Callable
+
+import pytest
 
 from classes import typeclass
+from classes._cache import TypeCache
 
 
 @typeclass
@@ -8,6 +14,16 @@ def my_typeclass(instance) -> int:
     """Example typeclass."""
 
 
+@typeclass
+def collected(instance) -> int:
+    """Caches types that are garbage collected."""
+
+
+@collected.instance(object)
+def _collected_object(instance: object) -> int:
+    return 0
+
+
 class _MyABC(object, metaclass=ABCMeta):
     @abstractmethod
     def get_number(self) -> int:
@@ -58,3 +74,52 @@ def test_cached_calls(clear_cache) -> None:
 
         assert my_typeclass(1)
         assert my_typeclass._dispatch_cache  # noqa: WPS437
+
+
+def test_cached_types_are_collected() -> None:
+    """Ensures that cached types can still be garbage collected."""
+    cached = len(collected.dispatch_table())
+    temporary = type('_Temporary', (object,), {})
+    assert collected(temporary()) == 0
+    assert temporary in collected.dispatch_table()
+
+    type_ref = weakref.ref(temporary)
+    del temporary  # noqa: WPS420
+    gc.collect()
+
+    assert type_ref() is None
+    assert len(collected.dispatch_table()) == cached
+    assert len(collected._dispatch_cache._refs) == cached  # noqa: WPS437
+
+
+def test_type_cache() -> None:
+    """Ensures that type cache works like a mapping of types."""
+    type_cache: TypeCache[Callable] = TypeCache()
+    type_cache[int] = _my_int
+
+    assert type_cache[int] is _my_int
+    assert type_cache.get(int) is _my_int
+    assert type_cache.get(str) is None
+    assert len(type_cache) == 1
+    with pytest.raises(KeyError, match='str'):
+        type_cache[str]  # noqa: WPS428
+
+
+def test_type_cache_items() -> None:
+    """Ensures that only alive types are listed."""
+    type_cache: TypeCache[Callable] = TypeCache()
+    type_cache[int] = _my_abc
+    # Entries without weak references are skipped, see `__setitem__`:
+    type_cache.implementations[id(str)] = _my_int
+    assert list(type_cache.items()) == [(int, _my_abc)]
+
+    type_cache.clear()
+    assert not type_cache
+
+
+def test_type_cache_without_weak_references() -> None:
+    """Ensures that failed inserts do not leave any entries."""
+    type_cache: TypeCache[Callable] = TypeCache()
+    with pytest.raises(TypeError, match='weak reference'):
+        type_cache['a'] = _my_int  # type: ignore
+    assert not type_cache.implementations
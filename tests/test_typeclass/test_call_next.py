@@ -0,0 +1,66 @@
+from typing import Sized
+
+import pytest
+
+from classes import typeclass
+
+
+class _MyList(list):  # noqa: WPS600
+    """Example subclass."""
+
+
+@typeclass
+def describe(instance) -> str:
+    """Example typeclass."""
+
+
+@describe.instance(list)
+def _describe_list(instance: list) -> str:
+    return 'list > {0}'.format(describe.call_next(list, instance))
+
+
+@describe.instance(_MyList)
+def _describe_my_list(instance: _MyList) -> str:
+    return 'my list > {0}'.format(describe.call_next(_MyList, instance))
+
+
+@describe.instance(protocol=Sized)
+def _describe_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+@describe.instance(str)
+def _describe_str(instance: str) -> str:
+    return describe.call_next(str, instance)
+
+
+@typeclass
+def rebuilt(instance) -> str:
+    """Gets new instances in tests."""
+
+
+def test_call_next() -> None:
+    """Ensures that the next implementations are called."""
+    assert describe([]) == 'list > sized'
+    assert describe(_MyList()) == 'my list > list > sized'
+    assert describe('a') == 'sized'
+
+
+def test_call_next_errors() -> None:
+    """Ensures that the default implementation is the last one."""
+    with pytest.raises(NotImplementedError, match='type: list'):
+        describe.call_next(Sized, [])
+    with pytest.raises(ValueError, match='Sized is not in the dispatch chain'):
+        describe.call_next(Sized, 1)
+
+
+def test_call_next_invalidation() -> None:
+    """Ensures that chains are rebuilt after new registrations."""
+    rebuilt.register_many({
+        bool: lambda instance: rebuilt.call_next(bool, instance),
+        int: lambda instance: 'int',
+    })
+    assert rebuilt(True) == 'int'  # type: ignore
+
+    rebuilt.register_many({int: lambda instance: 'new int'})
+    assert rebuilt(True) == 'new int'  # type: ignore
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple
+
+import pytest
+from typing_extensions import Protocol, runtime_checkable
+
+from classes._typeclass import _TypeClass  # noqa: WPS450
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _MyInt(int):  # noqa: WPS600
+    """Subclass of a declared field type."""
+
+
+@dataclass
+class _User(object):
+    name: str
+    age: int
+
+
+class _Point(NamedTuple):
+    left: int
+    right: 'List[str]'
+
+
+@dataclass
+class _Broken(object):
+    broken: '_Missing'  # type: ignore  # noqa: F821
+
+
+@dataclass
+class _Empty(object):
+    """Dataclass without fields."""
+
+
+@runtime_checkable
+class _HasName(Protocol):
+    name: str
+
+
+@dataclass
+class _Named(object):
+    named: object
+
+
+def _to_json_float(instance: float, prefix: str = '') -> str:
+    return '{0}float'.format(prefix)
+
+
+def _to_json(instance, prefix: str = '') -> str:
+    """Example typeclass."""
+
+
+def _build_to_json() -> _TypeClass:
+    to_json: _TypeClass = _TypeClass(_to_json)
+    to_json.register_many({
+        int: lambda instance, prefix='': '{0}{1}'.format(prefix, instance),
+        str: lambda instance, prefix='': '"{0}"'.format(instance),
+        list: lambda instance, prefix='': 'list',
+    })
+    return to_json
+
+
+def test_derive_dataclass() -> None:
+    """Ensures that dataclass fields are dispatched."""
+    to_json = _build_to_json()
+    assert to_json.derive(_User) is _User
+
+    assert to_json(_User('a', 1)) == {'name': '"a"', 'age': '1'}
+    assert to_json(_User('a', 1), '#') == {'name': '"a"', 'age': '#1'}
+    assert to_json(_User('a', _MyInt(2))) == {'name': '"a"', 'age': '2'}
+
+
+def test_derive_named_tuple() -> None:
+    """Ensures that named tuples and not-class annotations work."""
+    to_json = _build_to_json()
+    to_json.derive(_Point, combine=tuple)
+
+    assert to_json(_Point(1, ['a'])) == ('left', 'right')
+    assert to_json.derive(combine=list)(_Empty) is _Empty
+    assert not to_json(_Empty())
+
+
+def test_derive_names() -> None:
+    """Ensures that generated functions are readable in tracebacks."""
+    to_json = _build_to_json()
+    to_json.derive(_User)
+
+    walker = to_json._exact_types[_User]  # noqa: WPS437
+    assert walker.__name__ == 'derived__User'
+    assert walker.__qualname__ == (
+        '<derived _to_json for _User>'
+    )
+
+
+def test_derive_unresolved_annotations() -> None:
+    """Ensures that broken forward references are dispatched by values."""
+    to_json = _build_to_json()
+    to_json.derive(_Broken)
+    assert to_json(_Broken(1)) == {'broken': '1'}
+
+
+def test_derive_invalidation() -> None:
+    """Ensures that new registrations are used by derived instances."""
+    to_json = _build_to_json()
+    to_json.derive(_User)
+    assert to_json(_User('a', 1)) == {'name': '"a"', 'age': '1'}
+
+    to_json.instance(int, impl=_to_json_float)
+    assert to_json(_User('a', 1)) == {'name': '"a"', 'age': 'float'}
+
+
+def test_derive_overrides_and_delegates() -> None:
+    """Ensures that overrides and delegates are respected."""
+    to_json = _build_to_json()
+    to_json.derive(_User)
+    to_json.derive(_Point)
+
+    with to_json.override(int, _to_json_float):
+        assert to_json(_User('a', 1)) == {'name': '"a"', 'age': 'float'}
+    assert to_json(_User('a', 1)) == {'name': '"a"', 'age': '1'}
+
+    to_json.instance(
+        delegate=_ListOfStr,
+        impl=lambda instance, prefix='': 'strs',
+    )
+    assert to_json(_Point(1, ['a'])) == {'left': '1', 'right': 'strs'}
+
+
+def test_derive_protocol_fields() -> None:
+    """Ensures that data protocols are dispatched by values."""
+    to_json = _build_to_json()
+    to_json.instance(
+        protocol=_HasName,
+        impl=lambda instance, prefix='': 'named',
+    )
+    to_json.instance(float, impl=_to_json_float)
+    to_json.derive(_Named)
+    assert to_json(_Named(1.5)) == {'named': 'float'}
+    assert to_json(_Named(_User('a', 1))) == {'named': 'named'}
+
+
+def test_derive_invalid_type() -> None:
+    """Ensures that only dataclasses and named tuples are supported."""
+    to_json = _build_to_json()
+    with pytest.raises(TypeError, match='tuple is not a dataclass'):
+        to_json.derive(tuple)
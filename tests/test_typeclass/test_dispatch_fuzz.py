@@ -0,0 +1,310 @@
+"""
+Differential tests of our dispatch against a simple reference resolver.
+
+We generate random class hierarchies, ``abc`` registrations,
+and sequences of instance registrations and calls.
+Then each call is resolved by both and the results must be the same.
+The reference resolver uses the documented order:
+delegates, exact types, protocols, and then ``mro`` via ``singledispatch``.
+"""
+
+import abc
+import random
+from contextlib import suppress
+from functools import singledispatch
+from itertools import count
+from time import perf_counter_ns
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+from typing_extensions import Final, Protocol, runtime_checkable
+
+from classes._snapshots import TypeClassSnapshot
+from classes._typeclass import _TypeClass  # noqa: WPS450
+
+#: Returns an outcome of a call: a result or an exception type.
+_Outcome = Tuple[str, object]
+
+_METHODS = ('first', 'second', 'third')
+_TAGS = (None, 'a', 'b')
+
+
+@runtime_checkable
+class _HasFirst(Protocol):
+    def first(self) -> None:
+        """Example protocol member."""
+
+
+@runtime_checkable
+class _HasSecond(Protocol):
+    def second(self) -> None:
+        """Example protocol member."""
+
+
+@runtime_checkable
+class _HasFirstAndThird(Protocol):
+    def first(self) -> None:
+        """Example protocol member."""
+
+    def third(self) -> None:
+        """Example protocol member."""
+
+
+class _TaggedMeta(type):
+    delegate_tag: Optional[str]
+
+    def __instancecheck__(cls, other) -> bool:
+        return getattr(other, 'tag', None) == cls.delegate_tag
+
+
+class _TaggedA(object, metaclass=_TaggedMeta):
+    delegate_tag = 'a'
+
+
+class _TaggedB(object, metaclass=_TaggedMeta):
+    delegate_tag = 'b'
+
+
+class _Reference(object):
+    """Resolves implementations without any caches or optimizations."""
+
+    def __init__(self) -> None:
+        self.delegates: Dict[type, Callable] = {}
+        self.exact_types: Dict[type, Callable] = {}
+        self.protocols: Dict[type, Callable] = {}
+
+    def copy(self) -> '_Reference':
+        reference = _Reference()
+        reference.delegates.update(self.delegates)
+        reference.exact_types.update(self.exact_types)
+        reference.protocols.update(self.protocols)
+        return reference
+
+    def resolve(self, instance) -> Callable:
+        registered = self._resolve_registered(instance)
+        if registered is not None:
+            return registered
+
+        mro_dispatch = singledispatch(_missing)
+        for exact_type, impl in self.exact_types.items():
+            mro_dispatch.register(exact_type, impl)
+        return mro_dispatch.dispatch(type(instance))
+
+    def _resolve_registered(self, instance) -> Optional[Callable]:
+        for delegate, delegate_impl in self.delegates.items():
+            if isinstance(instance, delegate):
+                return delegate_impl
+
+        exact_impl = self.exact_types.get(type(instance))
+        if exact_impl is not None:
+            return exact_impl
+
+        for protocol, protocol_impl in self.protocols.items():
+            if isinstance(instance, protocol):
+                return protocol_impl
+        return None
+
+
+class _Fuzzer(object):
+    """Runs random actions with our typeclass and the reference resolver."""
+
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)  # noqa: S311
+        abcs = _generate_abcs(self.rng)
+        self.classes = _generate_classes(self.rng, abcs)
+        self.registered_types = [*self.classes, *abcs, object]
+        self.example: _TypeClass = _TypeClass(_example)
+        self.reference = _Reference()
+        self.snapshots: List[Tuple[TypeClassSnapshot, _Reference]] = []
+        self._seed = seed
+        self._labels = count()
+        self._elapsed_ns = [0, 0]
+
+    def run(self, steps: int) -> Tuple[int, int]:
+        """Returns time spent in our typeclass and in the reference."""
+        actions = list(_ACTIONS)
+        weights = list(_ACTIONS.values())
+        for _ in range(steps):
+            self.rng.choices(actions, weights=weights)[0](self)
+        return self._elapsed_ns[0], self._elapsed_ns[1]
+
+    def new_implementation(self) -> Callable[[object], str]:
+        return _implementation('impl{0}'.format(next(self._labels)))
+
+    def new_instance(self) -> object:
+        instance = self.rng.choice(self.classes)()
+        tag = self.rng.choice(_TAGS)
+        if tag is not None:
+            instance.tag = tag
+        return instance
+
+    def compare(
+        self,
+        production: Callable[[], object],
+        expected: Callable[[], object],
+    ) -> None:
+        started = perf_counter_ns()
+        production_outcome = _outcome(production)
+        resolved = perf_counter_ns()
+        reference_outcome = _outcome(expected)
+        self._elapsed_ns[0] += resolved - started
+        self._elapsed_ns[1] += perf_counter_ns() - resolved
+        assert production_outcome == reference_outcome, self._seed
+
+
+def _example(instance) -> str:
+    """Example typeclass."""
+
+
+def _missing(instance) -> str:
+    raise NotImplementedError(instance)
+
+
+def _method(self) -> None:
+    """Protocol members of generated classes."""
+
+
+def _implementation(label: str) -> Callable[[object], str]:
+    def factory(instance) -> str:
+        return label
+    return factory
+
+
+def _outcome(callback: Callable[[], object]) -> _Outcome:
+    try:
+        return 'result', callback()
+    except RuntimeError as exc:  # not implemented or ambiguous `mro`
+        return 'error', type(exc)
+
+
+def _chance(rng: random.Random, percent: int) -> bool:
+    return rng.randrange(100) < percent
+
+
+def _generate_abcs(rng: random.Random) -> List[abc.ABCMeta]:
+    abcs: List[abc.ABCMeta] = []
+    for abc_index in range(rng.randint(1, 3)):
+        abc_base = rng.choice(abcs) if abcs else abc.ABC
+        abcs.append(abc.ABCMeta('Abc{0}'.format(abc_index), (abc_base,), {}))
+    return abcs
+
+
+def _generate_classes(
+    rng: random.Random,
+    abcs: List[abc.ABCMeta],
+) -> List[type]:
+    classes: List[type] = []
+    for class_index in range(rng.randint(3, 10)):
+        candidates: List[type] = [*classes, *abcs]
+        bases = rng.sample(candidates, min(rng.randint(0, 2), len(candidates)))
+        classes.append(
+            _generate_class(rng, 'Class{0}'.format(class_index), bases),
+        )
+
+    for abc_type in abcs:
+        if _chance(rng, 50):
+            with suppress(RuntimeError):  # inheritance cycles
+                abc_type.register(rng.choice(classes))
+    return classes
+
+
+def _generate_class(
+    rng: random.Random,
+    class_name: str,
+    bases: Sequence[type],
+) -> type:
+    namespace = {
+        method_name: _method
+        for method_name in _METHODS
+        if _chance(rng, 30)
+    }
+    try:
+        return type(class_name, tuple(bases), namespace)
+    except TypeError:  # invalid `mro` or metaclass conflict
+        return type(class_name, (), namespace)
+
+
+def _register_exact_type(fuzzer: _Fuzzer) -> None:
+    exact_type = fuzzer.rng.choice(fuzzer.registered_types)
+    impl = fuzzer.new_implementation()
+    if _chance(fuzzer.rng, 50):
+        fuzzer.example.instance(exact_type, impl=impl)
+    else:
+        fuzzer.example.register_many({exact_type: impl})
+    fuzzer.reference.exact_types[exact_type] = impl
+
+
+def _register_protocol(fuzzer: _Fuzzer) -> None:
+    protocol = fuzzer.rng.choice([_HasFirst, _HasSecond, _HasFirstAndThird])
+    impl = fuzzer.new_implementation()
+    fuzzer.example.instance(protocol=protocol, impl=impl)
+    fuzzer.reference.protocols[protocol] = impl
+
+
+def _register_delegate(fuzzer: _Fuzzer) -> None:
+    delegate = fuzzer.rng.choice([_TaggedA, _TaggedB])
+    impl = fuzzer.new_implementation()
+    fuzzer.example.instance(delegate=delegate, impl=impl)
+    fuzzer.reference.delegates[delegate] = impl
+
+
+def _warm(fuzzer: _Fuzzer) -> None:
+    warmed = fuzzer.rng.sample(
+        fuzzer.classes,
+        fuzzer.rng.randint(1, len(fuzzer.classes)),
+    )
+    fuzzer.compare(
+        lambda: fuzzer.example.warm(warmed),
+        lambda: None,  # ambiguous types are skipped
+    )
+
+
+def _snapshot(fuzzer: _Fuzzer) -> None:
+    fuzzer.snapshots.append(
+        (fuzzer.example.snapshot(), fuzzer.reference.copy()),
+    )
+
+
+def _restore(fuzzer: _Fuzzer) -> None:
+    if fuzzer.snapshots:
+        snapshot, saved_reference = fuzzer.rng.choice(fuzzer.snapshots)
+        fuzzer.example.restore(snapshot)
+        fuzzer.reference = saved_reference.copy()
+
+
+def _supports(fuzzer: _Fuzzer) -> None:
+    instance = fuzzer.new_instance()
+    fuzzer.compare(
+        lambda: fuzzer.example.supports(instance),
+        lambda: fuzzer.reference.resolve(instance) is not _missing,
+    )
+
+
+def _call(fuzzer: _Fuzzer) -> None:
+    instance = fuzzer.new_instance()
+    fuzzer.compare(
+        lambda: fuzzer.example(instance),
+        lambda: fuzzer.reference.resolve(instance)(instance),
+    )
+
+
+#: Actions of each step with their weights.
+_ACTIONS: Final = MappingProxyType({
+    _register_exact_type: 15,
+    _register_protocol: 5,
+    _register_delegate: 3,
+    _warm: 7,
+    _snapshot: 3,
+    _restore: 3,
+    _supports: 14,
+    _call: 50,
+})
+
+
+@pytest.mark.parametrize('seed', range(1000))
+def test_dispatch_fuzz(seed: int, record_property) -> None:
+    """Ensures that dispatch results match the reference resolver."""
+    production_ns, reference_ns = _Fuzzer(seed).run(steps=300)
+    record_property('production_ns', production_ns)
+    record_property('reference_ns', reference_ns)
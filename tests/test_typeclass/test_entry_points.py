@@ -0,0 +1,90 @@
+import sys
+from typing import Iterator
+
+import pytest
+
+from classes import typeclass
+
+_ENTRY_POINTS = """
+[{group}]
+{module}.{qualname} = {plugin}:example_base
+"""
+
+_PLUGIN_MODULE = 'classes_example_plugin'
+
+_PLUGIN = """
+def example_base(instance):
+    return 'plugin'
+"""
+
+
+class _Base(object):
+    """Example type that is only supported by a plugin."""
+
+
+class _Child(_Base):
+    """Example subtype."""
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(int)
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+@pytest.fixture(autouse=True)
+def _plugin(install_plugin) -> Iterator[None]:
+    """Installs a package that declares an instance for ``_Base``."""
+    install_plugin(
+        _PLUGIN_MODULE,
+        _ENTRY_POINTS.format(
+            group='{0}.example'.format(__name__),
+            module=__name__,
+            qualname=_Base.__qualname__,
+            plugin=_PLUGIN_MODULE,
+        ),
+        _PLUGIN,
+    )
+    snapshot = example.snapshot()
+    yield
+    example.restore(snapshot)
+    example._entry_points = None  # noqa: WPS437
+    sys.modules.pop(_PLUGIN_MODULE, None)
+
+
+def test_discover_lazily() -> None:
+    """Ensures that plugins are not imported before dispatch misses."""
+    assert not example.supports(_Child())
+    example.discover_instances()
+    assert example(1) == 'int'
+    assert _PLUGIN_MODULE not in sys.modules
+
+
+def test_discover_on_miss() -> None:
+    """Ensures that plugins are found and imported on dispatch misses."""
+    example.discover_instances()
+    assert [
+        example(_Child()),  # type: ignore
+        example(_Base()),  # type: ignore
+    ] == ['plugin', 'plugin']
+    assert _PLUGIN_MODULE in sys.modules
+    assert _Base in example.dispatch_table()
+
+
+def test_discover_types() -> None:
+    """Ensures that dispatch by type finds plugins as well."""
+    example.discover_instances()
+    example.warm([_Child])
+    assert example.dispatch_table()[_Child] is not None
+    assert not example.supports('a')
+    assert _PLUGIN_MODULE not in sys.modules
+
+
+def test_other_group() -> None:
+    """Ensures that only the given entry point group is used."""
+    example.discover_instances('other.group')
+    assert not example.supports(_Base())
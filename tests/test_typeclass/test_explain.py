@@ -0,0 +1,193 @@
+import re
+from abc import ABCMeta, abstractmethod
+from typing import List, Sized
+
+import pytest
+from typing_extensions import Protocol, runtime_checkable
+
+from classes import typeclass
+from classes._explain import DispatchStep
+
+
+@runtime_checkable
+class _WithField(Protocol):
+    field: str
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _First(object, metaclass=ABCMeta):
+    @abstractmethod
+    def first(self) -> None:
+        """Example abstract method."""
+
+
+class _Second(object, metaclass=ABCMeta):
+    @abstractmethod
+    def second(self) -> None:
+        """Example abstract method."""
+
+
+class _Both(object):
+    """Virtual subclass of two unrelated bases."""
+
+
+_First.register(_Both)
+_Second.register(_Both)
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(delegate=_ListOfStr)
+def _example_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@example.instance(object)
+def _example_object(instance: object) -> str:
+    return 'object'
+
+
+@typeclass
+def tabled(instance) -> str:
+    """Typeclass for dispatch tables."""
+
+
+@tabled.instance(int)
+def _tabled_int(instance: int) -> str:
+    return 'int'
+
+
+@example.instance(protocol=_WithField)
+def _example_with_field(instance: _WithField) -> str:
+    return 'with field'
+
+
+@example.instance(protocol=Sized)
+def _example_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+@typeclass
+def ambiguous(instance) -> str:
+    """Typeclass for unrelated virtual bases."""
+
+
+@ambiguous.instance(_First)
+def _ambiguous_first(instance: _First) -> str:
+    return 'first'
+
+
+@ambiguous.instance(_Second)
+def _ambiguous_second(instance: _Second) -> str:
+    return 'second'
+
+
+@typeclass
+def missing(instance) -> str:
+    """Typeclass without instances."""
+
+
+def _kinds(steps) -> List[str]:
+    return [step.kind for step in steps]
+
+
+def test_explain_delegate(clear_cache) -> None:
+    """Ensures that delegates are explained and never cached."""
+    with clear_cache(example):
+        example(['a'])
+        explanation = example.explain(['a'])
+
+    assert explanation.implementation is _example_list_str
+    assert explanation.cached is False
+    assert explanation.steps == (
+        DispatchStep(
+            kind='delegate',
+            candidates=(_ListOfStr,),
+            matched=_ListOfStr,
+            elapsed_ns=explanation.steps[0].elapsed_ns,
+        ),
+    )
+
+
+def test_explain_protocol(clear_cache) -> None:
+    """Ensures that protocols are explained after the cache."""
+    with clear_cache(example):
+        assert example([]) == 'sized'
+        explanation = example.explain([])
+
+    assert explanation.implementation is _example_sized
+    assert explanation.cached is True
+    assert _kinds(explanation.steps) == [
+        'delegate', 'cache', 'exact_type', 'protocol', 'protocol',
+    ]
+    assert explanation.steps[-1].matched is Sized
+
+
+def test_explain_type(clear_cache) -> None:
+    """Ensures that types can be explained without instances."""
+    with clear_cache(example):
+        explanation = example.explain(int)
+
+    assert explanation.instance_type is int
+    assert explanation.implementation is _example_object
+    assert _kinds(explanation.steps) == [
+        'cache', 'exact_type', 'protocol', 'protocol', 'mro',
+    ]
+    assert explanation.steps[-1].candidates == (object,)
+
+
+def test_explain_miss() -> None:
+    """Ensures that misses are explained."""
+    explanation = missing.explain(1)
+    assert explanation.implementation is None
+    assert explanation.steps[-1] == DispatchStep(
+        kind='mro',
+        candidates=(),
+        matched=None,
+        elapsed_ns=explanation.steps[-1].elapsed_ns,
+    )
+
+
+def test_explain_override(clear_cache) -> None:
+    """Ensures that overrides are explained."""
+    with clear_cache(example):
+        with example.override(int, _example_sized):
+            assert example(1) == 'sized'
+            explanation = example.explain(1)
+
+    assert explanation.implementation is _example_sized
+    assert explanation.cached is True
+    assert not example.dispatch_table()
+
+
+def test_dispatch_table(clear_cache) -> None:
+    """Ensures that dispatch table is exported."""
+    with clear_cache(tabled):
+        tabled.try_call(1)
+        tabled.try_call('a')
+        assert tabled.dispatch_table() == {int: _tabled_int, str: None}
+
+
+def test_explain_ambiguous() -> None:
+    """Ensures that ambiguous dispatch is explained as an error."""
+    explanation = ambiguous.explain(_Both())
+    assert explanation.implementation is None
+    assert explanation.steps[-1].matched is None
+    assert explanation.error is not None
+    with pytest.raises(RuntimeError, match=re.escape(explanation.error)):
+        ambiguous(_Both())  # type: ignore
@@ -0,0 +1,73 @@
+from typing import List
+
+import pytest
+
+from classes import typeclass
+
+
+@typeclass
+def to_json(instance) -> str:
+    """Example typeclass."""
+
+
+@to_json.instance(int)
+def _to_json_int(instance: int) -> str:
+    return str(instance)
+
+
+@to_json.instance(list)
+def _to_json_list(instance: list):
+    elements: List[str] = []
+    for element in instance:
+        elements.append((yield element))
+    return '[{0}]'.format(', '.join(elements))
+
+
+@to_json.instance(dict)
+def _to_json_dict(instance: dict):
+    item_values: List[str] = []
+    try:
+        for item_value in instance.values():
+            item_values.append((yield item_value))
+    except NotImplementedError:
+        return 'null'
+    return '{{{0}}}'.format(', '.join(
+        '"{0}": {1}'.format(item_key, encoded)
+        for item_key, encoded in zip(instance, item_values)
+    ))
+
+
+@to_json.instance(tuple)
+def _to_json_tuple(instance: tuple):
+    yield instance[0]
+    raise ValueError('Tuples are not supported')
+
+
+def test_fold_leaf() -> None:
+    """Ensures that regular instances are just called."""
+    assert to_json.fold(1) == '1'
+
+
+def test_fold_nested() -> None:
+    """Ensures that results are passed to parents."""
+    assert to_json.fold([1, [2, {'a': 3}], []]) == '[1, [2, {"a": 3}], []]'
+
+
+def test_fold_deep() -> None:
+    """Ensures that deep structures do not hit the recursion limit."""
+    nested: list = [1]
+    for _ in range(50000):
+        nested = [nested]
+
+    assert to_json.fold(nested) == '{0}1{1}'.format('[' * 50001, ']' * 50001)
+
+
+def test_fold_errors() -> None:
+    """Ensures that errors are raised inside parents."""
+    assert to_json.fold([{'a': 1, 'b': None}]) == '[null]'
+    assert to_json.fold([{'a': [None]}]) == '[null]'
+
+    with pytest.raises(NotImplementedError):
+        to_json.fold([1, [None]])
+    with pytest.raises(ValueError, match='Tuples'):
+        to_json.fold([[(1,)]])
@@ -0,0 +1,74 @@
+from typing import Generic, List, TypeVar
+
+import pytest
+
+from classes import typeclass
+
+_ItemType = TypeVar('_ItemType')
+
+
+class _Box(Generic[_ItemType]):
+    """Example user generic."""
+
+
+class _Proxy(object):
+    """Returns the same value for all attributes."""
+
+    def __init__(self, attribute_value: object) -> None:
+        self._attribute_value = attribute_value
+
+    def __getattr__(self, attribute_name: str) -> object:
+        return self._attribute_value
+
+
+@typeclass
+def unbox(instance) -> str:
+    """Example typeclass."""
+
+
+@unbox.instance(delegate=_Box[int])
+def _unbox_box_int(instance: _Box[int]) -> str:
+    return 'int'
+
+
+@unbox.instance(_Box)
+def _unbox_box(instance: _Box) -> str:
+    return 'box'
+
+
+def test_generic_alias_dispatch() -> None:
+    """Ensures that instances are matched by their generic aliases."""
+    unbox.instance(delegate=_Box[str], impl='builtins:repr', memoize=True)
+
+    assert unbox(_Box[int]()) == 'int'
+    assert unbox(_Box[str]()).startswith('<')
+    assert unbox(_Box[float]()) == 'box'
+    assert unbox(_Box()) == 'box'
+    assert unbox.map_items([_Box[int](), _Box()]) == ['int', 'box']
+
+
+def test_generic_alias_supports() -> None:
+    """Ensures that generic aliases are not stored as delegates."""
+    assert unbox.supports(_Box[int]())
+    assert not unbox.supports(1)
+    assert not unbox._delegates  # noqa: WPS437
+
+
+def test_generic_alias_explain() -> None:
+    """Ensures that generic aliases are explained."""
+    assert unbox.explain(_Box[int]()).steps[0].matched == _Box[int]
+    assert unbox.explain(_Box[float]()).steps[0].matched is None
+    assert unbox.explain(_Box()).steps[0].kind == 'cache'
+
+
+@pytest.mark.parametrize('orig_class', ['a', [], _Box[int]])
+def test_foreign_orig_class(orig_class: object) -> None:
+    """Ensures that only generic aliases of instance types are used."""
+    assert not unbox.supports(_Proxy(orig_class))
+    assert unbox.explain(_Proxy(orig_class)).implementation is None
+
+
+def test_builtin_generic_delegates() -> None:
+    """Ensures that builtin generics are still rejected."""
+    with pytest.raises(TypeError):
+        unbox.instance(delegate=List[int], impl=_unbox_box)  # type: ignore
@@ -0,0 +1,95 @@
+import sys
+from typing import Sized
+
+import pytest
+
+from classes import typeclass
+
+
+@typeclass
+def regular(instance) -> int:
+    """Example typeclass."""
+
+
+@typeclass
+def lazy_exact(instance, other: int) -> int:
+    """Gets a lazy instance for ``int``."""
+
+
+@typeclass
+def lazy_replaced(instance, other: int) -> int:
+    """Gets a lazy instance for ``int`` that is replaced when imported."""
+
+
+@typeclass
+def lazy_protocol(instance, other: int) -> int:
+    """Gets a lazy instance for ``Sized`` protocol."""
+
+
+@typeclass
+def not_callable(instance) -> int:
+    """Gets an instance that is not callable."""
+
+
+def _regular_int(instance: int) -> int:
+    return abs(instance)
+
+
+def test_lazy_import(lazy_module: str) -> None:
+    """Ensures that implementations are imported on the first dispatch."""
+    lazy = lazy_exact.instance(int, impl='{0}.lazy_int'.format(lazy_module))
+    assert repr(lazy) == '<lazy implementation "{0}.lazy_int">'.format(
+        lazy_module,
+    )
+    assert lazy_exact.supports(1) is True
+    assert lazy_module not in sys.modules
+    assert lazy_exact(1, 2) == 3  # type: ignore
+    assert lazy_module in sys.modules
+
+
+def test_lazy_replaced(lazy_module: str) -> None:
+    """Ensures that imported implementations replace lazy ones."""
+    lazy = lazy_replaced.instance(
+        int,
+        impl='{0}.lazy_int'.format(lazy_module),
+    )
+    assert lazy_replaced(1, 3) == 4  # type: ignore
+    assert lazy_replaced._exact_types[int] is not lazy  # noqa: WPS437
+    assert lazy_replaced._dispatch_cache[int] is not lazy  # noqa: WPS437
+    assert lazy(1, 4) == 5
+
+
+def test_lazy_protocol(lazy_module: str) -> None:
+    """Ensures that protocols can have lazy implementations."""
+    lazy_protocol.instance(
+        protocol=Sized,
+        impl='{0}:Lazy.sized'.format(lazy_module),
+    )
+    assert lazy_protocol([1], 1) == 2  # type: ignore
+    assert lazy_protocol._dispatch_cache[list] is (  # noqa: WPS437
+        lazy_protocol._protocols[Sized]  # noqa: WPS437
+    )
+
+
+def test_regular_impl() -> None:
+    """Ensures that callables can be registered without decorators."""
+    assert regular.instance(int, impl=_regular_int) is _regular_int
+    assert regular(-1) == 1
+
+
+@pytest.mark.parametrize('import_path', [
+    'module',
+    'module:',
+    ':name',
+])
+def test_invalid_import_path(import_path: str) -> None:
+    """Ensures that import paths are validated on registration."""
+    with pytest.raises(ValueError, match='Invalid implementation import path'):
+        regular.instance(str, impl=import_path)
+
+
+def test_not_callable_import(lazy_module: str) -> None:
+    """Ensures that imported objects must be callable."""
+    not_callable.instance(int, impl='{0}.not_callable'.format(lazy_module))
+    with pytest.raises(TypeError, match='not_callable is not callable'):
+        not_callable(1)  # type: ignore
@@ -0,0 +1,190 @@
+import gc
+from typing import List
+
+import pytest
+
+from classes import typeclass
+from classes._memo import _remover  # noqa: WPS450
+from classes._memo import MemoizedImplementation, MemoStats
+
+
+class _Config(object):
+    """Unhashable, but identity-stable."""
+
+    __hash__ = None  # type: ignore
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+_lru_calls: List[object] = []
+_unhashable_calls: List[object] = []
+_weak_calls: List[object] = []
+
+
+@typeclass
+def lru_example(instance, suffix: str = '') -> str:
+    """Caches results in a LRU cache."""
+
+
+@lru_example.instance(int, memoize=2)
+def _lru_example_int(instance: int, suffix: str = '') -> str:
+    _lru_calls.append(instance)
+    return str(instance) + suffix
+
+
+@typeclass
+def unhashable_example(instance, extra=None) -> int:
+    """Gets unhashable arguments."""
+
+
+@unhashable_example.instance(object, memoize=True)
+def _unhashable_example_object(instance: object, extra=None) -> int:
+    _unhashable_calls.append(instance)
+    return 1
+
+
+@typeclass
+def weak_example(instance, suffix: str = '') -> str:
+    """Caches results by instance identity."""
+
+
+@weak_example.instance(object, memoize='weak')
+def _weak_example_object(instance: object, suffix: str = '') -> str:
+    _weak_calls.append(instance)
+    return 'object{0}'.format(suffix)
+
+
+@typeclass
+def growing(instance) -> str:
+    """Gets new instances after results are cached."""
+
+
+@growing.instance(object, memoize=True)
+def _growing_object(instance: object) -> str:
+    return 'object'
+
+
+@growing.instance(_Config, memoize='weak')
+def _growing_config(instance: _Config) -> str:
+    return 'config'
+
+
+def _growing_int(instance: int) -> str:
+    return 'int'
+
+
+@typeclass
+def not_memoized(instance) -> str:
+    """Does not cache anything."""
+
+
+@not_memoized.instance(int, memoize=False)
+def _not_memoized_int(instance: int) -> str:
+    return 'int'
+
+
+@typeclass
+def replaced(instance) -> str:
+    """Gets memoized instances replaced."""
+
+
+def test_lru_memoize() -> None:
+    """Ensures that results are cached by hashable instances and args."""
+    assert [
+        lru_example(1),
+        lru_example(1),
+        lru_example(1, suffix='!'),
+        lru_example(2),
+        lru_example(1),
+    ] == ['1', '1', '1!', '2', '1']
+    assert _lru_calls == [1, 1, 2, 1]
+    assert lru_example.memo_stats() == {
+        int: MemoStats(hits=1, misses=4, evictions=2, size=2),
+    }
+
+
+def test_unhashable_arguments() -> None:
+    """Ensures that unhashable values are not cached."""
+    assert unhashable_example([]) == 1
+    assert unhashable_example([]) == 1
+    assert unhashable_example(1, extra=[]) == 1
+    assert len(_unhashable_calls) == 3
+    assert unhashable_example.memo_stats()[object].size == 0
+
+
+def test_weak_memoize() -> None:
+    """Ensures that weak caches use identity and drop dead instances."""
+    config = _Config('a')
+    assert [
+        weak_example(config),
+        weak_example(config),
+        weak_example(config, '!'),
+        weak_example(1),
+    ] == ['object', 'object', 'object!', 'object']
+    assert _weak_calls == [config, config, 1]
+    assert weak_example.memo_stats()[object] == MemoStats(
+        hits=1, misses=2, evictions=0, size=2,
+    )
+
+    _weak_calls.clear()
+    del config  # noqa: WPS420
+    gc.collect()
+    assert weak_example.memo_stats()[object] == MemoStats(
+        hits=1, misses=2, evictions=2, size=0,
+    )
+
+
+def test_dead_memoized_implementation() -> None:
+    """Ensures that callbacks do not keep memoized instances alive."""
+    memoized = MemoizedImplementation(str, 'weak')
+    callback = _remover(memoized, 1)
+    assert callback(None) is None  # type: ignore
+    assert memoized.stats().evictions == 0
+
+    del memoized  # noqa: WPS420
+    gc.collect()
+
+    assert callback(None) is None  # type: ignore
+
+
+def test_invalidation() -> None:
+    """Ensures that new registrations clear cached results."""
+    config = _Config('a')
+    assert growing(1) == 'object'
+    assert growing(config) == 'config'
+
+    growing.instance(int)(_growing_int)
+    assert growing(1) == 'int'
+    assert {
+        typ: stats.size
+        for typ, stats in growing.memo_stats().items()
+    } == {object: 0, _Config: 0}
+    assert repr(growing._exact_types[object]).startswith(  # noqa: WPS437
+        '<memoized <function',
+    )
+
+
+def test_memoize_disabled() -> None:
+    """Ensures that `False` disables memoization."""
+    assert not_memoized(1) == 'int'
+    assert not not_memoized.memo_stats()
+
+
+@pytest.mark.parametrize('memoize', [0, -1, 'strong'])
+def test_invalid_option(memoize) -> None:
+    """Ensures that invalid options are rejected."""
+    with pytest.raises(ValueError, match='Invalid memoize option'):
+        not_memoized.instance(int, impl=_not_memoized_int, memoize=memoize)
+
+
+def test_replaced_memoized_implementation() -> None:
+    """Ensures that replaced memoized instances are not cleared anymore."""
+    replaced.instance(int, impl=_growing_int, memoize=True)
+    previous = replaced._exact_types[int]  # noqa: WPS437
+    assert replaced(1) == 'int'
+
+    replaced.instance(int, impl=_growing_int, memoize=True)
+    replaced.instance(str, impl=str)
+    assert previous.stats().size == 1  # type: ignore
+    assert replaced.memo_stats()[int].size == 0
@@ -0,0 +1,144 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import List
+
+from classes import typeclass
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+class _MyInt(int):  # noqa: WPS600
+    """We use it to test mro."""
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(int)
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+@example.instance(delegate=_ListOfStr)
+def _example_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@typeclass
+def growing(instance) -> str:
+    """Gets new instances while overrides are active."""
+
+
+def _growing_str(instance: str) -> str:
+    return 'nested'
+
+
+def _override(instance) -> str:
+    return 'override'
+
+
+def _nested(instance) -> str:
+    return 'nested'
+
+
+def test_override_keeps_global_cache(clear_cache) -> None:
+    """Ensures that overrides do not touch the global cache."""
+    with clear_cache(example):
+        assert example(1) == 'int'
+        with example.override(int, _override):
+            assert example(1) == 'override'
+            assert example(_MyInt(1)) == 'override'
+        assert example._dispatch_cache[int] is _example_int  # noqa: WPS437
+        assert _MyInt not in example._dispatch_cache  # noqa: WPS437
+
+
+def test_override_supports(clear_cache) -> None:
+    """Ensures that overrides are used by other ways to call instances."""
+    with clear_cache(example):
+        with example.override(int, _override):
+            assert example.supports(2) is True
+            assert example.try_call(2) == 'override'
+        assert example.try_call(2) == 'int'
+
+
+def test_override_new_types(clear_cache) -> None:
+    """Ensures that overrides can add new types and keep delegates."""
+    with clear_cache(example):
+        with example.override(list, _override):
+            assert example([]) == 'override'
+            assert example(['a']) == 'list of str'
+            assert example.supports('a') is False
+            assert example.try_call('a') is None
+        assert example.supports([]) is False
+
+
+def test_override_nested(clear_cache) -> None:
+    """Ensures that nested overrides take priority."""
+    with clear_cache(example):
+        with example.override(int, _override):
+            with example.override(str, _nested):
+                assert example(1) == 'override'
+                assert example('a') == 'nested'  # type: ignore
+            with example.override(int, _nested):
+                assert example(1) == 'nested'
+            assert example(1) == 'override'
+        assert example._overrides_active == 0  # noqa: WPS437
+
+
+def test_override_sees_new_instances(clear_cache) -> None:
+    """Ensures that instances registered during override are visible."""
+    with clear_cache(growing):
+        with growing.override(int, _override):
+            assert growing.supports('a') is False
+            growing.instance(str)(_growing_str)
+            assert growing('a') == 'nested'
+            assert growing(1) == 'override'  # type: ignore
+
+
+def test_override_is_isolated(clear_cache) -> None:
+    """Ensures that concurrent overrides do not leak into each other."""
+    barrier = Barrier(2)
+
+    def factory(implementation) -> str:
+        with example.override(int, implementation):
+            barrier.wait()
+            return example(1)
+
+    with clear_cache(example):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dispatched = list(executor.map(factory, [_override, _nested]))
+    assert dispatched == ['override', 'nested']
+
+
+def test_override_other_context(clear_cache) -> None:
+    """Ensures that overrides from other contexts are ignored."""
+    barrier = Barrier(2)
+
+    def factory() -> None:
+        with example.override(int, _override):
+            barrier.wait()
+            barrier.wait()
+
+    with clear_cache(example):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(factory)
+            barrier.wait()
+            assert example._overrides_active == 1  # noqa: WPS437
+            assert example(2) == 'int'
+            assert example.supports(2) is True
+            assert example.try_call('a') is None
+            barrier.wait()
+            future.result()
@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple
+
+import pytest
+
+from classes import typeclass
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+@dataclass
+class _User(object):
+    name: object
+    age: object
+
+
+class _Point(NamedTuple):
+    left: object
+    right: object
+
+
+@typeclass
+def to_json(instance) -> str:
+    """Example typeclass."""
+
+
+@to_json.instance(int)
+def _to_json_int(instance: int) -> str:
+    return str(instance)
+
+
+@to_json.instance(str)
+def _to_json_str(instance: str) -> str:
+    return '"{0}"'.format(instance)
+
+
+@to_json.instance(list)
+def _to_json_list(instance: list) -> str:
+    return '[{0}]'.format(', '.join(to_json.map_items(instance)))
+
+
+def _to_json_float(instance: float, prefix: str = '') -> str:
+    return '{0}float'.format(prefix)
+
+
+@typeclass
+def with_delegates(instance) -> str:
+    """Typeclass with delegates."""
+
+
+@with_delegates.instance(list)
+def _with_delegates_list(instance: list) -> str:
+    return '[{0}]'.format(', '.join(with_delegates.map_items(instance)))
+
+
+@with_delegates.instance(int)
+def _with_delegates_int(instance: int) -> str:
+    return str(instance)
+
+
+@with_delegates.instance(delegate=_ListOfStr)
+def _with_delegates_list_str(instance: List[str]) -> str:
+    return 'strings'
+
+
+@typeclass
+def growing(instance, prefix: str = '') -> str:
+    """Gets new instances after plans are built."""
+
+
+@growing.instance(object)
+def _growing_object(instance: object, prefix: str = '') -> str:
+    return 'object'
+
+
+@typeclass
+def overridden(instance) -> str:
+    """Typeclass with overrides and delegates."""
+
+
+@overridden.instance(int)
+def _overridden_int(instance: int) -> str:
+    return str(instance)
+
+
+def _overridden_list_str(instance: List[str]) -> str:
+    return 'strings'
+
+
+def test_map_items() -> None:
+    """Ensures that items are dispatched when their types change."""
+    assert to_json([1, 2, 'a', 3, [4]]) == '[1, 2, "a", 3, [4]]'
+    assert not to_json.map_items([])
+
+
+def test_map_items_delegates() -> None:
+    """Ensures that every item is dispatched with delegates."""
+    assert with_delegates.map_items([['a'], [1], ['b']]) == [
+        'strings', '[1]', 'strings',
+    ]
+
+
+def test_map_fields() -> None:
+    """Ensures that plans follow value types."""
+    assert to_json.map_fields(_User('a', 1)) == {'name': '"a"', 'age': '1'}
+    assert to_json.map_fields(_User(1, 'a')) == {'name': '1', 'age': '"a"'}
+    assert to_json.map_fields(_User(2, 'b')) == {'name': '2', 'age': '"b"'}
+    assert to_json.map_fields(_Point(1, 2)) == {'left': '1', 'right': '2'}
+
+    with pytest.raises(NotImplementedError):
+        to_json.map_fields(_User(1.5, 1))
+
+
+def test_map_fields_invalidation() -> None:
+    """Ensures that plans are rebuilt on registry changes."""
+    assert growing.map_fields(_User(1.5, 1)) == {
+        'name': 'object',
+        'age': 'object',
+    }
+    first_plan = growing._plans[_User]  # noqa: WPS437
+
+    growing.instance(float)(_to_json_float)
+    assert growing.map_fields(_User(1.5, 1), '#') == {
+        'name': '#float',
+        'age': 'object',
+    }
+    assert growing._plans[_User] is not first_plan  # noqa: WPS437
+
+
+def test_map_fields_overrides_and_delegates() -> None:
+    """Ensures that overrides and delegates are not stored in plans."""
+    with overridden.override(int, _to_json_float):
+        assert overridden.map_fields(_Point(1, 2)) == {
+            'left': 'float',
+            'right': 'float',
+        }
+    assert overridden.map_fields(_Point(1, 2)) == {'left': '1', 'right': '2'}
+    assert overridden._plans[_Point].resolved == [  # noqa: WPS437
+        (int, _overridden_int),
+        (int, _overridden_int),
+    ]
+
+    overridden.instance(delegate=_ListOfStr)(_overridden_list_str)
+    assert overridden.map_fields(_Point(['a'], 1)) == {
+        'left': 'strings',
+        'right': '1',
+    }
+    assert overridden._plans[_Point].resolved == [  # noqa: WPS437
+        None,
+        None,
+    ]
+
+
+def test_map_fields_invalid_type() -> None:
+    """Ensures that only dataclasses and named tuples are supported."""
+    with pytest.raises(TypeError, match='tuple is not a dataclass'):
+        to_json.map_fields((1, 2))
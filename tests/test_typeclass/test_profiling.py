@@ -0,0 +1,90 @@
+import cProfile
+import pstats
+import sys
+from typing import Callable, List, Tuple
+
+import pytest
+
+from classes import typeclass
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@typeclass
+def timed(instance) -> str:
+    """Typeclass with a timing hook."""
+
+
+@example.instance(int)
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+@timed.instance(int)
+def _timed_int(instance: int) -> str:
+    return 'int'
+
+
+def test_dispatcher_names() -> None:
+    """Ensures that dispatchers are named after typeclasses."""
+    dispatcher = example._dispatcher  # noqa: WPS437
+    assert dispatcher.__name__ == '<typeclass example>'
+    assert dispatcher.__qualname__ == '<typeclass example>'
+    assert dispatcher.__module__ == __name__
+
+
+@pytest.mark.skipif(sys.version_info[:2] < (3, 8), reason='Code is not renamed')
+def test_profiler_output() -> None:
+    """Ensures that profilers show typeclass names."""
+    profile = cProfile.Profile()
+    profile.runcall(example, 1)
+
+    assert example._dispatcher.__code__.co_name == (  # noqa: WPS437
+        '<typeclass example>'
+    )
+
+    stats = pstats.Stats(profile).stats  # type: ignore
+    assert any(
+        function_name == '<typeclass example>'
+        for _, _, function_name in stats.keys()
+    )
+
+
+def test_timing_hook() -> None:
+    """Ensures that timing hook is called with all timings."""
+    calls: List[Tuple[Callable, Callable, int, int]] = []
+
+    timed.set_timing_hook(
+        lambda *hook_args: calls.append(hook_args),  # type: ignore
+    )
+    assert timed(1) == 'int'
+    with pytest.raises(NotImplementedError):
+        timed('a')  # type: ignore
+    timed.set_timing_hook(None)
+
+    assert [call[:2] for call in calls] == [
+        (timed, _timed_int),
+        (timed, calls[1][1]),
+    ]
+    assert calls[1][1].__name__ == 'default_implementation'
+    assert all(
+        dispatch_ns >= 0 and call_ns >= 0
+        for _, _, dispatch_ns, call_ns in calls
+    )
+
+
+def test_timing_hook_removed() -> None:
+    """Ensures that timing hook can be removed."""
+    calls: List[Tuple[Callable, Callable, int, int]] = []
+
+    timed.set_timing_hook(
+        lambda *hook_args: calls.append(hook_args),  # type: ignore
+    )
+    timed.set_timing_hook(None)
+
+    assert timed(1) == 'int'
+    assert not calls
+    assert timed._dispatcher.__name__ == '<typeclass timed>'  # noqa: WPS437
@@ -0,0 +1,82 @@
+from typing import List, Sized
+
+import pytest
+
+from classes import typeclass
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+def _example_sized(instance: Sized) -> str:
+    return 'sized'
+
+
+def _example_list_str(instance: List[str]) -> str:
+    return 'list of str'
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+example.register_many(
+    {int: _example_int, None: 'builtins:repr'},
+    protocols={Sized: _example_sized},
+    delegates={_ListOfStr: _example_list_str},
+)
+
+
+@typeclass
+def cleared(instance) -> str:
+    """Gets instances after its cache is filled."""
+
+
+@typeclass
+def validated(instance) -> str:
+    """Never gets instances, because they are invalid."""
+
+
+def test_register_many() -> None:
+    """Ensures that all kinds of instances are registered at once."""
+    assert example(1) == 'int'  # type: ignore
+    assert example(None) == 'None'  # type: ignore
+    assert example([]) == 'sized'  # type: ignore
+    assert example(['a']) == 'list of str'  # type: ignore
+
+
+def test_register_many_invalidates() -> None:
+    """Ensures that caches are cleared after registration."""
+    assert cleared.try_call(1) is None
+    version = cleared._version  # noqa: WPS437
+
+    cleared.register_many({int: _example_int})
+    assert not cleared._dispatch_cache  # noqa: WPS437
+    assert cleared._version > version  # noqa: WPS437
+
+
+def test_register_many_validates_batch() -> None:
+    """Ensures that nothing is registered when some type is invalid."""
+    with pytest.raises(TypeError):
+        validated.register_many(
+            {int: _example_int},
+            protocols={List[int]: _example_sized},
+        )
+
+    assert validated.try_call(1) is None
+    assert validated.register_many() is None  # type: ignore
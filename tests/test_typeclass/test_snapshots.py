@@ -0,0 +1,185 @@
+from typing import Generic, Iterator, Sized, TypeVar
+
+import pytest
+
+from classes import catalog, typeclass
+
+_ItemType = TypeVar('_ItemType')
+
+
+class _Box(Generic[_ItemType]):
+    """Example user generic."""
+
+
+@typeclass
+def example(instance) -> str:
+    """Example typeclass."""
+
+
+@example.instance(int)
+def _example_int(instance: int) -> str:
+    return 'int'
+
+
+@typeclass
+def memoized(instance) -> str:
+    """Has memoized instances."""
+
+
+@memoized.instance(int, memoize=True)
+def _memoized_int(instance: int) -> str:
+    return str(instance)
+
+
+#: State of ``example`` that every test starts with.
+_initial = example.snapshot()
+
+
+def _example_bytes(instance: bytes) -> str:
+    return 'bytes'
+
+
+def _example_str(instance: str) -> str:
+    return 'str'
+
+
+def _example_float(instance: float) -> str:
+    return 'float'
+
+
+def _example_box(instance: _Box[int]) -> str:
+    return 'box'
+
+
+@pytest.fixture(autouse=True)
+def _restore_example() -> Iterator[None]:
+    """Tests do not see instances registered by other tests."""
+    example.restore(_initial)
+    yield
+    example.restore(_initial)
+
+
+def test_snapshot_and_restore() -> None:
+    """Ensures that instances registered after a snapshot are removed."""
+    snapshot = example.snapshot()
+    dispatch_table = example.dispatch_table()
+    example.register_many(
+        {str: repr},
+        protocols={Sized: len},
+        delegates={bool: repr},
+    )
+    example.instance(delegate=_Box[int], impl=_example_box)
+    example.instance(float, impl=_example_float, vectorized=sum)
+    assert example.supports(_Box[int]())
+
+    example.restore(snapshot)
+    assert example.dispatch_table() == dispatch_table
+    assert [
+        example.supports(_Box[int]()),
+        example.supports([]),
+        example(True),
+    ] == [False, False, 'int']
+    assert example._registries() == (  # noqa: WPS437
+        {}, {}, {int: _example_int}, {}, {},
+    )
+
+
+def test_restore_caches() -> None:
+    """Ensures that warm caches are restored together with registries."""
+    assert example(1) == 'int'
+    snapshot = example.snapshot()
+    example.instance(str, impl=_example_str)
+    assert example('a') == 'str'
+    assert example.dispatch_table() == {str: _example_str}
+
+    example.restore(snapshot)
+    assert example.dispatch_table()[int] is _example_int
+    assert example.dispatch_table().get(str) is None
+
+
+def test_restore_many_times() -> None:
+    """Ensures that the same snapshot can be restored again."""
+    snapshot = example.snapshot()
+    example.restore(snapshot)  # nothing has changed
+    example.instance(str, impl=_example_str)
+    example.restore(snapshot)
+    assert not example.supports('a')
+
+    example.instance(str, impl=_example_str)
+    example.restore(snapshot)  # snapshots can be restored many times
+    assert not example.supports('a')
+
+
+def test_shared_snapshots() -> None:
+    """Ensures that all snapshots of the same state are kept."""
+    first = example.snapshot()
+    second = example.snapshot()
+    example.instance(str, impl=_example_str)
+    later = example.snapshot()
+
+    example.restore(first)
+    example.instance(float, impl=_example_float)
+    assert not example.supports('a')
+
+    example.restore(later)
+    assert example.supports('a')
+    assert not example.supports(1.5)
+
+    example.restore(second)
+    assert not example.supports('a')
+
+
+def test_restore_shared_registries() -> None:
+    """Ensures that restored registries are copied for all their snapshots."""
+    example.instance(bytes, impl=_example_bytes)
+    first = example.snapshot()
+    second = example.snapshot()  # noqa: F841
+    example.instance(int, impl=_example_int)
+    third = example.snapshot()
+    fourth = example.snapshot()
+
+    example.restore(first)
+    example.restore(third)
+    example.instance(float, impl=_example_float)
+    assert example.supports(1.5)
+
+    example.restore(fourth)
+    assert not example.supports(1.5)
+    assert example.supports(b'a')
+
+
+def test_restore_memoized() -> None:
+    """Ensures that memoized results are cleared on restore."""
+    snapshot = memoized.snapshot()
+    memoized.instance(float, impl=str)
+    assert memoized(1) == '1'
+    assert memoized.memo_stats()[int].size == 1
+
+    memoized.restore(snapshot)
+    assert memoized.memo_stats()[int].size == 0
+
+
+def test_catalog_snapshot() -> None:
+    """Ensures that all typeclasses can be restored at once."""
+    snapshots = catalog.snapshot()
+    assert example in snapshots
+
+    example.instance(str, impl=_example_str)
+    catalog.restore(snapshots)
+    assert not example.supports('a')
+
+
+def test_restore_cleared_caches() -> None:
+    """Ensures that cleared caches are restored as well."""
+    assert example(1) == 'int'
+    snapshot = example.snapshot()
+
+    example.set_adaptive_order(interval=10)
+    assert not example.dispatch_table()
+    example.restore(snapshot)
+    assert example.dispatch_table()[int] is _example_int
+
+    catalog.clear_caches()
+    example.restore(snapshot)
+    assert example.dispatch_table()[int] is _example_int
+    example.set_adaptive_order(None)
@@ -0,0 +1,58 @@
+from typing import List
+
+from classes import typeclass
+
+
+class _ListOfStrMeta(type):
+    def __instancecheck__(cls, other) -> bool:
+        return (
+            isinstance(other, list) and
+            bool(other) and
+            all(isinstance(list_item, str) for list_item in other)
+        )
+
+
+class _ListOfStr(List[str], metaclass=_ListOfStrMeta):
+    """We use this for testing concrete type calls."""
+
+
+@typeclass
+def example(instance, other: int) -> int:
+    """Example typeclass."""
+
+
+@example.instance(int)
+def _example_int(instance: int, other: int) -> int:
+    return instance + other
+
+
+@example.instance(delegate=_ListOfStr)
+def _example_list_str(instance: List[str], other: int) -> int:
+    return len(instance) + other
+
+
+def test_try_call_supported(clear_cache) -> None:
+    """Ensures that supported types are called."""
+    with clear_cache(example):
+        assert example.try_call(1, 2) == 3
+        assert example.try_call(1, other=2, default=0) == 3
+        assert example.try_call(['a'], 2) == 3
+
+
+def test_try_call_default(clear_cache) -> None:
+    """Ensures that unsupported types return the default value."""
+    with clear_cache(example):
+        assert example.try_call('a', 2) is None
+        assert example.try_call('a', 2, default=-1) == -1
+        assert example.try_call([1], 2, default=-1) == -1
+
+
+def test_try_call_caches_misses(clear_cache) -> None:
+    """Ensures that misses are cached and do not break ``supports``."""
+    with clear_cache(example):
+        assert example.try_call([], 2) is None
+        assert list in example._dispatch_cache  # noqa: WPS437
+
+        assert example.supports([]) is False
+        assert example.supports(['a']) is True
+        assert example.try_call(['a'], 2) == 3